@@ -0,0 +1,286 @@
+"""
+Benchmark suite: run_simulation hot path with regression thresholds.
+
+Times `run_simulation` over a grid of
+
+- scenarios: Empty, SingleStepShock, ProgressiveShock, StochasticNoise
+  (scalar State, DefaultOperator) and the 5D stress levels of
+  example_simulation.py (ExampleState5D, SimpleContractiveOperator),
+- horizons (number of steps),
+- recording policies (`record=`),
+
+and reports per case:
+
+- steps/sec      — executed steps / best wall time of several repeats,
+- peak KiB       — peak traced memory of one run (tracemalloc),
+- retained/step  — memory blocks allocated by one run and still held when
+                   it returns (the recorded result), per executed step
+                   (sys.getallocatedblocks; temporaries freed within the
+                   loop are not counted, so this is not an allocation rate).
+
+Results can be stored as a JSON baseline and later compared against it;
+the comparison fails (exit status 1) when any case loses more than
+--max-regression percent of its baseline throughput.
+
+Usage:
+    python benchmarks/bench_engine.py [--horizons 1000 10000] [--repeat 5]
+    python benchmarks/bench_engine.py --save benchmarks/baseline.json
+    python benchmarks/bench_engine.py --compare benchmarks/baseline.json --max-regression 10
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(CURRENT_DIR)
+SRC_DIR = os.path.join(PROJECT_DIR, "src")
+
+for path in (SRC_DIR, PROJECT_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import numpy as np  # noqa: E402
+
+from fre_simulator import (  # noqa: E402
+    initial_state,
+    DefaultOperator,
+    EmptyScenario,
+    SingleStepShockScenario,
+    ProgressiveShockScenario,
+    StochasticNoiseScenario,
+    run_simulation,
+)
+from fre_simulator.engine import RECORD_POLICIES  # noqa: E402
+
+import example_simulation as ex  # noqa: E402
+
+
+# ---------------------------------------------------------
+# Scenario cases: name -> factory(horizon) -> (S0, operator, scenario)
+# A factory is called once per run (5D scenarios keep internal flags).
+# ---------------------------------------------------------
+
+def _scalar_state():
+    return initial_state(delta=0.3, fxi=1.3, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+
+
+def _scalar_case(make_scenario):
+    def factory(horizon):
+        return _scalar_state(), DefaultOperator(alpha=0.7), make_scenario(horizon)
+    return factory
+
+
+def _level_case(deviation, make_scenario):
+    """5D stress level: S0 = reference + Δ⃗₀, operator as in example_simulation."""
+    def factory(horizon):
+        d_m, d_L, d_H, d_R, d_C = deviation
+        state = ex.ExampleState5D(
+            m=1.0 + d_m, L=1.0 + d_L, H=1.0 + d_H, R=1.0 + d_R, C=1.0 + d_C,
+            m_ref=1.0, L_ref=1.0, H_ref=1.0, R_ref=1.0, C_ref=1.0,
+            delta=0.0, fxi=1.0,
+        )
+        state.compute_delta()
+        state.validate()
+        return state, ex.SimpleContractiveOperator(k=0.4), make_scenario()
+    return factory
+
+
+_COMPILED = {
+    "level-6": ex.ChaoticOrbitScenario().compile(),
+    "level-7": ex.ResonanceScenario().compile(),
+}
+
+SCENARIOS = {
+    "empty": _scalar_case(lambda h: EmptyScenario()),
+    "single-step-shock": _scalar_case(
+        lambda h: SingleStepShockScenario(t0=h // 2, qp_shift=0.05)),
+    "progressive-shock": _scalar_case(
+        lambda h: ProgressiveShockScenario(t_start=1, t_end=h // 2, alpha=1e-4)),
+    "stochastic-noise": _scalar_case(
+        lambda h: StochasticNoiseScenario(sigma=1e-3, seed=42)),
+    # 5D stress levels (initial deviations as in example_simulation.main)
+    "5d-level-1": _level_case((0.10, -0.10, 0.05, 0.20, -0.05), ex.StressScenario),
+    "5d-level-2": _level_case((0.03, 0.02, 0.00, 0.00, 0.01), ex.DualShockScenario),
+    "5d-level-4": _level_case((0.04, -0.03, 0.02, 0.00, -0.01), ex.MultiAxisAsymmetricScenario),
+    "5d-level-5": _level_case((0.20, 0.18, -0.15, 0.10, -0.18), ex.ExtremeEdgeScenario),
+    "5d-level-6": _level_case((0.06, -0.04, 0.03, -0.02, 0.05), ex.ChaoticOrbitScenario),
+    "5d-level-7": _level_case((0.03, 0.02, -0.02, 0.01, -0.03), ex.ResonanceScenario),
+    "5d-level-8": _level_case((0.04, -0.02, 0.03, -0.01, 0.02), ex.DomainShiftScenario),
+    "5d-level-9": _level_case((0.05, -0.03, 0.04, -0.02, 0.03), ex.DomainDriftScenario),
+    "5d-level-10": _level_case((0.04, -0.03, 0.02, -0.01, 0.03), ex.StochasticDriftScenario),
+    # compiled shock tables (stateless, compiled once and shared by all runs)
+    "5d-level-6-compiled": _level_case((0.06, -0.04, 0.03, -0.02, 0.05),
+                                       lambda: _COMPILED["level-6"]),
+    "5d-level-7-compiled": _level_case((0.03, 0.02, -0.02, 0.01, -0.03),
+                                       lambda: _COMPILED["level-7"]),
+}
+
+
+def case_key(scenario: str, horizon: int, record: str) -> str:
+    return f"{scenario}/h={horizon}/{record}"
+
+
+def _run(scenario: str, horizon: int, record: str):
+    S0, operator, scen = SCENARIOS[scenario](horizon)
+    return run_simulation(S0, operator, scen, horizon, record=record)
+
+
+def _executed_steps(result, horizon: int) -> int:
+    # a run stops at its first breach
+    return result.breach_step if result.breach_occurred else horizon
+
+
+def bench_case(scenario: str, horizon: int, record: str, repeat: int) -> dict:
+    """Measure one (scenario, horizon, record) case."""
+    # seeded scenarios draw the same path every run; 5D Level 10 uses the
+    # global random module, so reseed it for comparable timings
+    best = float("inf")
+    for _ in range(repeat):
+        ex.random.seed(0)
+        start = time.perf_counter()
+        result = _run(scenario, horizon, record)
+        best = min(best, time.perf_counter() - start)
+    steps = max(_executed_steps(result, horizon), 1)
+    del result
+
+    # retained blocks (net blocks still alive while the result is held)
+    ex.random.seed(0)
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    result = _run(scenario, horizon, record)
+    retained = sys.getallocatedblocks() - blocks_before
+    del result
+
+    ex.random.seed(0)
+    tracemalloc.start()
+    _run(scenario, horizon, record)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "scenario": scenario,
+        "horizon": horizon,
+        "record": record,
+        "steps": steps,
+        "steps_per_sec": steps / best,
+        "peak_kib": peak / 1024,
+        "retained_blocks_per_step": max(retained, 0) / steps,
+    }
+
+
+def run_suite(scenarios, horizons, records, repeat: int, report=print) -> dict:
+    """Run every case of the grid; returns {case key: measurement}."""
+    header = (f"{'case':>36} | {'steps/sec':>12} | {'peak KiB':>10} | "
+              f"{'retained/step':>13}")
+    report(header)
+    report("-" * len(header))
+
+    cases = {}
+    for scenario in scenarios:
+        for horizon in horizons:
+            for record in records:
+                m = bench_case(scenario, horizon, record, repeat)
+                key = case_key(scenario, horizon, record)
+                cases[key] = m
+                report(f"{key:>36} | {m['steps_per_sec']:12,.0f} | "
+                       f"{m['peak_kib']:10.1f} | {m['retained_blocks_per_step']:13.2f}")
+    return cases
+
+
+def _environment(repeat: int) -> dict:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+    }
+
+
+def save_baseline(path: str, cases: dict, repeat: int):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": _environment(repeat), "cases": cases}, f, indent=2)
+        f.write("\n")
+
+
+def compare(baseline: dict, cases: dict, max_regression: float, report=print) -> list:
+    """
+    Compare measured cases against a baseline dict (as written by --save).
+
+    Returns the keys of cases whose steps/sec dropped by more than
+    `max_regression` percent. Cases missing from the baseline are listed
+    as new and never fail.
+    """
+    base_cases = baseline.get("cases", {})
+    regressions = []
+
+    report(f"\nThroughput vs. baseline (fail below -{max_regression:g}%)")
+    header = f"{'case':>36} | {'baseline':>12} | {'current':>12} | {'change':>8}"
+    report(header)
+    report("-" * len(header))
+
+    for key, m in cases.items():
+        base = base_cases.get(key)
+        if base is None:
+            report(f"{key:>36} | {'—':>12} | {m['steps_per_sec']:12,.0f} | {'new':>8}")
+            continue
+        change = 100.0 * (m["steps_per_sec"] / base["steps_per_sec"] - 1.0)
+        flag = ""
+        if change < -max_regression:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        report(f"{key:>36} | {base['steps_per_sec']:12,.0f} | "
+               f"{m['steps_per_sec']:12,.0f} | {change:+7.1f}%{flag}")
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--horizons", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS),
+                        default=list(SCENARIOS), metavar="NAME",
+                        help=f"subset of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--records", nargs="+", choices=RECORD_POLICIES,
+                        default=list(RECORD_POLICIES), metavar="POLICY",
+                        help=f"subset of: {', '.join(RECORD_POLICIES)}")
+    parser.add_argument("--save", metavar="PATH",
+                        help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH",
+                        help="compare against a JSON baseline")
+    parser.add_argument("--max-regression", type=float, default=10.0, metavar="PCT",
+                        help="allowed throughput loss vs. baseline in percent (default 10)")
+    args = parser.parse_args()
+
+    if any(h <= 0 for h in args.horizons):
+        parser.error("horizons must be positive")
+    if args.repeat <= 0:
+        parser.error("--repeat must be positive")
+
+    print(f"run_simulation benchmark (horizons={args.horizons}, repeat={args.repeat})")
+    cases = run_suite(args.scenarios, args.horizons, args.records, args.repeat)
+
+    if args.save:
+        save_baseline(args.save, cases, args.repeat)
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, cases, args.max_regression)
+        if regressions:
+            print(f"\nFAILED: {len(regressions)} case(s) regressed by more than "
+                  f"{args.max_regression:g}%")
+            sys.exit(1)
+        print("\nNo throughput regressions")
+
+
+if __name__ == "__main__":
+    main()
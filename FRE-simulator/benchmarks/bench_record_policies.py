@@ -0,0 +1,78 @@
+"""
+Benchmark: per-step cost of the run_simulation recording policies.
+
+Runs the same long-horizon simulation under every `record=` policy
+("full", "events-only", "scalars-only", "none") and reports:
+
+- time per step (best of several repeats),
+- peak traced memory of one run (tracemalloc).
+
+Usage:
+    python benchmarks/bench_record_policies.py [--horizon 10000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(CURRENT_DIR), "src")
+
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from fre_simulator import (  # noqa: E402
+    initial_state,
+    DefaultOperator,
+    ProgressiveShockScenario,
+    run_simulation,
+)
+from fre_simulator.engine import RECORD_POLICIES  # noqa: E402
+
+
+def _run(policy: str, horizon: int, columnar: bool):
+    S0 = initial_state(delta=0.3, fxi=1.3, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+    # progressive shock over the first half: a scenario event on many steps
+    scenario = ProgressiveShockScenario(t_start=1, t_end=horizon // 2, alpha=1e-4)
+    return run_simulation(S0, DefaultOperator(alpha=0.7), scenario, horizon,
+                          columnar=columnar, record=policy)
+
+
+def bench_policy(policy: str, horizon: int, repeat: int, columnar: bool):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _run(policy, horizon, columnar)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    _run(policy, horizon, columnar)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best / horizon, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--horizon", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--columnar", action="store_true",
+                        help="use columnar result buffers")
+    args = parser.parse_args()
+
+    print(f"run_simulation recording policies (horizon={args.horizon}, "
+          f"columnar={args.columnar})")
+    header = f"{'policy':>14} | {'µs/step':>9} | {'peak KiB':>10}"
+    print(header)
+    print("-" * len(header))
+
+    for policy in RECORD_POLICIES:
+        per_step, peak = bench_policy(policy, args.horizon, args.repeat, args.columnar)
+        print(f"{policy:>14} | {per_step * 1e6:9.2f} | {peak / 1024:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,7 @@ import os
 import math
 import random  # <--- ДОБАВЬ ЭТУ СТРОКУ
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass, field
 from typing import List
 
@@ -31,6 +31,7 @@ if SRC_DIR not in sys.path:
 
 # Now we can safely import the simulator engine
 from fre_simulator.engine import run_simulation, SimulationResult  # type: ignore
+from fre_simulator.scenarios import CompiledScenario  # type: ignore
 
 
 # ---------------------------------------------------------
@@ -220,6 +221,12 @@ class SimpleContractiveOperator:
         """
         return 1.0 + self.k * (fxi - 1.0)
 
+    def linear_coefficient(self) -> float:
+        """
+        Linear contraction factor (used by the engine's closed-form fast path).
+        """
+        return self.k
+
     def kappa(self, prev_fxi: float, new_fxi: float) -> float:
         """
         Contraction ratio kappa:
@@ -234,6 +241,38 @@ class SimpleContractiveOperator:
             return 0.0
         return new_dist / prev_dist
 
+
+# ---------------------------------------------------------
+# Shock tables shared by the stress scenarios
+# ---------------------------------------------------------
+
+# Structural components shifted by a shock (Δm, ΔL, ΔH, ΔR, ΔC)
+COMPONENTS_5D = ("m", "L", "H", "R", "C")
+
+
+def _apply_shock(state: ExampleState5D, shock) -> None:
+    """Add a (Δm, ΔL, ΔH, ΔR, ΔC) shock to X and re-validate the state."""
+    dm, dL, dH, dR, dC = shock
+    state.m += dm
+    state.L += dL
+    state.H += dH
+    state.R += dR
+    state.C += dC
+
+    state.compute_delta()
+    state.validate()
+
+
+def _compile_shocks(shocks) -> CompiledScenario:
+    """
+    Sparse event table of a {t: (Δm, ΔL, ΔH, ΔR, ΔC)} shock schedule
+    (same result as the scenario's apply(), without per-step checks).
+    """
+    return CompiledScenario.from_events(
+        shifts={t: dict(zip(COMPONENTS_5D, shock)) for t, shock in shocks.items()},
+        validate=True,
+    )
+
 # ============================================================
 #  STRESS TEST 1 — Multi-Component Structural Shock (t = 5)
 #
@@ -282,9 +321,17 @@ class StressScenario:
       - просадку капитальных буферов (C).
     """
 
+    # t -> (Δm, ΔL, ΔH, ΔR, ΔC)
+    SHOCKS = {
+        5: (0.00, -0.30, 0.00, +0.30, -0.20),
+    }
+
     def __init__(self) -> None:
         self.stress_applied = False
 
+    def compile(self) -> CompiledScenario:
+        return _compile_shocks(self.SHOCKS)
+
     def apply(self, state: ExampleState5D, t: int) -> ExampleState5D:
         # Однократный стресс на шаге t = 5
         if t == 5 and not self.stress_applied:
@@ -298,14 +345,9 @@ class StressScenario:
             # Это даёт векторный стресс:
             #   ΔL ≈ -0.3, ΔR ≈ +0.3, ΔC ≈ -0.2
             # и поднимает FXI в "critical" зону — дальше FRE должен сам стянуть всё обратно.
-
-            state.L -= 0.3
-            state.R += 0.3
-            state.C -= 0.2
-
-            # Обновляем Δ⃗ и FXI после стресса
-            state.compute_delta()
-            state.validate()
+            #
+            # Δ⃗ и FXI пересчитываются после стресса.
+            _apply_shock(state, self.SHOCKS[5])
 
             self.stress_applied = True
 
@@ -324,34 +366,28 @@ class DualShockScenario:
     dynamics pull the system back to equilibrium after each shock.
     """
 
+    # t -> (Δm, ΔL, ΔH, ΔR, ΔC)
+    SHOCKS = {
+        5: (+0.25, +0.20, +0.05, 0.00, -0.05),    # margin + liquidity driven stress
+        15: (+0.05, +0.10, +0.10, +0.20, -0.15),  # risk-parameters + capital stress
+    }
+
     def __init__(self) -> None:
         self.first_shock_applied = False
         self.second_shock_applied = False
 
+    def compile(self) -> CompiledScenario:
+        return _compile_shocks(self.SHOCKS)
+
     def apply(self, state: ExampleState5D, t: int) -> ExampleState5D:
-        # Shock 1 at t = 5: margin + liquidity driven stress
+        # Shock 1 at t = 5
         if t == 5 and not self.first_shock_applied:
-            # Δm += 0.25, ΔL += 0.20, ΔH += 0.05, ΔC += -0.05
-            state.m += 0.25
-            state.L += 0.20
-            state.H += 0.05
-            state.C -= 0.05
-
-            state.compute_delta()
-            state.validate()
+            _apply_shock(state, self.SHOCKS[5])
             self.first_shock_applied = True
 
-        # Shock 2 at t = 15: risk-parameters + capital stress
+        # Shock 2 at t = 15
         if t == 15 and not self.second_shock_applied:
-            # Δm += 0.05, ΔL += 0.10, ΔH += 0.10, ΔR += 0.20, ΔC += -0.15
-            state.m += 0.05
-            state.L += 0.10
-            state.H += 0.10
-            state.R += 0.20
-            state.C -= 0.15
-
-            state.compute_delta()
-            state.validate()
+            _apply_shock(state, self.SHOCKS[15])
             self.second_shock_applied = True
 
         return state
@@ -370,47 +406,38 @@ class MultiAxisAsymmetricScenario:
       - t = 28 : H, L, R, C shock (liquidity restoration + limits compression)
     """
 
+    # t -> (Δm, ΔL, ΔH, ΔR, ΔC)
+    SHOCKS = {
+        # limits and risk expand, liquidity and capital degrade
+        7: (0.00, +0.25, +0.02, +0.15, -0.03),
+        # strong margin and capital stress, with mixed effects
+        18: (+0.30, -0.05, +0.04, +0.10, -0.20),
+        # liquidity recovers, limits compress, capital stabilizes
+        28: (0.00, +0.18, -0.20, -0.05, +0.10),
+    }
+
     def __init__(self) -> None:
         self.shock_1_applied = False
         self.shock_2_applied = False
         self.shock_3_applied = False
 
+    def compile(self) -> CompiledScenario:
+        return _compile_shocks(self.SHOCKS)
+
     def apply(self, state: ExampleState5D, t: int) -> ExampleState5D:
-        # Shock 1 at t = 7: limits and risk expand, liquidity and capital degrade
+        # Shock 1 at t = 7
         if t == 7 and not self.shock_1_applied:
-            # ΔL += 0.25, ΔR += 0.15, ΔH += 0.02, ΔC += -0.03
-            state.L += 0.25
-            state.R += 0.15
-            state.H += 0.02
-            state.C -= 0.03
-
-            state.compute_delta()
-            state.validate()
+            _apply_shock(state, self.SHOCKS[7])
             self.shock_1_applied = True
 
-        # Shock 2 at t = 18: strong margin and capital stress, with mixed effects
+        # Shock 2 at t = 18
         if t == 18 and not self.shock_2_applied:
-            # Δm += 0.30, ΔC += -0.20, ΔH += 0.04, ΔL += -0.05, ΔR += 0.10
-            state.m += 0.30
-            state.C -= 0.20
-            state.H += 0.04
-            state.L -= 0.05
-            state.R += 0.10
-
-            state.compute_delta()
-            state.validate()
+            _apply_shock(state, self.SHOCKS[18])
             self.shock_2_applied = True
 
-        # Shock 3 at t = 28: liquidity recovers, limits compress, capital stabilizes
+        # Shock 3 at t = 28
         if t == 28 and not self.shock_3_applied:
-            # ΔH += -0.20, ΔL += 0.18, ΔR += -0.05, ΔC += 0.10
-            state.H -= 0.20
-            state.L += 0.18
-            state.R -= 0.05
-            state.C += 0.10
-
-            state.compute_delta()
-            state.validate()
+            _apply_shock(state, self.SHOCKS[28])
             self.shock_3_applied = True
 
         return state
@@ -430,63 +457,42 @@ class ExtremeEdgeScenario:
       - t = 30 : small but sensitive edge-of-domain perturbation
     """
 
+    # t -> (Δm, ΔL, ΔH, ΔR, ΔC)
+    SHOCKS = {
+        5: (+0.15, +0.12, -0.05, +0.10, -0.10),   # near-critical expansion
+        12: (-0.40, -0.35, +0.20, -0.25, +0.30),  # deep compression / over-conservative reaction
+        20: (+0.35, +0.40, -0.30, +0.20, -0.25),  # opposite edge expansion from compressed state
+        30: (+0.05, -0.07, +0.06, -0.04, +0.05),  # small but sensitive edge-of-domain perturbation
+    }
+
     def __init__(self) -> None:
         self.shock_1_applied = False
         self.shock_2_applied = False
         self.shock_3_applied = False
         self.shock_4_applied = False
 
+    def compile(self) -> CompiledScenario:
+        return _compile_shocks(self.SHOCKS)
+
     def apply(self, state: ExampleState5D, t: int) -> ExampleState5D:
-        # Shock 1 at t = 5: near-critical expansion
+        # Shock 1 at t = 5
         if t == 5 and not self.shock_1_applied:
-            # Δm += 0.15, ΔL += 0.12, ΔH += -0.05, ΔR += 0.10, ΔC += -0.10
-            state.m += 0.15
-            state.L += 0.12
-            state.H -= 0.05
-            state.R += 0.10
-            state.C -= 0.10
-
-            state.compute_delta()
-            state.validate()
+            _apply_shock(state, self.SHOCKS[5])
             self.shock_1_applied = True
 
-        # Shock 2 at t = 12: deep compression / over-conservative reaction
+        # Shock 2 at t = 12
         if t == 12 and not self.shock_2_applied:
-            # Δm += -0.40, ΔL += -0.35, ΔH += 0.20, ΔR += -0.25, ΔC += 0.30
-            state.m -= 0.40
-            state.L -= 0.35
-            state.H += 0.20
-            state.R -= 0.25
-            state.C += 0.30
-
-            state.compute_delta()
-            state.validate()
+            _apply_shock(state, self.SHOCKS[12])
             self.shock_2_applied = True
 
-        # Shock 3 at t = 20: opposite edge expansion from compressed state
+        # Shock 3 at t = 20
         if t == 20 and not self.shock_3_applied:
-            # Δm += 0.35, ΔL += 0.40, ΔH += -0.30, ΔR += 0.20, ΔC += -0.25
-            state.m += 0.35
-            state.L += 0.40
-            state.H -= 0.30
-            state.R += 0.20
-            state.C -= 0.25
-
-            state.compute_delta()
-            state.validate()
+            _apply_shock(state, self.SHOCKS[20])
             self.shock_3_applied = True
 
-        # Shock 4 at t = 30: small but sensitive edge-of-domain perturbation
+        # Shock 4 at t = 30
         if t == 30 and not self.shock_4_applied:
-            # Δm += 0.05, ΔL += -0.07, ΔH += 0.06, ΔR += -0.04, ΔC += 0.05
-            state.m += 0.05
-            state.L -= 0.07
-            state.H += 0.06
-            state.R -= 0.04
-            state.C += 0.05
-
-            state.compute_delta()
-            state.validate()
+            _apply_shock(state, self.SHOCKS[30])
             self.shock_4_applied = True
 
         return state
@@ -511,94 +517,40 @@ class ChaoticOrbitScenario:
     back towards equilibrium without divergence or persistent oscillations.
     """
 
-    def __init__(self) -> None:
-        self.applied_times: set[int] = set()
-
-    def _apply_if_needed(
-        self,
-        state: ExampleState5D,
-        t: int,
-        dm: float,
-        dL: float,
-        dH: float,
-        dR: float,
-        dC: float,
-    ) -> None:
-        if t in self.applied_times:
-            return
-        self.applied_times.add(t)
-
-        state.m += dm
-        state.L += dL
-        state.H += dH
-        state.R += dR
-        state.C += dC
-
-        state.compute_delta()
-        state.validate()
-
-    def apply(self, state: ExampleState5D, t: int) -> ExampleState5D:
-        # ------------------------------
+    # t -> (Δm, ΔL, ΔH, ΔR, ΔC)
+    SHOCKS = {
         # Phase A: high-frequency micro-shocks (t = 3,5,7,9,11,13,15)
-        # ------------------------------
-        if t == 3:
-            # small shift, slightly increasing asymmetry
-            self._apply_if_needed(state, t, dm=+0.02, dL=-0.01, dH=+0.01, dR=0.00, dC=-0.01)
-
-        if t == 5:
-            # reverse direction on some axes
-            self._apply_if_needed(state, t, dm=-0.03, dL=+0.02, dH=0.00, dR=+0.01, dC=+0.01)
-
-        if t == 7:
-            # another small perturbation with mixed signs
-            self._apply_if_needed(state, t, dm=+0.01, dL=+0.01, dH=-0.02, dR=-0.01, dC=+0.01)
-
-        if t == 9:
-            self._apply_if_needed(state, t, dm=-0.02, dL=-0.01, dH=+0.01, dR=+0.02, dC=-0.01)
-
-        if t == 11:
-            self._apply_if_needed(state, t, dm=+0.02, dL=-0.02, dH=+0.01, dR=-0.01, dC=+0.02)
-
-        if t == 13:
-            self._apply_if_needed(state, t, dm=-0.01, dL=+0.01, dH=-0.01, dR=+0.01, dC=-0.02)
-
-        if t == 15:
-            self._apply_if_needed(state, t, dm=+0.01, dL=+0.02, dH=0.00, dR=-0.02, dC=+0.01)
-
-        # ------------------------------
+        3: (+0.02, -0.01, +0.01, 0.00, -0.01),    # small shift, slightly increasing asymmetry
+        5: (-0.03, +0.02, 0.00, +0.01, +0.01),    # reverse direction on some axes
+        7: (+0.01, +0.01, -0.02, -0.01, +0.01),   # another small perturbation with mixed signs
+        9: (-0.02, -0.01, +0.01, +0.02, -0.01),
+        11: (+0.02, -0.02, +0.01, -0.01, +0.02),
+        13: (-0.01, +0.01, -0.01, +0.01, -0.02),
+        15: (+0.01, +0.02, 0.00, -0.02, +0.01),
         # Phase B: quasi-resonance double shock (t = 18, 19)
-        # ------------------------------
-        if t == 18:
-            # strong push in one direction
-            self._apply_if_needed(state, t, dm=+0.08, dL=+0.06, dH=-0.05, dR=+0.04, dC=-0.06)
-
-        if t == 19:
-            # almost mirrored correction in the opposite direction
-            self._apply_if_needed(state, t, dm=-0.06, dL=-0.05, dH=+0.04, dR=-0.03, dC=+0.05)
-
-        # ------------------------------
+        18: (+0.08, +0.06, -0.05, +0.04, -0.06),  # strong push in one direction
+        19: (-0.06, -0.05, +0.04, -0.03, +0.05),  # almost mirrored correction in the opposite direction
         # Phase C: low-frequency swaying (t = 25, 28, 31, 34)
-        # ------------------------------
-        if t == 25:
-            self._apply_if_needed(state, t, dm=+0.05, dL=-0.03, dH=+0.02, dR=-0.02, dC=+0.03)
-
-        if t == 28:
-            self._apply_if_needed(state, t, dm=-0.04, dL=+0.04, dH=-0.03, dR=+0.03, dC=-0.02)
-
-        if t == 31:
-            self._apply_if_needed(state, t, dm=+0.03, dL=-0.02, dH=+0.02, dR=-0.02, dC=+0.02)
+        25: (+0.05, -0.03, +0.02, -0.02, +0.03),
+        28: (-0.04, +0.04, -0.03, +0.03, -0.02),
+        31: (+0.03, -0.02, +0.02, -0.02, +0.02),
+        34: (-0.02, +0.03, -0.02, +0.02, -0.02),
+        # Phase D: final chaotic kicks (t = 40, 45)
+        40: (+0.07, +0.02, -0.04, +0.03, -0.05),
+        45: (-0.05, -0.03, +0.03, -0.02, +0.04),
+    }
 
-        if t == 34:
-            self._apply_if_needed(state, t, dm=-0.02, dL=+0.03, dH=-0.02, dR=+0.02, dC=-0.02)
+    def __init__(self) -> None:
+        self.applied_times: set[int] = set()
 
-        # ------------------------------
-        # Phase D: final chaotic kicks (t = 40, 45)
-        # ------------------------------
-        if t == 40:
-            self._apply_if_needed(state, t, dm=+0.07, dL=+0.02, dH=-0.04, dR=+0.03, dC=-0.05)
+    def compile(self) -> CompiledScenario:
+        return _compile_shocks(self.SHOCKS)
 
-        if t == 45:
-            self._apply_if_needed(state, t, dm=-0.05, dL=-0.03, dH=+0.03, dR=-0.02, dC=+0.04)
+    def apply(self, state: ExampleState5D, t: int) -> ExampleState5D:
+        shock = self.SHOCKS.get(t)
+        if shock is not None and t not in self.applied_times:
+            self.applied_times.add(t)
+            _apply_shock(state, shock)
 
         return state
 
@@ -620,10 +572,27 @@ class ResonanceScenario:
     persistent oscillations or diverging orbits.
     """
 
+    # last step with a shock (high-frequency band)
+    LAST_EVENT = 117
+
     def __init__(self) -> None:
         pass
 
+    def compile(self) -> CompiledScenario:
+        shocks = {t: self._shock(t) for t in range(1, self.LAST_EVENT + 1)}
+        return _compile_shocks({t: d for t, d in shocks.items() if d is not None})
+
     def apply(self, state: ExampleState5D, t: int) -> ExampleState5D:
+        shock = self._shock(t)
+        if shock is not None:
+            _apply_shock(state, shock)
+
+        return state
+
+    def _shock(self, t: int):
+        """
+        Combined (Δm, ΔL, ΔH, ΔR, ΔC) of all bands at step t, or None.
+        """
         dm = 0.0
         dL = 0.0
         dH = 0.0
@@ -711,19 +680,11 @@ class ResonanceScenario:
             dC += hf_dC
 
         # ------------------------------
-        # Apply combined shock if any
+        # Combined shock if any
         # ------------------------------
         if dm != 0.0 or dL != 0.0 or dH != 0.0 or dR != 0.0 or dC != 0.0:
-            state.m += dm
-            state.L += dL
-            state.H += dH
-            state.R += dR
-            state.C += dC
-
-            state.compute_delta()
-            state.validate()
-
-        return state
+            return dm, dL, dH, dR, dC
+        return None
 
 # -----------------------------------------------------
 # Level 8 - Domain Shift Stress Scenario (5D)
@@ -762,6 +723,13 @@ class DomainShiftScenario:
         # Чтобы не применять одно и то же смещение дважды
         self.applied_shifts: set[int] = set()
 
+    def compile(self) -> CompiledScenario:
+        refs = ("m_ref", "L_ref", "H_ref", "R_ref", "C_ref")
+        return CompiledScenario.from_events(
+            sets={t: dict(zip(refs, self.reference_patterns[t])) for t in self.shift_times},
+            validate=True,
+        )
+
     def _apply_reference_shift(
         self,
         state: ExampleState5D,
@@ -924,7 +892,12 @@ class StochasticDriftScenario:
           • не допустить breach по внутренним ограничениям.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        # Источник случайности: по умолчанию глобальный модуль random;
+        # для воспроизводимых параллельных прогонов передаётся свой поток
+        # (например, random.Random, засеянный из numpy SeedSequence).
+        self._rng = rng if rng is not None else random
+
         # Гладкий дрейф reference-домена (как Level 9, но чуть мягче)
         self.drift_amplitude = {
             "m": 0.02,
@@ -995,11 +968,11 @@ class StochasticDriftScenario:
         base_m, base_L, base_H, base_R, base_C = self._smooth_reference(t)
 
         # Gaussian шум поверх гладкой орбиты
-        state.m_ref = base_m + random.gauss(0.0, self.ref_noise_sigma["m"])
-        state.L_ref = base_L + random.gauss(0.0, self.ref_noise_sigma["L"])
-        state.H_ref = base_H + random.gauss(0.0, self.ref_noise_sigma["H"])
-        state.R_ref = base_R + random.gauss(0.0, self.ref_noise_sigma["R"])
-        state.C_ref = base_C + random.gauss(0.0, self.ref_noise_sigma["C"])
+        state.m_ref = base_m + self._rng.gauss(0.0, self.ref_noise_sigma["m"])
+        state.L_ref = base_L + self._rng.gauss(0.0, self.ref_noise_sigma["L"])
+        state.H_ref = base_H + self._rng.gauss(0.0, self.ref_noise_sigma["H"])
+        state.R_ref = base_R + self._rng.gauss(0.0, self.ref_noise_sigma["R"])
+        state.C_ref = base_C + self._rng.gauss(0.0, self.ref_noise_sigma["C"])
 
         state.compute_delta()
         state.validate()
@@ -1008,11 +981,11 @@ class StochasticDriftScenario:
         """
         Мелкий шок по X (структура), Gaussian по каждой оси.
         """
-        state.m += random.gauss(0.0, self.micro_shock_sigma["m"])
-        state.L += random.gauss(0.0, self.micro_shock_sigma["L"])
-        state.H += random.gauss(0.0, self.micro_shock_sigma["H"])
-        state.R += random.gauss(0.0, self.micro_shock_sigma["R"])
-        state.C += random.gauss(0.0, self.micro_shock_sigma["C"])
+        state.m += self._rng.gauss(0.0, self.micro_shock_sigma["m"])
+        state.L += self._rng.gauss(0.0, self.micro_shock_sigma["L"])
+        state.H += self._rng.gauss(0.0, self.micro_shock_sigma["H"])
+        state.R += self._rng.gauss(0.0, self.micro_shock_sigma["R"])
+        state.C += self._rng.gauss(0.0, self.micro_shock_sigma["C"])
 
         state.compute_delta()
         state.validate()
@@ -1021,11 +994,11 @@ class StochasticDriftScenario:
         """
         Редкий, более сильный stochastic-шок по X.
         """
-        state.m += random.gauss(0.0, self.macro_shock_sigma["m"])
-        state.L += random.gauss(0.0, self.macro_shock_sigma["L"])
-        state.H += random.gauss(0.0, self.macro_shock_sigma["H"])
-        state.R += random.gauss(0.0, self.macro_shock_sigma["R"])
-        state.C += random.gauss(0.0, self.macro_shock_sigma["C"])
+        state.m += self._rng.gauss(0.0, self.macro_shock_sigma["m"])
+        state.L += self._rng.gauss(0.0, self.macro_shock_sigma["L"])
+        state.H += self._rng.gauss(0.0, self.macro_shock_sigma["H"])
+        state.R += self._rng.gauss(0.0, self.macro_shock_sigma["R"])
+        state.C += self._rng.gauss(0.0, self.macro_shock_sigma["C"])
 
         state.compute_delta()
         state.validate()
@@ -1070,7 +1043,7 @@ class StochasticDriftScenario:
         self._apply_reference_update(state, t)
 
         # 2) Micro-shock по X с вероятностью p
-        if random.random() < self.micro_shock_prob:
+        if self._rng.random() < self.micro_shock_prob:
             self._apply_micro_shock(state)
 
         # 3) Редкие macro-shocks в заранее заданные моменты
@@ -1,27 +1,133 @@
 # __init__.py
 # Public API for FRE Simulator V2.0
 
-from .state import State, initial_state
-from .operators import BaseOperator, DefaultOperator
+__version__ = "2.0.0"
+
+from .state import State, CompactState, StateBlock, StateRow, AdmissibilityError, initial_state
+from .zones import ZoneClassifier
+from .operators import (
+    BaseOperator,
+    DefaultOperator,
+    SaturatingOperator,
+    PiecewiseLinearOperator,
+    DegradingOperator,
+    MemoryOperator,
+    MatrixOperator
+)
 from .scenarios import (
     BaseScenario,
     EmptyScenario,
     SingleStepShockScenario,
     ProgressiveShockScenario,
-    StochasticNoiseScenario
+    StochasticNoiseScenario,
+    VectorShockScenario,
+    CompiledScenario
+)
+from .engine import (
+    run_simulation,
+    iter_simulation,
+    StepRecord,
+    SimulationResult,
+    ColumnarSimulationResult
+)
+from .batch import run_simulation_batch, BatchSimulationResult
+from .store import TrajectoryStore, open_trajectories
+from .montecarlo import run_monte_carlo, MonteCarloResult
+from .session import FRESession
+from .early_warning import EarlyWarningMonitor, WarningEvent
+from .sweep import run_sweep, SweepResult
+from .calibration import calibrate_alpha, CalibrationResult
+from .scenario_loader import (
+    ScenarioProgram,
+    load_scenario,
+    load_program,
+    register_scenario,
+    compile_definition
+)
+from .serialization import to_json, from_json
+from .export import RecordTable, write_records, read_records
+from .cache import ResultCache, request_key, run_simulation_cached
+from .service import FREService, ServiceError
+from .vector import (
+    VectorState,
+    VectorBlock,
+    VectorBatchResult,
+    weighted_norm,
+    run_vector_batch
+)
+from .diagnostics import FRERecords
+from .sensitivity import (
+    SensitivityResult,
+    sensitivity_vector,
+    unit_direction,
+    operator_jacobian,
+    finite_difference_jacobian
 )
-from .engine import run_simulation, SimulationResult
 
 __all__ = [
     "State",
+    "CompactState",
+    "StateBlock",
+    "StateRow",
+    "AdmissibilityError",
     "initial_state",
+    "ZoneClassifier",
     "BaseOperator",
     "DefaultOperator",
+    "SaturatingOperator",
+    "PiecewiseLinearOperator",
+    "DegradingOperator",
+    "MemoryOperator",
+    "MatrixOperator",
     "BaseScenario",
     "EmptyScenario",
     "SingleStepShockScenario",
     "ProgressiveShockScenario",
     "StochasticNoiseScenario",
+    "VectorShockScenario",
+    "CompiledScenario",
     "run_simulation",
+    "iter_simulation",
+    "StepRecord",
     "SimulationResult",
+    "ColumnarSimulationResult",
+    "run_simulation_batch",
+    "BatchSimulationResult",
+    "TrajectoryStore",
+    "open_trajectories",
+    "run_monte_carlo",
+    "MonteCarloResult",
+    "FRESession",
+    "EarlyWarningMonitor",
+    "WarningEvent",
+    "run_sweep",
+    "SweepResult",
+    "calibrate_alpha",
+    "CalibrationResult",
+    "ScenarioProgram",
+    "load_scenario",
+    "load_program",
+    "register_scenario",
+    "compile_definition",
+    "to_json",
+    "from_json",
+    "RecordTable",
+    "write_records",
+    "read_records",
+    "ResultCache",
+    "request_key",
+    "run_simulation_cached",
+    "FREService",
+    "ServiceError",
+    "VectorState",
+    "VectorBlock",
+    "VectorBatchResult",
+    "weighted_norm",
+    "run_vector_batch",
+    "FRERecords",
+    "SensitivityResult",
+    "sensitivity_vector",
+    "unit_direction",
+    "operator_jacobian",
+    "finite_difference_jacobian",
 ]
@@ -0,0 +1,273 @@
+"""
+Batch Engine Module — FRE Simulator V2.0
+========================================
+
+This module implements the FRE evolution loop for **many initial states at
+once**. Each row of a `StateBlock` is an independent structural state S0
+(e.g. one account), and every step of the loop is a small number of NumPy
+array operations over all rows instead of one Python loop per state.
+
+The per-row semantics are exactly those of `engine.run_simulation`:
+
+    1. Apply scenario Sₜ                 (scenario.apply_batch)
+    2. Recompute Δ(t) = qp/qf − 1        (delta-computation breach on qf = 0)
+    3. FXI(t+1) = E(FXI(t))               (operator.apply_batch)
+    4. Capacity check on FXI             (fxi-capacity breach, step not stored)
+    5. Update state, Δ = FXI − 1, validate
+    6. Classify stability zone, compute κ
+    7. Capacity check on Δ               (delta-capacity breach, step stored)
+
+Rows stop evolving at their first breach; the remaining rows continue.
+All arithmetic matches the scalar engine operation for operation, so for
+`DefaultOperator` the batch series are bit-for-bit identical to running
+`run_simulation` once per row.
+"""
+
+# batch.py
+# Vectorized evolution loop for FRE Simulator V2.0
+# Evolves N structural states per call using NumPy column operations.
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .state import StateBlock
+from .operators import BaseOperator
+from .scenarios import BaseScenario
+from .zones import ZoneClassifier, ZONE_NAMES
+from .engine import SimulationResult, _capacity_limits, _reset_operator
+from .store import TrajectoryStore
+
+
+# Breach type lookup table (index = compact integer breach code)
+BREACH_TYPES = (
+    None,
+    "fxi-capacity-breach",
+    "delta-capacity-breach",
+    "delta-computation-error: float division by zero",
+)
+
+_BREACH_NONE = 0
+_BREACH_FXI = 1
+_BREACH_DELTA = 2
+_BREACH_DELTA_COMPUTATION = 3
+
+
+@dataclass
+class BatchSimulationResult:
+    """
+    Structured output of a batch FRE simulation run.
+
+    Series arrays have shape (N, T) with one row per initial state and
+    T = number of recorded time points of the longest row. Entries past a
+    row's own length are NaN (zone code −1).
+
+        fxi, delta   — FXI(t), Δ(t)
+        kappa        — κ(t), NaN at t=0 (κ not defined)
+        zone_codes   — int8 index into zone_names
+        lengths      — number of recorded points per row
+        breach_step  — step of first breach per row, −1 if none
+        breach_code  — int8 index into BREACH_TYPES, 0 if none
+    """
+    fxi: np.ndarray
+    delta: np.ndarray
+    kappa: np.ndarray
+    zone_codes: np.ndarray
+    lengths: np.ndarray
+    breach_step: np.ndarray
+    breach_code: np.ndarray
+    zone_names: Tuple[str, ...] = ZONE_NAMES
+
+    breach_types = BREACH_TYPES
+
+    def __len__(self):
+        return self.fxi.shape[0]
+
+    @property
+    def breach_occurred(self) -> np.ndarray:
+        """Boolean mask of rows with a breach."""
+        return self.breach_code != _BREACH_NONE
+
+    def breach_mask(self, breach_type: str) -> np.ndarray:
+        """Boolean mask of rows whose breach type equals `breach_type`."""
+        return self.breach_code == BREACH_TYPES.index(breach_type)
+
+    def zone_counts(self, chunk_steps: int = 256) -> np.ndarray:
+        """
+        Rows in each zone per step, shape (T, len(zone_names)); rows past
+        their length are not counted. Reads the time-major buffers (or
+        memory maps) block by block.
+        """
+        codes = self.zone_codes.T
+        counts = np.zeros((codes.shape[0], len(self.zone_names)), dtype=np.int64)
+        for start in range(0, codes.shape[0], chunk_steps):
+            block = codes[start:start + chunk_steps]
+            for z in range(len(self.zone_names)):
+                counts[start:start + chunk_steps, z] = np.count_nonzero(block == z, axis=1)
+        return counts
+
+    def row(self, i: int) -> SimulationResult:
+        """
+        Scalar-engine view of row i.
+
+        Scalar series, zones and breach fields match `run_simulation` for the
+        same initial state. State snapshots and scenario events are not
+        recorded by the batch engine, so those lists are empty.
+        """
+        n = int(self.lengths[i])
+        kappa = self.kappa[i, :n].tolist()
+        kappa[0] = None
+        code = int(self.breach_code[i])
+        return SimulationResult(
+            fxi_series=self.fxi[i, :n].tolist(),
+            delta_series=self.delta[i, :n].tolist(),
+            state_series=[],
+            kappa_series=kappa,
+            stability_zones=[self.zone_names[z] for z in self.zone_codes[i, :n]],
+            scenario_events=[],
+            breach_occurred=code != _BREACH_NONE,
+            breach_step=int(self.breach_step[i]) if code != _BREACH_NONE else None,
+            breach_state=None,
+            breach_type=BREACH_TYPES[code],
+        )
+
+
+def run_simulation_batch(
+    initial_states: StateBlock,
+    operator: BaseOperator,
+    scenario: BaseScenario,
+    horizon: int,
+    config: Optional[dict] = None,
+    storage=None,
+    chunk_steps: int = 64
+) -> BatchSimulationResult:
+    """
+    Execute FRE structural evolution for every row of a StateBlock.
+
+    Parameters:
+        initial_states — StateBlock with one initial state S0 per row
+        operator       — corrective operator E (must support apply_batch)
+        scenario       — stress scenario (must support apply_batch)
+        horizon        — number of steps
+        config         — optional dict, same keys as run_simulation
+        storage        — optional file path: write the series into a
+                         memory-mapped TrajectoryStore instead of RAM
+        chunk_steps    — with storage, steps prepared and flushed at a time
+
+    Returns:
+        BatchSimulationResult with per-row trajectories and breach data;
+        with storage, its series are views of the file's memory maps
+        (reopen later with store.open_trajectories).
+    """
+    if horizon <= 0:
+        raise ValueError("horizon must be positive")
+
+    cfg = config or {}
+    classifier = ZoneClassifier.from_config(cfg)
+    delta_max, fxi_min, fxi_max = _capacity_limits(cfg, initial_states)
+    _reset_operator(operator)
+
+    # Working copy (avoid mutating caller's block)
+    states = StateBlock(
+        delta=initial_states.delta,
+        fxi=initial_states.fxi,
+        qp=initial_states.qp,
+        qf=initial_states.qf,
+        q=initial_states.q,
+        w=initial_states.w,
+        u=initial_states.u,
+    )
+    states.validate()
+
+    # Time-major buffers: step t is one contiguous row of N values
+    n = len(states)
+    store = None
+    if storage is None:
+        fxi_out = np.full((horizon + 1, n), np.nan)
+        delta_out = np.full((horizon + 1, n), np.nan)
+        kappa_out = np.full((horizon + 1, n), np.nan)
+        zone_out = np.full((horizon + 1, n), -1, dtype=np.int8)
+    else:
+        store = TrajectoryStore.create(storage, n, horizon + 1, chunk_steps)
+        fxi_out, delta_out, kappa_out, zone_out = store.fxi, store.delta, store.kappa, store.zone_codes
+        next_chunk = store.prepare(0)
+    lengths = np.ones(n, dtype=np.int64)
+    breach_step = np.full(n, -1, dtype=np.int64)
+    breach_code = np.zeros(n, dtype=np.int8)
+
+    # Record initial point (t=0)
+    fxi_out[0] = states.fxi
+    delta_out[0] = states.delta
+    zone_out[0] = classifier.classify_array(states.fxi)
+
+    active = np.ones(n, dtype=bool)
+
+    for t in range(1, horizon + 1):
+        if not active.any():
+            break
+        if store is not None and t == next_chunk:
+            next_chunk = store.prepare(t)
+
+        # 1) Apply scenario at step t
+        states = scenario.apply_batch(states, t)
+
+        # 2) Recompute Δ(t) = qp/qf − 1
+        zero_qf = active & (states.qf == 0.0)
+        if zero_qf.any():
+            breach_step[zero_qf] = t
+            breach_code[zero_qf] = _BREACH_DELTA_COMPUTATION
+            active &= ~zero_qf
+        with np.errstate(divide="ignore", invalid="ignore"):
+            states.delta = np.where(active, (states.qp / states.qf) - 1.0, states.delta)
+
+        # 3) Compute FXI(t+1) via operator E
+        prev_fxi = states.fxi
+        next_fxi = operator.apply_batch(prev_fxi)
+
+        # Enforce capacity limits on FXI explicitly
+        fxi_breach = active & ((next_fxi < fxi_min) | (next_fxi > fxi_max))
+        if fxi_breach.any():
+            breach_step[fxi_breach] = t
+            breach_code[fxi_breach] = _BREACH_FXI
+            active &= ~fxi_breach
+
+        # 4) Update state from operator result (active rows only)
+        states.fxi = np.where(active, next_fxi, prev_fxi)
+        states.delta = np.where(active, states.fxi - 1.0, states.delta)
+        states.validate(active)
+
+        # 5) Classify stability zone, 6) compute κ
+        zones = classifier.classify_array(states.fxi)
+        kappa = operator.kappa_batch(prev_fxi, states.fxi)
+
+        # 7) Check Δ capacity (breach step is still stored)
+        delta_breach = active & (np.abs(states.delta) > delta_max)
+        if delta_breach.any():
+            breach_step[delta_breach] = t
+            breach_code[delta_breach] = _BREACH_DELTA
+
+        # 8) Store trajectories
+        np.copyto(fxi_out[t], states.fxi, where=active)
+        np.copyto(delta_out[t], states.delta, where=active)
+        np.copyto(kappa_out[t], kappa, where=active)
+        np.copyto(zone_out[t], zones, where=active)
+        lengths += active
+
+        active &= ~delta_breach
+
+    # (N, T) views over the time-major buffers
+    width = int(lengths.max())
+    if store is not None:
+        store.finalize(width, lengths, breach_step, breach_code, classifier.zone_names)
+        return store.result()
+    return BatchSimulationResult(
+        fxi=fxi_out[:width].T,
+        delta=delta_out[:width].T,
+        kappa=kappa_out[:width].T,
+        zone_codes=zone_out[:width].T,
+        lengths=lengths,
+        breach_step=breach_step,
+        breach_code=breach_code,
+        zone_names=classifier.zone_names,
+    )
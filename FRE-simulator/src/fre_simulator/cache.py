@@ -0,0 +1,319 @@
+"""
+Cache Module — FRE Simulator V2.0
+=================================
+
+This module memoizes simulation results. The engine is deterministic, so
+a result is fully determined by its request: initial state, operator,
+scenario, horizon, engine config, options and the library version.
+
+Keys:
+    request_key() reduces the request to canonical JSON and hashes it
+    (SHA-256):
+
+        floats   — −0.0 → 0.0, integral ints and floats compare equal,
+                   NaN/±inf as strings
+        arrays   — dtype, shape and a hash of the raw bytes
+        objects  — operators, scenarios and states by class name and
+                   public attributes (e.g. DefaultOperator.alpha,
+                   CompiledScenario tables); dict keys sorted
+
+    A request is **uncacheable** (request_key returns None) if it holds a
+    value without a canonical form (e.g. a callable), or a stochastic
+    object without a seed: an object holding a random stream
+    (random.Random, numpy Generator, …) is cacheable only when its `seed`
+    attribute is set and the stream is not the global `random` module.
+    The key then contains a hash of the stream's current state, so a
+    scenario that was already run (or given an explicit rng) keys
+    differently from a freshly seeded one.
+
+Storage:
+    ResultCache keeps entries in memory in LRU order, bounded by entry
+    count and total byte size (pickled size of each result), with an
+    optional TTL. With `directory`, entries are also written to disk as
+    pickle files and survive process restarts; a memory miss falls back
+    to the disk tier. Expiry times are wall-clock, so they hold across
+    restarts.
+
+Cached results are shared: callers must not mutate them.
+"""
+
+# cache.py
+# Result memoization for FRE Simulator V2.0
+# Canonical request keys, LRU + TTL memory tier, optional disk tier.
+
+import dataclasses
+import hashlib
+import json
+import math
+import os
+import pickle
+import random
+import tempfile
+import time
+import types
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from .state import State
+from .operators import BaseOperator
+from .scenarios import BaseScenario
+from .engine import run_simulation, SimulationResult
+
+
+# Random streams that make an object stochastic
+_STREAM_TYPES = (random.Random, np.random.Generator, np.random.RandomState, types.ModuleType)
+
+# Values without a canonical form
+_CALLABLE_TYPES = (types.FunctionType, types.BuiltinFunctionType, types.MethodType, type)
+
+_MISSING = object()
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-clean canonical form of a request value."""
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value) if abs(value) < 2 ** 53 else value
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            return repr(value)
+        return value + 0.0          # −0.0 → 0.0
+    if isinstance(value, np.ndarray):
+        data = np.ascontiguousarray(value)
+        return {"__array__": [data.dtype.str, list(data.shape),
+                              hashlib.sha256(data.tobytes()).hexdigest()]}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, _STREAM_TYPES + _CALLABLE_TYPES):
+        raise _Uncacheable(type(value).__name__)
+    if dataclasses.is_dataclass(value) or hasattr(value, "__dict__"):
+        attrs = (vars(value) if hasattr(value, "__dict__")
+                 else {f.name: getattr(value, f.name) for f in dataclasses.fields(value)})
+        streams = {k: v for k, v in attrs.items() if isinstance(v, _STREAM_TYPES)}
+        if streams and getattr(value, "seed", None) is None:
+            raise _Uncacheable(f"unseeded {type(value).__name__}")
+        kind = type(value)
+        out = {"__type__": f"{kind.__module__}.{kind.__qualname__}",
+               **{k: _canonical(v) for k, v in attrs.items() if not k.startswith("_")}}
+        out.update((k, _stream_state(v)) for k, v in streams.items())
+        return out
+    raise _Uncacheable(type(value).__name__)
+
+
+def _stream_state(stream: Any) -> Dict[str, str]:
+    """
+    Canonical form of a random stream: a hash of its current state, so a
+    stream that has already been drawn from (or an explicit rng given
+    alongside a seed) does not share the key of a freshly seeded one.
+    The global `random` module is shared and never cacheable.
+    """
+    if isinstance(stream, random.Random):
+        state = stream.getstate()
+    elif isinstance(stream, np.random.Generator):
+        state = stream.bit_generator.state
+    elif isinstance(stream, np.random.RandomState):
+        state = stream.get_state(legacy=False)
+    else:
+        raise _Uncacheable(type(stream).__name__)
+    return {"__stream__": hashlib.sha256(repr(state).encode("utf-8")).hexdigest()}
+
+
+def request_key(request: Dict[str, Any]) -> Optional[str]:
+    """
+    Cache key (hex SHA-256) of a request mapping, or None if the request
+    is uncacheable. The library version is part of every key.
+    """
+    from . import __version__
+    try:
+        canonical = _canonical({"request": request, "version": __version__})
+    except _Uncacheable:
+        return None
+    text = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Bounded result cache with LRU and TTL eviction.
+
+    Parameters:
+        max_entries — maximum number of entries in memory
+        max_bytes   — maximum total pickled size of the entries in memory;
+                      a single larger result is not kept in memory
+        ttl         — seconds an entry stays valid (None: no expiry)
+        directory   — optional disk tier (created if missing)
+        clock       — wall-clock time source (seconds)
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 << 20,
+                 ttl: Optional[float] = None, directory: Optional[str] = None,
+                 clock: Callable[[], float] = time.time):
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError("max_entries and max_bytes must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.directory = directory
+        self.clock = clock
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        # key → (expires_at, size, value)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.bytes = 0
+        self.counters = dict.fromkeys(
+            ("hits", "misses", "disk_hits", "evictions", "expirations"), 0)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "bytes": self.bytes, **self.counters}
+
+    # memory tier
+
+    def _drop(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+    def _store(self, key: str, expires: Optional[float], size: int, value: Any):
+        if key in self._entries:
+            self._drop(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (expires, size, value)
+        self.bytes += size
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self.counters["evictions"] += 1
+
+    # disk tier
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".pkl")
+
+    def _read_disk(self, key: str):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                expires, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return _MISSING, None
+        if expires is not None and expires <= self.clock():
+            self.counters["expirations"] += 1
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return _MISSING, None
+        return value, expires
+
+    def _write_disk(self, key: str, payload: bytes):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+
+    # public API
+
+    def get(self, key: str, default: Any = None, count: bool = True) -> Any:
+        """Cached value of `key`, or `default` if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, _, value = entry
+            if expires is None or expires > self.clock():
+                self._entries.move_to_end(key)
+                if count:
+                    self.counters["hits"] += 1
+                return value
+            self._drop(key)
+            self.counters["expirations"] += 1
+
+        if self.directory is not None:
+            value, expires = self._read_disk(key)
+            if value is not _MISSING:
+                self._store(key, expires, len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)), value)
+                if count:
+                    self.counters["hits"] += 1
+                    self.counters["disk_hits"] += 1
+                return value
+
+        if count:
+            self.counters["misses"] += 1
+        return default
+
+    def put(self, key: str, value: Any) -> None:
+        """Store `value` under `key` (memory, and disk if configured)."""
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        self._store(key, expires, len(payload), value)
+        if self.directory is not None:
+            self._write_disk(key, pickle.dumps((expires, value), pickle.HIGHEST_PROTOCOL))
+
+    def get_or_compute(self, key: Optional[str], compute: Callable[[], Any]) -> Any:
+        """Cached value of `key`, computing and storing it on a miss (None: no caching)."""
+        if key is None:
+            return compute()
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop the memory tier (and the disk tier if `disk`)."""
+        self._entries.clear()
+        self.bytes = 0
+        if disk and self.directory is not None:
+            for root, _, files in os.walk(self.directory):
+                for name in files:
+                    if name.endswith(".pkl"):
+                        os.remove(os.path.join(root, name))
+
+
+def run_simulation_cached(
+    initial_state: State,
+    operator: BaseOperator,
+    scenario: BaseScenario,
+    horizon: int,
+    config: Optional[dict] = None,
+    *,
+    cache: ResultCache,
+    **options
+) -> SimulationResult:
+    """
+    run_simulation through a ResultCache.
+
+    `options` are passed to run_simulation (columnar, record, closed_form)
+    and are part of the key. Uncacheable requests (e.g. an unseeded
+    stochastic scenario) always run. The returned result may be shared
+    with other callers.
+    """
+    key = request_key({
+        "initial_state": initial_state,
+        "operator": operator,
+        "scenario": scenario,
+        "horizon": horizon,
+        "config": config or {},
+        "options": options,
+    })
+    return cache.get_or_compute(
+        key, lambda: run_simulation(initial_state, operator, scenario, horizon, config, **options))
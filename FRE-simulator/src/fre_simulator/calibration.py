@@ -0,0 +1,322 @@
+"""
+Calibration Module — FRE Simulator V2.0
+=======================================
+
+This module fits the contraction α of the linear corrective operator
+
+    FXI(t+1) = 1 + α ⋅ (FXI(t) − 1)
+
+to target metrics over a set of single-step shock scenarios
+(shock size, shock time), e.g. a target time-to-stable or a maximum FXI
+excursion, optionally subject to being breach-free on every scenario and
+on an additional suite of scalar stress cases (e.g. the 5D Levels 1–10).
+
+Search:
+    1. Batched bracketing — every iteration evaluates `candidates` values
+       of α on all scenarios as one batch (candidates × scenarios rows,
+       see sweep.evaluate_points) and narrows the bracket around the best
+       feasible candidate.
+    2. Analytic refinement — for the linear operator max_deviation and
+       time_to_stable have a closed form; a continuous relaxation of the
+       loss is minimized inside the final bracket using its analytic
+       derivative in α. It runs only when every target is one of
+       RELAXED_METRICS: mean_kappa averages κ = 0 over the steps without
+       a deviation (before a shock from FXI(0) = 1, after the deviation
+       underflows) and depends on where rows stop, which no smooth
+       function of α represents, so such targets are fitted by
+       bracketing alone.
+    3. The refined α is verified by simulation and kept only if it is
+       feasible and not worse than the best candidate (rows cut short by
+       a breach are not modeled; the verification rejects them).
+
+Loss (mean over scenarios):
+
+    L(α) = Σₘ wₘ ⋅ (metricₘ(α) − targetₘ)²
+
+Time-to-stable of a row that never stabilizes counts as the number of
+steps from its shock to the horizon.
+"""
+
+# calibration.py
+# Operator-parameter calibration for FRE Simulator V2.0
+# Batched candidate evaluation, closed-form gradient refinement for linear operators.
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .state import State
+from .operators import BaseOperator, DefaultOperator
+from .scenarios import BaseScenario
+from .zones import ZoneClassifier
+from .engine import run_simulation
+from .sweep import evaluate_points
+
+
+# Metrics that can be targeted (names as in sweep.SWEEP_METRICS)
+CALIBRATION_METRICS = ("time_to_stable", "max_deviation", "mean_kappa")
+
+# Metrics represented by the closed form (analytic refinement)
+RELAXED_METRICS = ("time_to_stable", "max_deviation")
+
+# A suite case returns (initial_state, scenario, horizon) for one run
+SuiteCase = Callable[[], Tuple[State, BaseScenario, int]]
+
+
+@dataclass
+class CalibrationResult:
+    """
+    Outcome of an α calibration.
+
+        alpha            — calibrated contraction
+        loss             — simulated loss at alpha
+        metrics          — simulated per-scenario metrics at alpha
+        breach_free      — no breach on the scenarios (and suite) at alpha
+        gradient_refined — alpha comes from the analytic refinement
+        evaluations      — simulated rows (candidate × scenario runs)
+        history          — (alpha, loss) of the best candidate per iteration
+    """
+    alpha: float
+    loss: float
+    metrics: Dict[str, np.ndarray]
+    breach_free: bool
+    gradient_refined: bool
+    evaluations: int
+    history: List[Tuple[float, float]] = field(default_factory=list)
+
+
+def _loss(metrics: Mapping[str, np.ndarray], targets: Mapping[str, float],
+          weights: Mapping[str, float], tts_cap: np.ndarray) -> np.ndarray:
+    """Loss per candidate; metric arrays are (candidates, scenarios)."""
+    total = 0.0
+    for name, target in targets.items():
+        values = metrics[name]
+        if name == "time_to_stable":
+            values = np.where(np.isnan(values), tts_cap, values)
+        total = total + weights.get(name, 1.0) * np.mean((values - target) ** 2, axis=-1)
+    return total
+
+
+def linear_metrics(alpha, fxi0: float, shock_size, shock_time, eps1: float,
+                   tts_cap=None):
+    """
+    Closed-form RELAXED_METRICS of the linear operator and their α-derivatives.
+
+    With d₀ = FXI(0) − 1 and a shock s applied at step t₀ (before the
+    operator), the deviation after the shock step is
+
+        D(α) = α^t₀ ⋅ d₀ + α ⋅ s
+
+    and decays geometrically afterwards, so
+
+        max_deviation  = max(|d₀|, |D|)
+        time_to_stable ≈ max(0, log(eps1/|D|) / log α)   (continuous relaxation)
+
+    time_to_stable is capped at `tts_cap` (horizon − t₀, the value the
+    loss gives a row that never stabilizes) when it is given.
+
+    `alpha` broadcasts against the scenario arrays. Returns
+    (metrics, derivatives), two dicts of arrays.
+    """
+    alpha = np.asarray(alpha, dtype=np.float64)
+    s = np.asarray(shock_size, dtype=np.float64)
+    t0 = np.asarray(shock_time, dtype=np.float64)
+    d0 = fxi0 - 1.0
+
+    D = alpha ** t0 * d0 + alpha * s
+    dD = t0 * alpha ** (t0 - 1.0) * d0 + s
+    absD = np.abs(D)
+    dabsD = np.sign(D) * dD
+
+    shock_wins = absD > abs(d0)
+    max_dev = np.where(shock_wins, absD, abs(d0))
+    dmax_dev = np.where(shock_wins, dabsD, 0.0)
+
+    log_a = np.log(alpha)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gap = np.log(eps1) - np.log(absD)           # < 0 while not yet stable
+        tts = gap / log_a
+        dtts = (-(dabsD / absD) * log_a - gap / alpha) / log_a ** 2
+    unsettled = absD > eps1
+    tts = np.where(unsettled, tts, 0.0)
+    dtts = np.where(unsettled, dtts, 0.0)
+    if tts_cap is not None:
+        capped = tts >= tts_cap
+        tts = np.where(capped, tts_cap, tts)
+        dtts = np.where(capped, 0.0, dtts)
+
+    metrics = {"time_to_stable": tts, "max_deviation": max_dev}
+    derivatives = {"time_to_stable": dtts, "max_deviation": dmax_dev}
+    return metrics, derivatives
+
+
+def _relaxed_minimum(lo: float, hi: float, fxi0, shocks, targets, weights, eps1,
+                     iterations: int = 60) -> float:
+    """
+    Minimize the relaxed loss on [lo, hi] by bisection on its analytic
+    derivative dL/dα.
+    """
+    def grad(alpha):
+        m, dm = linear_metrics(alpha, fxi0, shocks["shock_size"], shocks["shock_time"], eps1,
+                               shocks.get("tts_cap"))
+        return sum(weights.get(name, 1.0) * np.mean(2.0 * (m[name] - target) * dm[name])
+                   for name, target in targets.items())
+
+    g_lo, g_hi = grad(lo), grad(hi)
+    if g_lo >= 0.0:
+        return lo
+    if g_hi <= 0.0:
+        return hi
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        if grad(mid) > 0.0:
+            hi = mid
+        else:
+            lo = mid
+    return 0.5 * (lo + hi)
+
+
+def _suite_breach_free(alpha: float, suite: Sequence[SuiteCase],
+                       operator_factory: Callable[[float], BaseOperator],
+                       config: Optional[dict]) -> bool:
+    for case in suite:
+        state, scenario, horizon = case()
+        try:
+            result = run_simulation(state, operator_factory(alpha), scenario, horizon,
+                                    config, record="none")
+        except ValueError:
+            return False
+        if result.breach_occurred:
+            return False
+    return True
+
+
+def calibrate_alpha(
+    initial_state: State,
+    shocks: Mapping[str, Sequence[float]],
+    horizon: int,
+    targets: Mapping[str, float],
+    weights: Optional[Mapping[str, float]] = None,
+    config: Optional[dict] = None,
+    bounds: Tuple[float, float] = (0.01, 0.99),
+    candidates: int = 32,
+    iterations: int = 4,
+    breach_free: bool = True,
+    suite: Sequence[SuiteCase] = (),
+    suite_operator: Callable[[float], BaseOperator] = DefaultOperator,
+    gradient: bool = True,
+    shock: str = "fxi",
+    chunk_size: int = 65536,
+    workers: Optional[int] = None
+) -> CalibrationResult:
+    """
+    Fit the DefaultOperator contraction α to target metrics.
+
+    Parameters:
+        initial_state  — starting structural state S0 (shared by all scenarios)
+        shocks         — {"shock_size": [...], "shock_time": [...]}, paired
+                         arrays with one entry per scenario
+        horizon        — number of steps per scenario
+        targets        — metric → target value (CALIBRATION_METRICS)
+        weights        — metric → loss weight (default 1)
+        config         — optional engine config (see run_simulation)
+        bounds         — search interval for α, inside (0, 1)
+        candidates     — α values evaluated per iteration (one batch)
+        iterations     — bracketing iterations
+        breach_free    — reject α with a breach on any scenario
+        suite          — extra cases that must stay breach-free; each is a
+                         callable returning (initial_state, scenario, horizon)
+                         run with suite_operator(α), e.g. the 5D levels of
+                         example_simulation.py with SimpleContractiveOperator
+        suite_operator — α → operator for the suite runs
+        gradient       — refine with the analytic derivative of the
+                         closed-form metrics (FXI shocks and
+                         RELAXED_METRICS targets only)
+        shock          — shocked component (see run_sweep)
+        chunk_size, workers — batch evaluation (see run_sweep)
+
+    Returns:
+        CalibrationResult.
+
+    Raises:
+        ValueError — no feasible α in bounds
+    """
+    unknown = set(targets) - set(CALIBRATION_METRICS)
+    if unknown:
+        raise ValueError(f"unknown calibration metrics {sorted(unknown)}; "
+                         f"expected {CALIBRATION_METRICS}")
+    lo, hi = bounds
+    if not 0.0 < lo < hi < 1.0:
+        raise ValueError(f"bounds must satisfy 0 < lo < hi < 1, got {bounds}")
+    if candidates < 2:
+        raise ValueError("candidates must be at least 2")
+
+    weights = dict(weights or {})
+    size = np.asarray(shocks["shock_size"], dtype=np.float64)
+    time = np.asarray(shocks["shock_time"], dtype=np.int64)
+    size, time = np.broadcast_arrays(size, time)
+    n_scen = size.shape[0]
+    tts_cap = (horizon - time).astype(np.float64)
+
+    def simulate(alphas: np.ndarray):
+        """Metrics (candidates, scenarios), loss and feasibility per candidate."""
+        alphas = np.asarray(alphas, dtype=np.float64)
+        flat = evaluate_points(
+            initial_state,
+            {"alpha": np.repeat(alphas, n_scen),
+             "shock_size": np.tile(size, len(alphas)),
+             "shock_time": np.tile(time, len(alphas))},
+            horizon, config, shock, chunk_size, workers,
+        )
+        metrics = {k: v.reshape(len(alphas), n_scen) for k, v in flat.items()}
+        loss = _loss(metrics, targets, weights, tts_cap)
+        feasible = np.ones(len(alphas), dtype=bool)
+        if breach_free:
+            feasible = ~(metrics["breach_step"] >= 0).any(axis=1)
+            if suite:
+                feasible &= np.array([f and _suite_breach_free(a, suite, suite_operator, config)
+                                      for a, f in zip(alphas.tolist(), feasible)])
+        return metrics, loss, feasible
+
+    history: List[Tuple[float, float]] = []
+    evaluations = 0
+    best = None
+    for _ in range(iterations):
+        grid = np.linspace(lo, hi, candidates)
+        metrics, loss, feasible = simulate(grid)
+        evaluations += grid.size * n_scen
+        if not feasible.any():
+            if best is None:
+                raise ValueError(f"no breach-free α in [{lo}, {hi}]")
+            break
+        i = int(np.argmin(np.where(feasible, loss, np.inf)))
+        if best is None or loss[i] <= best[1]:
+            best = (float(grid[i]), float(loss[i]),
+                    {k: v[i] for k, v in metrics.items()})
+        history.append((float(grid[i]), float(loss[i])))
+        step = grid[1] - grid[0]
+        lo, hi = max(grid[i] - step, bounds[0]), min(grid[i] + step, bounds[1])
+
+    alpha, loss, metrics = best
+    refined = False
+    if gradient and shock == "fxi" and set(targets) <= set(RELAXED_METRICS):
+        eps1 = ZoneClassifier.from_config(config or {}).bounds[0]
+        candidate = _relaxed_minimum(lo, hi, initial_state.fxi,
+                                     {"shock_size": size, "shock_time": time, "tts_cap": tts_cap},
+                                     targets, weights, eps1)
+        m, l, f = simulate([candidate])
+        evaluations += n_scen
+        if f[0] and l[0] <= loss:
+            alpha, loss, metrics = candidate, float(l[0]), {k: v[0] for k, v in m.items()}
+            refined = True
+
+    return CalibrationResult(
+        alpha=float(alpha),
+        loss=loss,
+        metrics=metrics,
+        breach_free=not (metrics["breach_step"] >= 0).any(),
+        gradient_refined=refined,
+        evaluations=evaluations,
+        history=history,
+    )
@@ -0,0 +1,283 @@
+"""
+Diagnostics Module — FRE Simulator V2.0
+=======================================
+
+This module produces the **full FRERecord schema** of Specification
+Section 57.1 for vector batch runs:
+
+    t, X, X_prime, X_next, Delta, Delta_next, r, r_next, FXI_global,
+    FXI_local, correction, k_eff, zone, energy, angle, sensitivity,
+    funnel, repeller
+
+Record t of a row describes the state at step t and the step out of it:
+
+    X, Delta      — X(t), Δ⃗(t) = X(t) − X*
+    r, FXI_global — ‖Δ⃗(t)‖_W, FXI(t)
+    k_eff, zone   — κ(t) and zone of FXI(t), as in the batch series
+                    (k_eff is NaN at t=0)
+    X_prime       — X after the scenario of step t+1, before the operator
+    X_next        — X(t+1) = X* + E(Δ⃗′); Delta_next, r_next likewise
+    correction    — E(Δ⃗′) − Δ⃗′, the operator correction X_next − X_prime
+
+The derived diagnostics:
+
+    FXI_local   — per axis, FXI_i = 1 + s ⋅ √W_ii ⋅ |Δ_i|        (23.1)
+    energy      — 𝓔 = ½ ‖Δ⃗(t)‖_W²                              (26.1)
+    sensitivity — S = W Δ⃗(t) / ‖Δ⃗(t)‖_W                          (19.6)
+    angle       — θ between Δ⃗′ and the correction in the W inner
+                  product; θ = π is pure inward contraction, θ < π/2
+                  points outward (NaN for a zero Δ⃗′ or correction) (19.5)
+    funnel      — divergence funnel: the step out of t expands
+                  (‖Δ⃗(t+1)‖_W > ‖Δ⃗′‖_W) and θ < theta_crit          (42.1)
+    repeller    — the step out of t expands while FXI(t) is in the
+                  repeller zone ("critical" by default)              (35.3)
+
+The engine records only Δ⃗(t) and Δ⃗′ (run_vector_batch with
+`record_vectors=True`); every field is computed on first access by one
+vectorized pass over the stored (B, T, d) history and cached, so the hot
+loop stays lean and callers pay only for the fields they read. A single
+record(i, t) evaluates the same formulas on that step alone and leaves
+the batch-wide caches untouched. Entries
+past a row's length (and the *_next / *_prime fields of its last record)
+are NaN, flags there are False.
+"""
+
+# diagnostics.py
+# Full FRERecord schema for FRE Simulator V2.0
+# Lazily computed, vectorized post-pass over recorded Δ⃗ trajectories.
+
+import math
+from functools import cached_property
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+
+from .sensitivity import sensitivity_vector, _norms
+
+
+# Section 57.1 field order
+FRERECORD_FIELDS = (
+    "t", "X", "X_prime", "X_next", "Delta", "Delta_next", "r", "r_next",
+    "FXI_global", "FXI_local", "correction", "k_eff", "zone", "energy",
+    "angle", "sensitivity", "funnel", "repeller",
+)
+
+# Default critical angle of the divergence funnel (outward-pointing steps)
+THETA_CRIT = math.pi / 2
+
+
+def _shift(values: np.ndarray) -> np.ndarray:
+    """values[:, t+1] at index t, NaN in the last column."""
+    out = np.full_like(values, np.nan)
+    out[:, :-1] = values[:, 1:]
+    return out
+
+
+def _fxi_local(delta: np.ndarray, weights, fxi_scale: float) -> np.ndarray:
+    scale = np.ones(delta.shape[-1]) if weights is None else np.diag(weights)
+    return 1.0 + fxi_scale * np.sqrt(scale) * np.abs(delta)
+
+
+def _angle(prime: np.ndarray, correction: np.ndarray, weights) -> np.ndarray:
+    """W-inner-product angle between Δ⃗′ and the correction (NaN if either is 0)."""
+    w_prime, norm_prime = _norms(prime, weights)
+    _, norm_corr = _norms(correction, weights)
+    denom = norm_prime * norm_corr
+    cos = np.full(denom.shape, np.nan)
+    np.divide(np.einsum("...i,...i->...", w_prime, correction), denom,
+              out=cos, where=denom > 0)
+    return np.arccos(np.clip(cos, -1.0, 1.0))
+
+
+def _expanding(r_next: np.ndarray, prime: np.ndarray, weights) -> np.ndarray:
+    _, norm_prime = _norms(prime, weights)
+    return r_next > norm_prime
+
+
+class FRERecords:
+    """
+    FRETimeSeries of every row of a VectorBatchResult, as (B, T, …) arrays.
+
+    Build with VectorBatchResult.records(). Each FRERecord field is an
+    attribute computed on first access:
+
+        vector fields — (B, T, d): X, X_prime, X_next, Delta, Delta_next,
+                        FXI_local, correction, sensitivity
+        scalar fields — (B, T): t, r, r_next, FXI_global, k_eff, energy,
+                        angle; funnel, repeller (bool); zone_codes (int8)
+
+    record(i, t) and series(i) return plain-dict FRERecords; they compute
+    each record on its own and do not fill the (B, T, …) caches.
+    """
+
+    def __init__(self, result, theta_crit: float = THETA_CRIT,
+                 repeller_zone: str = "critical"):
+        if result.delta_vec is None or result.shocked_vec is None:
+            raise ValueError("FRERecords need a run with record_vectors=True")
+        self.result = result
+        self.theta_crit = float(theta_crit)
+        self.repeller_zone = repeller_zone
+        self.weights = result.weights
+        self.fxi_scale = result.fxi_scale
+        self.zone_names = result.zone_names
+        self.lengths = result.lengths
+
+    def __len__(self):
+        return len(self.result)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name not in FRERECORD_FIELDS:
+            raise KeyError(name)
+        return self.zone_codes if name == "zone" else getattr(self, name)
+
+    # recorded series
+
+    @property
+    def Delta(self) -> np.ndarray:
+        return self.result.delta_vec
+
+    @property
+    def r(self) -> np.ndarray:
+        return self.result.delta
+
+    @property
+    def FXI_global(self) -> np.ndarray:
+        return self.result.fxi
+
+    @property
+    def k_eff(self) -> np.ndarray:
+        return self.result.kappa
+
+    @property
+    def zone_codes(self) -> np.ndarray:
+        return self.result.zone_codes
+
+    @cached_property
+    def t(self) -> np.ndarray:
+        b, n = self.r.shape
+        return np.broadcast_to(np.arange(n), (b, n))
+
+    # transition out of step t
+
+    @cached_property
+    def Delta_prime(self) -> np.ndarray:
+        """Δ⃗′ of the step out of t (post-scenario, pre-operator), (B, T, d)."""
+        return _shift(self.result.shocked_vec)
+
+    @cached_property
+    def Delta_next(self) -> np.ndarray:
+        return _shift(self.Delta)
+
+    @cached_property
+    def r_next(self) -> np.ndarray:
+        return _shift(self.r)
+
+    @cached_property
+    def X(self) -> np.ndarray:
+        return self.result.x_ref[:, None, :] + self.Delta
+
+    @cached_property
+    def X_prime(self) -> np.ndarray:
+        return self.result.x_ref[:, None, :] + self.Delta_prime
+
+    @cached_property
+    def X_next(self) -> np.ndarray:
+        return self.result.x_ref[:, None, :] + self.Delta_next
+
+    @cached_property
+    def correction(self) -> np.ndarray:
+        return self.Delta_next - self.Delta_prime
+
+    # derived diagnostics
+
+    @cached_property
+    def FXI_local(self) -> np.ndarray:
+        return _fxi_local(self.Delta, self.weights, self.fxi_scale)
+
+    @cached_property
+    def energy(self) -> np.ndarray:
+        return 0.5 * self.r ** 2
+
+    @cached_property
+    def sensitivity(self) -> np.ndarray:
+        return sensitivity_vector(self.Delta, self.weights)
+
+    @cached_property
+    def angle(self) -> np.ndarray:
+        return _angle(self.Delta_prime, self.correction, self.weights)
+
+    @cached_property
+    def expanding(self) -> np.ndarray:
+        """The step out of t expands ‖Δ⃗‖_W (k_eff of that step > 1), (B, T) bool."""
+        return _expanding(self.r_next, self.Delta_prime, self.weights)
+
+    @cached_property
+    def funnel(self) -> np.ndarray:
+        return self.expanding & (self.angle < self.theta_crit)
+
+    @cached_property
+    def repeller(self) -> np.ndarray:
+        if self.repeller_zone not in self.zone_names:
+            return np.zeros(self.r.shape, dtype=bool)
+        code = self.zone_names.index(self.repeller_zone)
+        return self.expanding & (self.zone_codes == code)
+
+    def _step(self, i: int, t: int) -> Dict[str, Any]:
+        """Every field of record (i, t) from the recorded series alone."""
+        delta = self.Delta[i, t]
+        if t + 1 < self.r.shape[1]:
+            prime = self.result.shocked_vec[i, t + 1]
+            nxt = self.Delta[i, t + 1]
+            r_next = self.r[i, t + 1]
+        else:
+            prime = nxt = np.full_like(delta, np.nan)
+            r_next = np.float64(np.nan)
+        x_ref = self.result.x_ref[i]
+        correction = nxt - prime
+        angle = _angle(prime, correction, self.weights)
+        expanding = _expanding(r_next, prime, self.weights)
+        code = self.zone_codes[i, t]
+        return {
+            "X": x_ref + delta, "X_prime": x_ref + prime, "X_next": x_ref + nxt,
+            "Delta": delta, "Delta_next": nxt, "r": self.r[i, t], "r_next": r_next,
+            "FXI_global": self.FXI_global[i, t],
+            "FXI_local": _fxi_local(delta, self.weights, self.fxi_scale),
+            "correction": correction, "k_eff": self.k_eff[i, t],
+            "energy": 0.5 * self.r[i, t] ** 2, "angle": angle,
+            "sensitivity": sensitivity_vector(delta, self.weights),
+            "funnel": expanding & (angle < self.theta_crit),
+            "repeller": expanding & (self.zone_names[code] == self.repeller_zone),
+        }
+
+    # plain records
+
+    def record(self, i: int, t: int) -> Dict[str, Any]:
+        """FRERecord of row i at step t as a dict (vectors as lists)."""
+        if not 0 <= t < self.lengths[i]:
+            raise IndexError(f"step {t} outside row {i} of length {int(self.lengths[i])}")
+        values = self._step(i, t)
+        out = {}
+        for name in FRERECORD_FIELDS:
+            if name == "zone":
+                out[name] = self.zone_names[self.zone_codes[i, t]]
+            elif name == "t":
+                out[name] = t
+            else:
+                out[name] = np.asarray(values[name]).tolist()
+        if t == 0:
+            out["k_eff"] = None
+        return out
+
+    def iter_series(self, i: int) -> Iterator[Dict[str, Any]]:
+        """FRERecords of row i in chronological order."""
+        for t in range(int(self.lengths[i])):
+            yield self.record(i, t)
+
+    def series(self, i: int) -> List[Dict[str, Any]]:
+        """FRETimeSeries of row i (Section 57.2)."""
+        return list(self.iter_series(i))
+
+    def computed(self) -> List[str]:
+        """Fields computed so far."""
+        return [name for name in vars(self) if name in FRERECORD_FIELDS]
+
@@ -0,0 +1,366 @@
+"""
+Early-Warning Module — FRE Simulator V2.0
+=========================================
+
+This module implements **streaming early-warning indicators**
+(Specification Section 38) over the κ, |FXI − 1| and |Δ| series of a
+running simulation.
+
+Each stream keeps O(1)-per-step statistics in a fixed-size window:
+
+    ewma       — exponentially weighted mean, weight a = 2 / (span + 1)
+    variance   — rolling variance over the last `window` values
+    lag1       — rolling lag-1 autocorrelation
+    slope      — least-squares trend per step over the window
+    to_boundary — steps until the trend line reaches the stream's
+                  boundary (0 if already reached, inf if not approaching)
+
+Boundaries: κ → 1 (loss of contraction), |FXI − 1| → the lower bound of
+the last deviation zone ("critical", eps2), |Δ| → the Δ capacity limit.
+
+Warnings (WarningEvent) are raised when an indicator becomes active or
+changes level, and a "clear" event when it deactivates:
+
+    contraction-weakening  EWI-1: EWMA of κ above k1 ("mild"), k2
+                           ("strong") or 1 ("critical")
+    boundary-approach      a stream's time-to-boundary ≤ lead steps
+                           ("warning"; one indicator per stream)
+    zone-escalation        EWI-8: two moves to a higher deviation zone
+                           within `zone_window` steps ("warning")
+    multi-signal           38.10: two or more indicators active ("critical")
+
+Events are returned by the update call of the step that triggers them.
+Detection latency is bounded by the smoothing: `span` steps for the EWMA
+and `window` steps for the trend. Memory is constant: windows are
+fixed ring buffers and only the last `max_events` events are kept.
+
+EarlyWarningMonitor.observe() takes a StepRecord, so a monitor plugs into
+iter_simulation loops (or watch(stream)) and FRESession(monitor=...).
+"""
+
+# early_warning.py
+# Streaming early-warning indicators for FRE Simulator V2.0
+# Rolling EWMA / variance / autocorrelation / trend, warning events.
+
+from collections import deque
+import math
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from .state import State
+from .zones import ZoneClassifier
+from .engine import StepRecord, _capacity_limits
+
+
+# Streams observed by the monitor
+STREAMS = ("kappa", "deviation", "delta")
+
+# Warning levels, in increasing severity ("clear" ends a warning)
+LEVELS = ("clear", "warning", "mild", "strong", "critical")
+
+_NO_EVENTS: Tuple = ()
+
+
+class WarningEvent(NamedTuple):
+    """
+    Early-warning event.
+
+        t         — step at which the indicator changed
+        indicator — e.g. "contraction-weakening", "boundary-approach:kappa"
+        level     — one of LEVELS
+        value     — indicator value (EWMA κ, steps to boundary, …)
+        threshold — threshold that was crossed (None for "clear")
+    """
+    t: int
+    indicator: str
+    level: str
+    value: float
+    threshold: Optional[float]
+
+
+class RollingStats:
+    """
+    O(1)-per-step statistics of one stream over a fixed window.
+
+    Window sums (Σx, Σx², Σx_{k−1}x_k, Σk⋅x with k = 0…n−1) are updated
+    incrementally and recomputed from the ring buffer once per `window`
+    updates, so rounding errors do not accumulate.
+    """
+
+    __slots__ = ("window", "alpha", "_buf", "_head", "n", "count",
+                 "ewma", "_s", "_s2", "_lag", "_sk", "_since_sync")
+
+    def __init__(self, window: int = 50, span: int = 10):
+        if window < 3:
+            raise ValueError("window must be at least 3")
+        if span < 1:
+            raise ValueError("span must be positive")
+        self.window = window
+        self.alpha = 2.0 / (span + 1.0)
+        self._buf = [0.0] * window
+        self.reset()
+
+    def reset(self):
+        self._head = 0              # index of the oldest value
+        self.n = 0                  # values in the window
+        self.count = 0              # values seen
+        self.ewma: Optional[float] = None
+        self._s = self._s2 = self._lag = self._sk = 0.0
+        self._since_sync = 0
+
+    def _value(self, k: int) -> float:
+        """k-th value of the window, oldest first."""
+        return self._buf[(self._head + k) % self.window]
+
+    def _sync(self):
+        values = [self._value(k) for k in range(self.n)]
+        self._s = math.fsum(values)
+        self._s2 = math.fsum(v * v for v in values)
+        self._lag = math.fsum(a * b for a, b in zip(values, values[1:]))
+        self._sk = math.fsum(k * v for k, v in enumerate(values))
+        self._since_sync = 0
+
+    def update(self, x: float):
+        x = float(x)
+        self.count += 1
+        self.ewma = x if self.ewma is None else self.ewma + self.alpha * (x - self.ewma)
+
+        if self.n == self.window:
+            # drop the oldest value; remaining indices shift down by one
+            oldest = self._buf[self._head]
+            self._lag -= oldest * self._value(1)
+            self._s -= oldest
+            self._s2 -= oldest * oldest
+            self._sk -= self._s
+            self._head = (self._head + 1) % self.window
+            self.n -= 1
+        if self.n:
+            self._lag += self._value(self.n - 1) * x
+        self._buf[(self._head + self.n) % self.window] = x
+        self._sk += self.n * x
+        self._s += x
+        self._s2 += x * x
+        self.n += 1
+
+        self._since_sync += 1
+        if self._since_sync >= self.window:
+            self._sync()
+
+    @property
+    def last(self) -> Optional[float]:
+        return self._value(self.n - 1) if self.n else None
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._s / self.n if self.n else None
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Rolling (population) variance."""
+        if self.n < 2:
+            return None
+        mean = self._s / self.n
+        return max(self._s2 / self.n - mean * mean, 0.0)
+
+    @property
+    def lag1(self) -> Optional[float]:
+        """Rolling lag-1 autocorrelation (None while undefined)."""
+        m = self.n - 1
+        if m < 2:
+            return None
+        first, last = self._value(0), self._value(self.n - 1)
+        sa, sb = self._s - last, self._s - first
+        saa, sbb = self._s2 - last * last, self._s2 - first * first
+        cov = self._lag / m - (sa / m) * (sb / m)
+        var = (saa / m - (sa / m) ** 2) * (sbb / m - (sb / m) ** 2)
+        return cov / math.sqrt(var) if var > 0.0 else None
+
+    @property
+    def slope(self) -> Optional[float]:
+        """Least-squares trend per step over the window."""
+        n = self.n
+        if n < 2:
+            return None
+        sum_k = n * (n - 1) / 2.0
+        sum_kk = (n - 1) * n * (2 * n - 1) / 6.0
+        return (n * self._sk - sum_k * self._s) / (n * sum_kk - sum_k * sum_k)
+
+    def to_boundary(self, boundary: float) -> Optional[float]:
+        """Steps until the trend line reaches `boundary` from below."""
+        slope = self.slope
+        if slope is None:
+            return None
+        level = self._s / self.n + slope * (self.n - 1) / 2.0   # trend at the last step
+        if level >= boundary:
+            return 0.0
+        return (boundary - level) / slope if slope > 0.0 else math.inf
+
+    def snapshot(self, boundary: Optional[float] = None) -> Dict[str, Any]:
+        out = {"last": self.last, "ewma": self.ewma, "variance": self.variance,
+               "lag1": self.lag1, "slope": self.slope}
+        if boundary is not None:
+            out["to_boundary"] = self.to_boundary(boundary)
+        return out
+
+
+class EarlyWarningMonitor:
+    """
+    Streaming early-warning monitor (see module docstring).
+
+    Attributes:
+        stats      — RollingStats per stream ("kappa", "deviation", "delta")
+        boundaries — boundary per stream
+        active     — indicator → current level of the active warnings
+        events     — deque of the last `max_events` WarningEvents
+        t          — last observed step
+    """
+
+    def __init__(
+        self,
+        config: Optional[dict] = None,
+        window: int = 50,
+        span: int = 10,
+        k1: float = 0.9,
+        k2: float = 0.97,
+        lead: float = 20.0,
+        zone_window: int = 10,
+        min_periods: Optional[int] = None,
+        max_events: int = 256,
+        callback: Optional[Callable[[WarningEvent], Any]] = None,
+    ):
+        """
+        Parameters:
+            config      — engine config; zone bounds and capacity limits
+                          define the boundaries
+            window      — rolling window (variance, autocorrelation, trend)
+            span        — EWMA span
+            k1, k2      — mild / strong contraction-weakening thresholds
+            lead        — boundary-approach warning horizon (steps)
+            zone_window — steps within which two escalations warn
+            min_periods — observations per stream before its indicators
+                          can fire (default: span)
+            max_events  — events kept in `events`
+            callback    — called with each new WarningEvent
+        """
+        if not 0.0 < k1 < k2 < 1.0:
+            raise ValueError("thresholds must satisfy 0 < k1 < k2 < 1")
+        cfg = config or {}
+        zones = ZoneClassifier.from_config(cfg)
+        delta_max, _, _ = _capacity_limits(cfg, State)
+
+        self.boundaries = {"kappa": 1.0, "deviation": zones.bounds[-1], "delta": delta_max}
+        self.k1, self.k2 = k1, k2
+        self.lead = lead
+        self.zone_window = zone_window
+        self.min_periods = span if min_periods is None else min_periods
+        self.callback = callback
+        self._deviation_codes = {name: code for code, name in enumerate(zones.zone_names)
+                                 if code <= len(zones.bounds)}
+        self.stats = {name: RollingStats(window, span) for name in STREAMS}
+        self.events: Deque[WarningEvent] = deque(maxlen=max_events)
+        self.reset()
+
+    def reset(self):
+        """Clear statistics, active warnings and events."""
+        for stats in self.stats.values():
+            stats.reset()
+        self.active: Dict[str, str] = {}
+        self.events.clear()
+        self.t: Optional[int] = None
+        self._zone_code: Optional[int] = None
+        self._escalations: Deque[int] = deque(maxlen=2)
+
+    # indicator evaluation
+
+    def _set(self, new, t: int, indicator: str, level: Optional[str],
+             value: float, threshold: Optional[float]):
+        """Record a level change of one indicator (level None = inactive)."""
+        current = self.active.get(indicator)
+        if level == current:
+            return new
+        if level is None:
+            del self.active[indicator]
+            event = WarningEvent(t, indicator, "clear", value, None)
+        else:
+            self.active[indicator] = level
+            event = WarningEvent(t, indicator, level, value, threshold)
+        self.events.append(event)
+        if self.callback is not None:
+            self.callback(event)
+        return new + (event,)
+
+    def update(self, t: int, kappa: Optional[float], fxi: float, delta: float,
+               zone: Optional[str] = None) -> Tuple[WarningEvent, ...]:
+        """
+        Observe step t; returns the WarningEvents it raised (usually none).
+        `kappa` is None at t=0; `zone` enables the zone-escalation signal.
+        """
+        self.t = t
+        stats = self.stats
+        if kappa is not None:
+            stats["kappa"].update(kappa)
+        stats["deviation"].update(abs(fxi - 1.0))
+        stats["delta"].update(abs(delta))
+        new = _NO_EVENTS
+
+        # EWI-1: contraction weakening
+        kappa_stats = stats["kappa"]
+        if kappa_stats.count >= self.min_periods:
+            ewma = kappa_stats.ewma
+            level, threshold = None, None
+            for name, bound in (("critical", 1.0), ("strong", self.k2), ("mild", self.k1)):
+                if ewma > bound:
+                    level, threshold = name, bound
+                    break
+            new = self._set(new, t, "contraction-weakening", level, ewma, threshold)
+
+        # Trend extrapolation to each stream's boundary
+        for name in STREAMS:
+            s = stats[name]
+            if s.count < self.min_periods:
+                continue
+            steps = s.to_boundary(self.boundaries[name])
+            level = "warning" if steps is not None and steps <= self.lead else None
+            new = self._set(new, t, "boundary-approach:" + name, level,
+                            math.inf if steps is None else steps, self.lead)
+
+        # EWI-8: zone escalation
+        code = self._deviation_codes.get(zone) if zone is not None else None
+        if code is not None:
+            if self._zone_code is not None and code > self._zone_code:
+                self._escalations.append(t)
+            self._zone_code = code
+            recent = [s for s in self._escalations if t - s < self.zone_window]
+            level = "warning" if len(recent) >= 2 else None
+            new = self._set(new, t, "zone-escalation", level, float(len(recent)), 2.0)
+
+        # 38.10: multi-signal warning state
+        signals = sum(1 for name in self.active if name != "multi-signal")
+        new = self._set(new, t, "multi-signal", "critical" if signals >= 2 else None,
+                        float(signals), 2.0)
+        return new
+
+    def observe(self, record: StepRecord) -> Tuple[WarningEvent, ...]:
+        """update() from a StepRecord (iter_simulation, FRESession)."""
+        return self.update(record.t, record.kappa, record.fxi, record.delta, record.zone)
+
+    def watch(self, records: Iterable[StepRecord]) -> Iterator[Tuple[StepRecord, Tuple[WarningEvent, ...]]]:
+        """
+        Yield (record, new events) for each record of a stream.
+
+        Example — stop a simulation at the first critical warning:
+
+            stream = iter_simulation(state, operator, scenario, horizon=5000)
+            for rec, events in monitor.watch(stream):
+                if any(e.level == "critical" for e in events):
+                    break
+        """
+        for record in records:
+            yield record, self.observe(record)
+
+    def indicators(self) -> Dict[str, Any]:
+        """Snapshot of the rolling statistics and active warnings."""
+        return {
+            "t": self.t,
+            "streams": {name: self.stats[name].snapshot(self.boundaries[name]) for name in STREAMS},
+            "active": dict(self.active),
+        }
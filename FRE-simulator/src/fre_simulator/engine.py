@@ -2,12 +2,16 @@
 # Core evolution loop for FRE Simulator V2.0
 # Applies scenarios, updates FXI via operator E, tracks stability and breaches.
 
-from dataclasses import dataclass, replace
-from typing import List, Optional, Any, Dict
+import copy
+from dataclasses import dataclass
+from typing import List, Optional, Any, Dict, NamedTuple, Tuple
 
-from .state import State
+import numpy as np
+
+from .state import State, CompactState
 from .operators import BaseOperator
 from .scenarios import BaseScenario
+from .zones import ZoneClassifier, ZONE_NAMES
 
 """
 Engine Module — FRE Simulator V2.0
@@ -66,20 +70,524 @@ class SimulationResult:
     breach_state: Optional[State]
     breach_type: Optional[str]
 
+    # state after the last executed step (recorded under every policy)
+    final_state: Optional[State] = None
+
+    # near-equilibrium reached with no future scenario events
+    # (only detected when the config enables "convergence")
+    converged: bool = False
+    converged_step: Optional[int] = None
+
+    def to_json(self, fp=None, **options):
+        """FRE JSON output document, see serialization.to_json."""
+        from .serialization import to_json
+        return to_json(self, fp, **options)
 
-def _classify_zone(fxi: float, eps1: float, eps2: float) -> str:
+
+@dataclass
+class ColumnarSimulationResult:
     """
-    Stability zone classification based on |FXI - 1|.
-    Stable:   |FXI - 1| <= eps1
-    Stressed: eps1 < |FXI - 1| <= eps2
-    Critical: |FXI - 1| > eps2
+    Columnar output of a FRE simulation run.
+
+    Scalar trajectories are stored in preallocated float64 arrays trimmed
+    to the recorded length, and stability zones as int8 codes into
+    `zone_names`. κ is NaN at t=0.
+
+    The list-style attributes of SimulationResult (fxi_series, delta_series,
+    kappa_series, stability_zones) remain available as properties that
+    build Python lists on access.
     """
-    dev = abs(fxi - 1.0)
-    if dev <= eps1:
-        return "stable"
-    if dev <= eps2:
-        return "stressed"
-    return "critical"
+    fxi: np.ndarray
+    delta: np.ndarray
+    kappa: np.ndarray
+    zone_codes: np.ndarray
+    state_series: List[State]
+    scenario_events: List[Dict[str, Any]]
+
+    breach_occurred: bool
+    breach_step: Optional[int]
+    breach_state: Optional[State]
+    breach_type: Optional[str]
+    final_state: Optional[State] = None
+    zone_names: Tuple[str, ...] = ZONE_NAMES
+    converged: bool = False
+    converged_step: Optional[int] = None
+
+    @property
+    def fxi_series(self) -> List[float]:
+        return self.fxi.tolist()
+
+    @property
+    def delta_series(self) -> List[float]:
+        return self.delta.tolist()
+
+    @property
+    def kappa_series(self) -> List[Optional[float]]:
+        kappa = self.kappa.tolist()
+        if kappa:
+            kappa[0] = None  # κ not defined at t=0
+        return kappa
+
+    @property
+    def stability_zones(self) -> List[str]:
+        return [self.zone_names[code] for code in self.zone_codes.tolist()]
+
+    def to_json(self, fp=None, **options):
+        """FRE JSON output document, see serialization.to_json."""
+        from .serialization import to_json
+        return to_json(self, fp, **options)
+
+
+def _capacity_limits(cfg: dict, state: Any):
+    """
+    Read capacity limits (delta_max, fxi_min, fxi_max) from the engine config,
+    falling back to the class-level bounds of the given state.
+    """
+    cap_cfg = cfg.get("capacity_limits", {})
+    delta_max = cap_cfg.get("delta", state.DELTA_MAX)
+    fxi_min = cap_cfg.get("fxi_min", state.FXI_MIN)
+    fxi_max = cap_cfg.get("fxi_max", state.FXI_MAX)
+    return delta_max, fxi_min, fxi_max
+
+
+def _reset_operator(operator: Any):
+    """
+    Restore the per-run state of a stateful operator (e.g. DegradingOperator,
+    MemoryOperator) at the start of a run, so reusing one instance gives
+    the same trajectory every time.
+    """
+    reset = getattr(operator, "reset", None)
+    if callable(reset):
+        reset()
+
+
+CONVERGENCE_MODES = ("stop", "fill")
+
+
+def _convergence(cfg: dict):
+    """
+    Read the convergence criterion (tol, steps, mode) from the engine
+    config, or None if convergence detection is disabled.
+    """
+    conv_cfg = cfg.get("convergence")
+    if conv_cfg is None:
+        return None
+    tol = conv_cfg.get("tol", 1e-12)
+    steps = conv_cfg.get("steps", 10)
+    mode = conv_cfg.get("mode", "stop")
+    if tol < 0.0:
+        raise ValueError("convergence tol must be non-negative")
+    if steps < 1:
+        raise ValueError("convergence steps must be at least 1")
+    if mode not in CONVERGENCE_MODES:
+        raise ValueError(f"convergence mode must be one of {CONVERGENCE_MODES}, got {mode!r}")
+    return tol, steps, mode
+
+
+def _calm_runs(calm: np.ndarray, carry: int) -> np.ndarray:
+    """
+    Length of the run of consecutive calm steps ending at each entry of a
+    boolean array, continuing a run of `carry` steps before it.
+    """
+    idx = np.arange(len(calm))
+    last_break = np.maximum.accumulate(np.where(calm, -1, idx))
+    return np.where(last_break < 0, idx + 1 + carry, idx - last_break)
+
+
+def _trim(column: np.ndarray, length: int) -> np.ndarray:
+    """
+    Trim a preallocated column to its recorded length.
+    A short prefix is copied so the full-horizon buffer can be released.
+    """
+    if length == column.shape[0]:
+        return column
+    return column[:length].copy()
+
+
+def _linear_stretch_fxi(fxi: float, alpha: float, length: int) -> np.ndarray:
+    """
+    FXI after n = 1..length steps of FXI(t+1) = 1 + α ⋅ (FXI(t) − 1),
+    in closed form: FXI(n) = 1 + αⁿ ⋅ (FXI(0) − 1).
+    """
+    return 1.0 + (fxi - 1.0) * alpha ** np.arange(1, length + 1)
+
+
+def _kappa_series(operator: BaseOperator, prev_fxi: np.ndarray, next_fxi: np.ndarray) -> np.ndarray:
+    """
+    κ for arrays of consecutive FXI values, vectorized when the operator
+    provides kappa_batch().
+    """
+    if hasattr(operator, "kappa_batch"):
+        return operator.kappa_batch(prev_fxi, next_fxi)
+    return np.fromiter((operator.kappa(p, n) for p, n in zip(prev_fxi.tolist(), next_fxi.tolist())),
+                       dtype=np.float64, count=len(next_fxi))
+
+
+class StepRecord(NamedTuple):
+    """
+    Lightweight per-step record yielded by iter_simulation.
+
+        t     — time step (0 = initial point)
+        fxi   — FXI(t) after correction
+        delta — Δ(t)
+        kappa — κ(t), None at t=0
+        zone  — stability zone of FXI(t)
+        event — scenario event dict of step t, or None
+                (depends on the stream's `events` mode)
+    """
+    t: int
+    fxi: float
+    delta: float
+    kappa: Optional[float]
+    zone: str
+    event: Optional[Dict[str, Any]]
+
+
+class QuietStretch(NamedTuple):
+    """
+    Steps t_start..t_end evaluated in closed form by SimulationStream.skip_quiet.
+
+    fxi, delta, kappa and zone_codes are arrays of length
+    t_end − t_start + 1; all four are None when the series were not
+    requested.
+    """
+    t_start: int
+    t_end: int
+    fxi: Optional[np.ndarray]
+    delta: Optional[np.ndarray]
+    kappa: Optional[np.ndarray]
+    zone_codes: Optional[np.ndarray]
+
+
+STREAM_EVENT_MODES = ("none", "changes", "all")
+
+
+class SimulationStream:
+    """
+    Step-by-step FRE evolution as a generator.
+
+    Iterating yields one StepRecord per completed step (t=0 first) and keeps
+    only the current state in memory. The stream follows the generator
+    protocol, except that `send(True)` stops the evolution after the
+    current step and returns the last record instead of raising
+    StopIteration; `send(None)` is equivalent to next().
+
+    Attributes available during and after iteration:
+        t               — last executed step
+        state           — live working state (do not mutate)
+        zones           — ZoneClassifier built from the config
+        breach_occurred, breach_step, breach_state, breach_type
+        breach_event    — scenario event of a breach step that produced no
+                          record (FXI capacity / Δ computation breaches)
+        stopped         — True if stopped early via send()
+        converged, converged_step
+                        — convergence detected (config "convergence", see
+                          run_simulation); the stream ends at converged_step
+    """
+
+    def __init__(
+        self,
+        initial_state: State,
+        operator: BaseOperator,
+        scenario: BaseScenario,
+        horizon: int,
+        config: Optional[dict] = None,
+        events: str = "none",
+        closed_form: bool = False
+    ):
+        if horizon <= 0:
+            raise ValueError("horizon must be positive")
+        if events not in STREAM_EVENT_MODES:
+            raise ValueError(f"events must be one of {STREAM_EVENT_MODES}, got {events!r}")
+
+        cfg = config or {}
+        _reset_operator(operator)
+        self.operator = operator
+        self.scenario = scenario
+        self.horizon = horizon
+        self.events = events
+
+        # Stability zone classifier
+        self.zones = ZoneClassifier.from_config(cfg)
+
+        # Capacity limits (fallback to State defaults if provided)
+        self._delta_max, self._fxi_min, self._fxi_max = _capacity_limits(cfg, initial_state)
+
+        # Current state
+        self.state = copy.copy(initial_state)  # copy to avoid mutating caller's object
+        self.state.validate()
+        self.t = 0
+
+        self.breach_occurred = False
+        self.breach_step: Optional[int] = None
+        self.breach_state: Optional[State] = None
+        self.breach_type: Optional[str] = None
+        self.breach_event: Optional[Dict[str, Any]] = None
+        self.stopped = False
+
+        # Convergence: |FXI − 1| and |Δ| within tol for `steps` consecutive
+        # steps, with no scenario event left
+        self.convergence = _convergence(cfg)
+        self.converged = False
+        self.converged_step: Optional[int] = None
+        self._calm = 0
+
+        # Closed-form fast path: linear contraction on the scalar State, with
+        # 1 inside the capacity band so a stretch can only approach equilibrium
+        self._fast_alpha = None
+        if (closed_form and isinstance(self.state, (State, CompactState))
+                and hasattr(operator, "linear_coefficient")
+                and hasattr(scenario, "next_event")
+                and self._fxi_min <= 1.0 <= self._fxi_max and self._delta_max >= 0.0):
+            self._fast_alpha = operator.linear_coefficient()
+
+        self._gen = self._run()
+        self._last: Optional[StepRecord] = None
+
+    # generator protocol
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> StepRecord:
+        self._last = next(self._gen)
+        return self._last
+
+    def send(self, value) -> StepRecord:
+        try:
+            self._last = self._gen.send(value)
+        except StopIteration:
+            if not value:
+                raise
+            # stop request: the stream is finished, hand back its last record
+        return self._last
+
+    def close(self):
+        self._gen.close()
+
+    def _breach(self, breach_type: str):
+        self.breach_occurred = True
+        self.breach_step = self.t
+        self.breach_state = copy.copy(self.state)
+        self.breach_type = breach_type
+
+    def _settled(self, t: int) -> bool:
+        """
+        True if no scenario event follows step t, i.e. the evolution after
+        t is driven by the operator alone.
+        """
+        next_event = getattr(self.scenario, "next_event", None)
+        return next_event is not None and next_event(t + 1) is None
+
+    def _check_convergence(self, fxi: float, delta: float):
+        tol, steps, _ = self.convergence
+        if abs(fxi - 1.0) <= tol and abs(delta) <= tol:
+            self._calm += 1
+            if self._calm >= steps and self._settled(self.t):
+                self.converged = True
+                self.converged_step = self.t
+        else:
+            self._calm = 0
+
+    def _run(self):
+        classify = self.zones.classify
+        delta_max, fxi_min, fxi_max = self._delta_max, self._fxi_min, self._fxi_max
+        operator, scenario = self.operator, self.scenario
+        detect_events = self.events != "none"
+        record_quiet_steps = self.events == "all"
+        check_convergence = self.convergence is not None
+
+        # Scenarios declaring their event steps are not called on quiet steps
+        next_event = getattr(scenario, "next_event", None)
+        upcoming = 0
+
+        # Initial point (t=0, before first operator application)
+        state = self.state
+        if check_convergence:
+            self._check_convergence(state.fxi, state.delta)
+        init_event = {"t": 0, "type": "init", "info": {}} if detect_events else None
+        stop = yield StepRecord(0, state.fxi, state.delta, None,
+                                classify(state.fxi), init_event)
+
+        # Evolution loop
+        while self.t < self.horizon:
+            if stop:
+                self.stopped = True
+                return
+            if self.converged:
+                # Remaining steps are operator-only decay within tolerance
+                return
+            self.t = t = self.t + 1
+
+            # 1) Apply scenario at step t (using state at t-1)
+            event = None
+            if next_event is not None and upcoming is not None and upcoming < t:
+                upcoming = next_event(t)
+            quiet = next_event is not None and (upcoming is None or upcoming > t)
+            if quiet:
+                if record_quiet_steps:
+                    event = {"t": t, "type": "none", "info": {}}
+            elif detect_events:
+                before = copy.copy(state)
+                state = scenario.apply(state, t)
+                after = copy.copy(state)
+                if before != after:
+                    event = {
+                        "t": t,
+                        "type": "scenario",
+                        "info": {
+                            "before": before,
+                            "after": after
+                        }
+                    }
+                elif record_quiet_steps:
+                    event = {
+                        "t": t,
+                        "type": "none",
+                        "info": {}
+                    }
+            else:
+                state = scenario.apply(state, t)
+            self.state = state
+
+            # 2) Recompute Δ(t) from qp, qf (simple placeholder mapping)
+            try:
+                state.compute_delta()
+            except ZeroDivisionError as e:
+                self._breach(f"delta-computation-error: {e}")
+                self.breach_event = event
+                return
+
+            # 3) Compute FXI(t+1) via operator E
+            prev_fxi = state.fxi
+            next_fxi = operator.apply(prev_fxi)
+
+            # Enforce capacity limits on FXI explicitly
+            if next_fxi < fxi_min or next_fxi > fxi_max:
+                self._breach("fxi-capacity-breach")
+                self.breach_event = event
+                return
+
+            # 4) Update state from operator result
+            state.update_from_operator(next_fxi)
+
+            # 5) Classify stability zone (based on FXI after correction)
+            zone = classify(state.fxi)
+
+            # 6) Compute κ
+            kappa_value = operator.kappa(prev_fxi, state.fxi)
+
+            # 7) Check Δ capacity
+            if abs(state.delta) > delta_max:
+                self._breach("delta-capacity-breach")
+            elif check_convergence:
+                self._check_convergence(state.fxi, state.delta)
+
+            # 8) Emit step record
+            stop = yield StepRecord(t, state.fxi, state.delta, kappa_value, zone, event)
+
+            if self.breach_occurred:
+                # Stop evolution after first breach
+                return
+
+    def skip_quiet(self, series: bool = True) -> Optional[QuietStretch]:
+        """
+        Advance across the quiet steps following the current step in closed
+        form, if the stream was created with closed_form=True and the
+        operator is linear (see run_simulation). Returns the evaluated
+        stretch, or None if nothing was skipped.
+
+        FXI(t) already passed the capacity checks, and every value in the
+        stretch lies between FXI(t) and 1, so no breach can occur in it.
+        The initial point (t=0) is never checked, so nothing is skipped
+        before the first step.
+
+        With convergence detection enabled, the stretch ends at the step
+        where the criterion is met.
+        """
+        alpha = self._fast_alpha
+        if (alpha is None or self.t == 0 or self.breach_occurred or self.stopped
+                or self.converged):
+            return None
+        t = self.t
+        next_event = self.scenario.next_event(t + 1)
+        t_end = self.horizon if next_event is None else min(next_event - 1, self.horizon)
+        length = t_end - t
+        if length <= 0:
+            return None
+
+        x = self.state.fxi
+        fxi = None
+        if self.convergence is not None:
+            # Δ = FXI − 1 along the stretch, so |FXI − 1| decides
+            tol, steps, _ = self.convergence
+            fxi = _linear_stretch_fxi(x, alpha, length)
+            runs = _calm_runs(np.abs(fxi - 1.0) <= tol, self._calm)
+            hits = np.flatnonzero(runs >= steps) if next_event is None else ()
+            if len(hits):
+                length = int(hits[0]) + 1
+                t_end = t + length
+                fxi = fxi[:length]
+                self.converged = True
+                self.converged_step = t_end
+            self._calm = int(runs[length - 1])
+        if series:
+            if fxi is None:
+                fxi = _linear_stretch_fxi(x, alpha, length)
+            prev = np.empty(length)
+            prev[0] = x
+            prev[1:] = fxi[:-1]
+            kappa = _kappa_series(self.operator, prev, fxi)
+            zone_codes = self.zones.classify_array(fxi)
+            stretch = QuietStretch(t + 1, t_end, fxi, fxi - 1.0, kappa, zone_codes)
+            final_fxi = float(fxi[-1])
+        else:
+            stretch = QuietStretch(t + 1, t_end, None, None, None, None)
+            if fxi is None:
+                final_fxi = 1.0 + (x - 1.0) * alpha ** length
+            else:
+                final_fxi = float(fxi[-1])
+
+        self.state.update_from_operator(final_fxi)
+        self.t = t_end
+        return stretch
+
+
+def iter_simulation(
+    initial_state: State,
+    operator: BaseOperator,
+    scenario: BaseScenario,
+    horizon: int,
+    config: Optional[dict] = None,
+    events: str = "none",
+    closed_form: bool = False
+) -> SimulationStream:
+    """
+    Streaming FRE evolution: yields a StepRecord as each step completes.
+
+    Parameters are those of run_simulation, plus:
+        events — scenario event detection per step:
+            "none"    — no detection, StepRecord.event is None (no snapshots)
+            "changes" — event dict with before/after snapshots on steps
+                        where the scenario changed the state
+            "all"     — as "changes", plus {"type": "none"} on quiet steps
+
+    Example — act on each step and stop on a custom condition:
+
+        stream = iter_simulation(state, operator, scenario, horizon=5000)
+        for rec in stream:
+            if rec.zone == "critical":
+                stream.send(True)   # stop after this step (returns rec)
+                break
+
+    Returns:
+        SimulationStream (a generator of StepRecord).
+    """
+    return SimulationStream(initial_state, operator, scenario, horizon, config,
+                            events=events, closed_form=closed_form)
+
+
+RECORD_POLICIES = ("full", "scalars-only", "events-only", "none")
 
 
 def run_simulation(
@@ -87,13 +595,17 @@ def run_simulation(
     operator: BaseOperator,
     scenario: BaseScenario,
     horizon: int,
-    config: Optional[dict] = None
+    config: Optional[dict] = None,
+    columnar: bool = False,
+    record: str = "full",
+    closed_form: bool = False
 ) -> SimulationResult:
     """
     Execute FRE structural evolution for a given horizon.
 
     Steps per iteration t:
-        1. Apply scenario to state S(t)
+        1. Apply scenario to state S(t) (not called on steps the scenario
+           declares quiet via next_event, e.g. a CompiledScenario)
         2. Recompute Δ(t) (from qp, qf) if needed
         3. Compute FXI(t+1) = E(FXI(t))
         4. Update state from new FXI (and Δ)
@@ -102,33 +614,57 @@ def run_simulation(
         7. Check capacity constraints (breach detection)
         8. Log state and diagnostics
 
+    The loop itself is iter_simulation; this function collects its records.
+
     Parameters:
         initial_state — starting structural state S0
         operator      — corrective operator E
         scenario      — stress scenario
         horizon       — number of steps
         config        — optional dict with:
-            "zone_thresholds": { "eps1": float, "eps2": float }
+            "zone_thresholds": { "eps1": float, "eps2": float, "compressed": float }
+            "zones": ZoneClassifier or { "names", "bounds", "compressed" }
             "capacity_limits": { "delta": float, "fxi_min": float, "fxi_max": float }
+            "convergence": { "tol": float, "steps": int, "mode": "stop" | "fill" }
+                — stop once |FXI − 1| ≤ tol and |Δ| ≤ tol held for
+                  `steps` consecutive steps (defaults 1e-12, 10) and
+                  scenario.next_event declares no further event; the
+                  result reports converged / converged_step. Mode "fill"
+                  extends the scalar series to the horizon with the
+                  converged point instead of simulating it (snapshots and
+                  events end at converged_step). Off when absent.
+        columnar      — if True, scalar trajectories are written into
+                        preallocated float64 / int8 arrays instead of lists
+        record        — what to record per step:
+            "full"         — scalar series, State snapshots, all scenario events
+            "scalars-only" — scalar series only (no snapshots, no events)
+            "events-only"  — scalar series and scenario events with
+                             before/after snapshots; steps where the scenario
+                             changed nothing are not listed
+            "none"         — nothing per step; only breach data and final_state
+        closed_form   — if True, stretches of quiet steps (as declared by
+                        scenario.next_event) under a linear operator
+                        (operator.linear_coefficient) are evaluated in
+                        closed form instead of step by step. Requires a
+                        record policy other than "full"; otherwise, and for
+                        non-linear operators, the loop steps normally.
+                        Results agree with stepping up to float rounding.
 
     Returns:
-        SimulationResult with full trajectories and diagnostics.
+        SimulationResult with full trajectories and diagnostics,
+        or ColumnarSimulationResult if columnar=True.
     """
-    if horizon <= 0:
-        raise ValueError("horizon must be positive")
+    if record not in RECORD_POLICIES:
+        raise ValueError(f"record must be one of {RECORD_POLICIES}, got {record!r}")
 
-    cfg = config or {}
+    # Recording policy
+    record_scalars = record != "none"
+    record_states = record == "full"
+    events = {"full": "all", "events-only": "changes"}.get(record, "none")
 
-    # Stability zone thresholds
-    zone_cfg = cfg.get("zone_thresholds", {})
-    eps1 = zone_cfg.get("eps1", 0.02)
-    eps2 = zone_cfg.get("eps2", 0.10)
-
-    # Capacity limits (fallback to State defaults if provided)
-    cap_cfg = cfg.get("capacity_limits", {})
-    delta_max = cap_cfg.get("delta", initial_state.DELTA_MAX)
-    fxi_min = cap_cfg.get("fxi_min", initial_state.FXI_MIN)
-    fxi_max = cap_cfg.get("fxi_max", initial_state.FXI_MAX)
+    stream = iter_simulation(initial_state, operator, scenario, horizon, config,
+                             events=events,
+                             closed_form=closed_form and record != "full")
 
     # Prepare series
     fxi_series: List[float] = []
@@ -138,93 +674,89 @@ def run_simulation(
     stability_zones: List[str] = []
     scenario_events: List[Dict[str, Any]] = []
 
-    breach_occurred = False
-    breach_step: Optional[int] = None
-    breach_state: Optional[State] = None
-    breach_type: Optional[str] = None
-
-    # Current state
-    state = replace(initial_state)  # copy to avoid mutating caller's object
-    state.validate()
-
-    # Record initial point (t=0, before first operator application)
-    fxi_series.append(state.fxi)
-    delta_series.append(state.delta)
-    state_series.append(replace(state))
-    kappa_series.append(None)  # κ not defined at t=0
-    stability_zones.append(_classify_zone(state.fxi, eps1, eps2))
-    scenario_events.append({"t": 0, "type": "init", "info": {}})
-
-    # Evolution loop
-    for t in range(1, horizon + 1):
-        if breach_occurred:
-            # Stop evolution after first breach
-            break
-
-        # 1) Apply scenario at step t (using state at t-1)
-        before = replace(state)
-        state = scenario.apply(state, t)
-        after = replace(state)
-        if before != after:
-            scenario_events.append({
-                "t": t,
-                "type": "scenario",
-                "info": {
-                    "before": before,
-                    "after": after
-                }
-            })
+    if columnar:
+        # Preallocated columns for t = 0..horizon, trimmed at the end
+        size = horizon + 1 if record_scalars else 0
+        fxi_col = np.empty(size)
+        delta_col = np.empty(size)
+        kappa_col = np.empty(size)
+        zone_col = np.empty(size, dtype=np.int8)
+    zone_codes = stream.zones.codes
+    n_points = 0
+
+    for rec in stream:
+        if rec.event is not None:
+            scenario_events.append(rec.event)
+
+        if record_scalars:
+            if columnar:
+                fxi_col[n_points] = rec.fxi
+                delta_col[n_points] = rec.delta
+                kappa_col[n_points] = np.nan if rec.kappa is None else rec.kappa
+                zone_col[n_points] = zone_codes[rec.zone]
+            else:
+                fxi_series.append(rec.fxi)
+                delta_series.append(rec.delta)
+                kappa_series.append(rec.kappa)
+                stability_zones.append(rec.zone)
+            if record_states:
+                state_series.append(copy.copy(stream.state))
+            n_points += 1
+
+        # Closed-form jump across the following quiet steps
+        stretch = stream.skip_quiet(series=record_scalars)
+        if stretch is None or not record_scalars:
+            continue
+        length = stretch.t_end - stretch.t_start + 1
+        if columnar:
+            end = n_points + length
+            fxi_col[n_points:end] = stretch.fxi
+            delta_col[n_points:end] = stretch.delta
+            kappa_col[n_points:end] = stretch.kappa
+            zone_col[n_points:end] = stretch.zone_codes
         else:
-            scenario_events.append({
-                "t": t,
-                "type": "none",
-                "info": {}
-            })
-
-        # 2) Recompute Δ(t) from qp, qf (simple placeholder mapping)
-        try:
-            state.compute_delta()
-        except ZeroDivisionError as e:
-            breach_occurred = True
-            breach_step = t
-            breach_state = replace(state)
-            breach_type = f"delta-computation-error: {e}"
-            break
-
-        # 3) Compute FXI(t+1) via operator E
-        prev_fxi = state.fxi
-        next_fxi = operator.apply(prev_fxi)
-
-        # Enforce capacity limits on FXI explicitly
-        if next_fxi < fxi_min or next_fxi > fxi_max:
-            breach_occurred = True
-            breach_step = t
-            breach_state = replace(state)
-            breach_type = "fxi-capacity-breach"
-            break
-
-        # 4) Update state from operator result
-        state.update_from_operator(next_fxi)
-
-        # 5) Classify stability zone (based on FXI after correction)
-        zone = _classify_zone(state.fxi, eps1, eps2)
-
-        # 6) Compute κ
-        kappa_value = operator.kappa(prev_fxi, state.fxi)
-
-        # 7) Check Δ capacity
-        if abs(state.delta) > delta_max:
-            breach_occurred = True
-            breach_step = t
-            breach_state = replace(state)
-            breach_type = "delta-capacity-breach"
-
-        # 8) Store trajectories
-        fxi_series.append(state.fxi)
-        delta_series.append(state.delta)
-        state_series.append(replace(state))
-        kappa_series.append(kappa_value)
-        stability_zones.append(zone)
+            fxi_series.extend(stretch.fxi.tolist())
+            delta_series.extend(stretch.delta.tolist())
+            kappa_series.extend(stretch.kappa.tolist())
+            stability_zones.extend(stream.zones.names_of(stretch.zone_codes))
+        n_points += length
+
+    if stream.breach_event is not None:
+        scenario_events.append(stream.breach_event)
+
+    # Converged: hold the last point for the steps not simulated
+    fill = horizon + 1 - n_points
+    if stream.converged and stream.convergence[2] == "fill" and record_scalars and fill > 0:
+        if columnar:
+            fxi_col[n_points:] = fxi_col[n_points - 1]
+            delta_col[n_points:] = delta_col[n_points - 1]
+            kappa_col[n_points:] = kappa_col[n_points - 1]
+            zone_col[n_points:] = zone_col[n_points - 1]
+        else:
+            fxi_series.extend([fxi_series[-1]] * fill)
+            delta_series.extend([delta_series[-1]] * fill)
+            kappa_series.extend([kappa_series[-1]] * fill)
+            stability_zones.extend([stability_zones[-1]] * fill)
+        n_points += fill
+
+    if columnar:
+        # Trim to the recorded length (shorter than horizon+1 after a breach)
+        return ColumnarSimulationResult(
+            fxi=_trim(fxi_col, n_points),
+            delta=_trim(delta_col, n_points),
+            kappa=_trim(kappa_col, n_points),
+            zone_codes=_trim(zone_col, n_points),
+            state_series=state_series,
+            scenario_events=scenario_events,
+            breach_occurred=stream.breach_occurred,
+            breach_step=stream.breach_step,
+            breach_state=stream.breach_state,
+            breach_type=stream.breach_type,
+            final_state=stream.state,
+            zone_names=stream.zones.zone_names,
+            converged=stream.converged,
+            converged_step=stream.converged_step,
+        )
 
     return SimulationResult(
         fxi_series=fxi_series,
@@ -233,8 +765,11 @@ def run_simulation(
         kappa_series=kappa_series,
         stability_zones=stability_zones,
         scenario_events=scenario_events,
-        breach_occurred=breach_occurred,
-        breach_step=breach_step,
-        breach_state=breach_state,
-        breach_type=breach_type,
+        breach_occurred=stream.breach_occurred,
+        breach_step=stream.breach_step,
+        breach_state=stream.breach_state,
+        breach_type=stream.breach_type,
+        final_state=stream.state,
+        converged=stream.converged,
+        converged_step=stream.converged_step,
     )
@@ -0,0 +1,475 @@
+"""
+Export Module — FRE Simulator V2.0
+==================================
+
+This module stores FRETimeSeries — one FRERecord per step — in the
+formats of Specification Section 57.3: JSON, CSV, Parquet and NPZ.
+
+Records (the FRERecord fields produced by the scalar engine, plus the
+run they belong to):
+
+    run_id      — run index (or caller-given id) of the simulation
+    t           — step, 0…T
+    r           — Δ(t)
+    FXI_global  — FXI(t)
+    k_eff       — κ(t), missing (NaN / null / empty) at t=0
+    zone        — stability zone
+
+Many simulations go into one file: a BatchSimulationResult contributes
+one run per row, a SimulationResult or ColumnarSimulationResult one run,
+and any iterable of these (e.g. a generator of batch chunks) is written
+run after run. Records are produced in chunks of `chunk_rows` straight
+from the result columns, so a large output is never held as records in
+memory:
+
+    json    — Section 57.4 schema {"meta", "config", "records": [...]},
+              written incrementally
+    csv     — header + one line per record (no metadata)
+    parquet — one row group per chunk, metadata in the schema
+              (requires the optional pyarrow package)
+    npz     — one .npy member per column, stored uncompressed; columns
+              are spooled to temporary files while writing
+
+Metadata follows Section 57.7: FRE version, simulator version, UTC
+timestamp, git commit (if available) and the given config.
+
+read_records() returns a RecordTable; NPZ columns are memory-mapped
+(mmap=True), so opening a large file is immediate.
+"""
+
+# export.py
+# FRETimeSeries storage for FRE Simulator V2.0
+# Chunked JSON / CSV / Parquet / NPZ writers and readers, memory-mapped NPZ.
+
+import datetime
+import functools
+import json
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+import zipfile
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .zones import ZONE_NAMES
+from .engine import SimulationResult, ColumnarSimulationResult
+from .batch import BatchSimulationResult
+
+
+RECORD_FIELDS = ("run_id", "t", "r", "FXI_global", "k_eff", "zone")
+
+RECORD_DTYPES = {
+    "run_id": np.int64,
+    "t": np.int64,
+    "r": np.float64,
+    "FXI_global": np.float64,
+    "k_eff": np.float64,
+    "zone": np.int8,
+}
+
+# File suffix → format
+FORMATS = {".json": "json", ".csv": "csv", ".parquet": "parquet", ".npz": "npz"}
+
+
+@dataclass
+class RecordTable:
+    """
+    Columns of stored FRERecords, one entry per record.
+
+        run_id, t, r, FXI_global, k_eff — arrays (memory-mapped for NPZ)
+        zone       — int8 codes into zone_names
+        zone_names — zone names indexed by code
+        meta       — Section 57.7 metadata (empty for CSV)
+    """
+    run_id: np.ndarray
+    t: np.ndarray
+    r: np.ndarray
+    FXI_global: np.ndarray
+    k_eff: np.ndarray
+    zone: np.ndarray
+    zone_names: Tuple[str, ...] = ZONE_NAMES
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self):
+        return len(self.t)
+
+    @property
+    def zones(self) -> List[str]:
+        return [self.zone_names[code] for code in self.zone.tolist()]
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        return {name: getattr(self, name) for name in RECORD_FIELDS}
+
+    def run(self, run_id: int) -> "RecordTable":
+        """Records of one run (copies)."""
+        mask = self.run_id == run_id
+        return RecordTable(**{name: np.asarray(column[mask]) for name, column in self.columns().items()},
+                           zone_names=self.zone_names, meta=self.meta)
+
+
+# ---------------------------------------------------------
+# Metadata
+# ---------------------------------------------------------
+
+@functools.lru_cache(maxsize=1)
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                             text=True, timeout=5, cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if out.returncode != 0:
+        return None
+    return out.stdout.strip() or None
+
+
+def record_meta(config: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+    """Section 57.7 metadata of an export."""
+    from . import __version__
+    return {
+        "fre_version": "2.0",
+        "simulator_version": __version__,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "git_commit": _git_commit(),
+        "config": dict(config or {}),
+    }
+
+
+# ---------------------------------------------------------
+# Record chunks
+# ---------------------------------------------------------
+
+def _series_block(source):
+    """(fxi, delta, kappa, zone_codes, lengths, zone_names) with one row per run."""
+    if isinstance(source, BatchSimulationResult):
+        return (source.fxi, source.delta, source.kappa, source.zone_codes,
+                np.asarray(source.lengths), tuple(source.zone_names))
+    if isinstance(source, ColumnarSimulationResult):
+        return (source.fxi[None], source.delta[None], source.kappa[None],
+                source.zone_codes[None], np.array([len(source.fxi)]), tuple(source.zone_names))
+    names = tuple(dict.fromkeys(source.stability_zones))
+    index = {name: i for i, name in enumerate(names)}
+    codes = np.array([index[z] for z in source.stability_zones], dtype=np.int8)
+    return (np.asarray(source.fxi_series, dtype=np.float64)[None],
+            np.asarray(source.delta_series, dtype=np.float64)[None],
+            np.array(source.kappa_series, dtype=np.float64)[None],
+            codes[None], np.array([len(codes)]), names)
+
+
+def _sources(source) -> Iterator:
+    if isinstance(source, (BatchSimulationResult, SimulationResult, ColumnarSimulationResult)):
+        yield source
+    else:
+        for item in source:
+            yield from _sources(item)
+
+
+def iter_record_chunks(source, chunk_rows: int = 1 << 20,
+                       run_ids: Optional[Sequence[int]] = None,
+                       zone_names: Optional[List[str]] = None) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Record columns of `source` in chunks of about `chunk_rows` records
+    (whole runs per chunk, at least one run).
+
+    Zone codes refer to `zone_names`, a list that is extended with the
+    zones of each source as they appear (default: ZONE_NAMES).
+    """
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive")
+    names = zone_names if zone_names is not None else list(ZONE_NAMES)
+    run = 0
+    for item in _sources(source):
+        fxi, delta, kappa, codes, lengths, item_names = _series_block(item)
+        for name in item_names:
+            if name not in names:
+                names.append(name)
+        lookup = np.array([names.index(name) for name in item_names] or [0], dtype=np.int8)
+
+        width = fxi.shape[1]
+        rows_per_chunk = max(1, chunk_rows // max(width, 1))
+        for start in range(0, fxi.shape[0], rows_per_chunk):
+            stop = min(start + rows_per_chunk, fxi.shape[0])
+            n = lengths[start:stop]
+            recorded = np.arange(width) < n[:, None]
+            ids = np.arange(run + start, run + stop)
+            if run_ids is not None:
+                ids = np.asarray(run_ids)[ids]
+            yield {
+                "run_id": np.repeat(ids, n).astype(np.int64),
+                "t": np.nonzero(recorded)[1].astype(np.int64),
+                "r": delta[start:stop][recorded],
+                "FXI_global": fxi[start:stop][recorded],
+                "k_eff": kappa[start:stop][recorded],
+                "zone": lookup[codes[start:stop][recorded]],
+            }
+        run += fxi.shape[0]
+
+
+def _float_texts(values: np.ndarray, missing: str) -> List[str]:
+    items = values.tolist()
+    finite = np.isfinite(values)
+    if finite.all():
+        return list(map(float.__repr__, items))
+    return [float.__repr__(v) if ok else missing for v, ok in zip(items, finite.tolist())]
+
+
+# ---------------------------------------------------------
+# Writers
+# ---------------------------------------------------------
+
+def _write_json(chunks, path, meta, names):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"meta":' + json.dumps(meta) + ',"config":' + json.dumps(meta["config"])
+                + ',"records":[')
+        first = True
+        for chunk in chunks:
+            zones = [json.dumps(name) for name in names]
+            lines = [
+                f'{{"run_id":{i},"t":{t},"r":{r},"FXI_global":{x},"k_eff":{k},"zone":{zones[z]}}}'
+                for i, t, r, x, k, z in zip(chunk["run_id"].tolist(), chunk["t"].tolist(),
+                                            _float_texts(chunk["r"], "null"),
+                                            _float_texts(chunk["FXI_global"], "null"),
+                                            _float_texts(chunk["k_eff"], "null"),
+                                            chunk["zone"].tolist())
+            ]
+            if lines:
+                f.write(("" if first else ",") + ",".join(lines))
+                first = False
+        f.write("]}")
+
+
+def _write_csv(chunks, path, names):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(",".join(RECORD_FIELDS) + "\n")
+        for chunk in chunks:
+            lines = [
+                f"{i},{t},{r},{x},{k},{names[z]}\n"
+                for i, t, r, x, k, z in zip(chunk["run_id"].tolist(), chunk["t"].tolist(),
+                                            _float_texts(chunk["r"], ""),
+                                            _float_texts(chunk["FXI_global"], ""),
+                                            _float_texts(chunk["k_eff"], ""),
+                                            chunk["zone"].tolist())
+            ]
+            f.write("".join(lines))
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Parquet storage requires the pyarrow package") from None
+    return pyarrow
+
+
+def _write_parquet(chunks, path, meta, names):
+    pa = _pyarrow()
+    schema = pa.schema(
+        [(name, pa.from_numpy_dtype(np.dtype(RECORD_DTYPES[name]))) for name in RECORD_FIELDS[:-1]]
+        + [("zone", pa.string())],
+        metadata={b"fre": json.dumps(meta).encode("utf-8")},
+    )
+    with pa.parquet.ParquetWriter(path, schema) as writer:
+        for chunk in chunks:
+            zones = np.array(names, dtype=object)[chunk["zone"]]
+            writer.write_table(pa.table(
+                {**{name: chunk[name] for name in RECORD_FIELDS[:-1]}, "zone": zones},
+                schema=schema,
+            ))
+
+
+def _write_npy_member(archive: zipfile.ZipFile, name: str, dtype, count: int, spool: str):
+    with archive.open(name + ".npy", "w", force_zip64=True) as out:
+        np.lib.format.write_array_header_2_0(out, {
+            "descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+            "fortran_order": False,
+            "shape": (count,),
+        })
+        with open(spool, "rb") as data:
+            shutil.copyfileobj(data, out, 1 << 22)
+
+
+def _write_npz(chunks, path, meta, names):
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(path))) as tmp:
+        spools = {name: open(os.path.join(tmp, name), "wb") for name in RECORD_FIELDS}
+        count = 0
+        try:
+            for chunk in chunks:
+                for name in RECORD_FIELDS:
+                    np.ascontiguousarray(chunk[name], dtype=RECORD_DTYPES[name]).tofile(spools[name])
+                count += len(chunk["t"])
+        finally:
+            for spool in spools.values():
+                spool.close()
+
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+            for name in RECORD_FIELDS:
+                _write_npy_member(archive, name, RECORD_DTYPES[name], count,
+                                  os.path.join(tmp, name))
+            with archive.open("zone_names.npy", "w") as out:
+                np.lib.format.write_array(out, np.array(names, dtype=str))
+            with archive.open("meta.npy", "w") as out:
+                np.lib.format.write_array(out, np.array(json.dumps(meta)))
+
+
+def _format_of(path: str, format: Optional[str]) -> str:
+    if format is None:
+        format = FORMATS.get(os.path.splitext(path)[1].lower())
+        if format is None:
+            raise ValueError(f"cannot infer the storage format of {path!r}; "
+                             f"pass format= one of {tuple(FORMATS.values())}")
+    if format not in FORMATS.values():
+        raise ValueError(f"format must be one of {tuple(FORMATS.values())}, got {format!r}")
+    return format
+
+
+def write_records(
+    source,
+    path: str,
+    format: Optional[str] = None,
+    config: Optional[Mapping[str, Any]] = None,
+    run_ids: Optional[Sequence[int]] = None,
+    chunk_rows: int = 1 << 20
+) -> int:
+    """
+    Write the FRETimeSeries of one or many simulations to a file.
+
+    Parameters:
+        source     — SimulationResult, ColumnarSimulationResult,
+                     BatchSimulationResult, or an iterable of them
+        path       — output file
+        format     — "json", "csv", "parquet" or "npz" (default: from suffix)
+        config     — scenario/operator/capacity config stored in the metadata
+        run_ids    — id per run (default: 0, 1, … in source order)
+        chunk_rows — records per chunk / Parquet row group
+
+    Returns:
+        number of records written.
+
+    Example:
+        batch = run_simulation_batch(states, operator, scenario, horizon=1000)
+        write_records(batch, "runs.parquet", config={"alpha": 0.7})
+    """
+    format = _format_of(path, format)
+    meta = record_meta(config)
+    names = list(ZONE_NAMES)
+    count = [0]
+
+    def chunks():
+        for chunk in iter_record_chunks(source, chunk_rows, run_ids, names):
+            count[0] += len(chunk["t"])
+            yield chunk
+
+    if format == "json":
+        _write_json(chunks(), path, meta, names)
+    elif format == "csv":
+        _write_csv(chunks(), path, names)
+    elif format == "parquet":
+        _write_parquet(chunks(), path, meta, names)
+    else:
+        _write_npz(chunks(), path, meta, names)
+    return count[0]
+
+
+# ---------------------------------------------------------
+# Readers
+# ---------------------------------------------------------
+
+def _table(columns: Mapping[str, Any], zones: Sequence[str], meta) -> RecordTable:
+    names = list(ZONE_NAMES) + [z for z in dict.fromkeys(zones) if z not in ZONE_NAMES]
+    index = {name: i for i, name in enumerate(names)}
+    return RecordTable(
+        **{name: np.asarray(columns[name], dtype=RECORD_DTYPES[name]) for name in RECORD_FIELDS[:-1]},
+        zone=np.array([index[z] for z in zones], dtype=np.int8),
+        zone_names=tuple(names),
+        meta=meta,
+    )
+
+
+def _read_json(path):
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    records = document["records"]
+    columns = {name: [rec[name] for rec in records] for name in RECORD_FIELDS[:-1]}
+    for name in ("r", "FXI_global", "k_eff"):
+        columns[name] = np.array(columns[name], dtype=np.float64)   # null → NaN
+    return _table(columns, [rec["zone"] for rec in records], document.get("meta", {}))
+
+
+def _read_csv(path):
+    with open(path, encoding="utf-8") as f:
+        header = f.readline().strip().split(",")
+        rows = [line.rstrip("\n").split(",") for line in f if line.strip()]
+    cells = dict(zip(header, zip(*rows))) if rows else {name: () for name in header}
+    columns = {
+        name: [float(v) if v else np.nan for v in cells[name]] if name in ("r", "FXI_global", "k_eff")
+        else [int(v) for v in cells[name]]
+        for name in RECORD_FIELDS[:-1]
+    }
+    return _table(columns, list(cells["zone"]), {})
+
+
+def _read_parquet(path):
+    pa = _pyarrow()
+    table = pa.parquet.read_table(path)
+    metadata = table.schema.metadata or {}
+    meta = json.loads(metadata[b"fre"]) if b"fre" in metadata else {}
+    columns = {name: table.column(name).to_numpy() for name in RECORD_FIELDS[:-1]}
+    return _table(columns, table.column("zone").to_pylist(), meta)
+
+
+def _npz_member(path: str, f, info: zipfile.ZipInfo, mmap: bool) -> np.ndarray:
+    """Array of one stored NPZ member, memory-mapped if possible."""
+    f.seek(info.header_offset)
+    local = f.read(30)
+    name_len, extra_len = struct.unpack("<HH", local[26:30])
+    f.seek(info.header_offset + 30 + name_len + extra_len)
+    version = np.lib.format.read_magic(f)
+    read_header = (np.lib.format.read_array_header_1_0 if version == (1, 0)
+                   else np.lib.format.read_array_header_2_0)
+    shape, fortran_order, dtype = read_header(f)
+    count = int(np.prod(shape))
+    if not mmap or count == 0 or dtype.hasobject or info.compress_type != zipfile.ZIP_STORED:
+        return None
+    return np.memmap(path, dtype=dtype, mode="r", offset=f.tell(), shape=shape,
+                     order="F" if fortran_order else "C")
+
+
+def _read_npz(path, mmap):
+    columns = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+        for name in RECORD_FIELDS:
+            info = archive.getinfo(name + ".npy")
+            column = _npz_member(path, f, info, mmap)
+            if column is None:
+                with archive.open(info) as member:
+                    column = np.lib.format.read_array(member)
+            columns[name] = column
+        with archive.open("zone_names.npy") as member:
+            names = tuple(np.lib.format.read_array(member).tolist())
+        with archive.open("meta.npy") as member:
+            meta = json.loads(str(np.lib.format.read_array(member)))
+    return RecordTable(**columns, zone_names=names, meta=meta)
+
+
+def read_records(path: str, format: Optional[str] = None, mmap: bool = True) -> RecordTable:
+    """
+    Read records written by write_records.
+
+    Parameters:
+        path   — input file
+        format — "json", "csv", "parquet" or "npz" (default: from suffix)
+        mmap   — memory-map NPZ columns (read-only) instead of loading them
+    """
+    format = _format_of(path, format)
+    if format == "json":
+        return _read_json(path)
+    if format == "csv":
+        return _read_csv(path)
+    if format == "parquet":
+        return _read_parquet(path)
+    return _read_npz(path, mmap)
@@ -0,0 +1,264 @@
+"""
+Monte Carlo Module — FRE Simulator V2.0
+=======================================
+
+This module runs many stochastic FRE paths (e.g. `StochasticNoiseScenario`
+or the Level 10 stochastic drift) and aggregates their statistics:
+
+- breach probability and breach counts per breach type,
+- histogram of breach steps,
+- FXI(t) mean and percentile bands.
+
+Reproducibility:
+    Path i draws from its own stream, the i-th child of
+    numpy.random.SeedSequence(seed). Paths are grouped into fixed-size
+    chunks and chunk aggregates are combined in chunk order, so results
+    depend only on (seed, n_paths, chunk_size) — never on the number of
+    worker processes.
+
+Memory:
+    Workers return aggregates (counts, sums, per-step FXI histograms),
+    never full trajectories. A chunk ships its histogram in sparse form:
+    only the occupied (step, bin) cells, with bin indices and counts in
+    the smallest integer types. Each cell holds at least one path, so the
+    payload is at most about half the size of the chunk's raw FXI series
+    (≤ 4 bytes per cell plus one offset per step, vs 8 bytes per point),
+    and far less when paths share bins. Percentiles are interpolated
+    from the per-step FXI histograms.
+"""
+
+# montecarlo.py
+# Parallel Monte Carlo driver for FRE Simulator V2.0
+# Per-path SeedSequence streams, chunked process-pool execution.
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .state import State, AdmissibilityError
+from .operators import BaseOperator
+from .scenarios import BaseScenario, StochasticNoiseScenario
+from .engine import run_simulation, _capacity_limits
+
+
+ScenarioFactory = Callable[[np.random.Generator], BaseScenario]
+
+# Breach type for paths aborted by an AdmissibilityError
+ADMISSIBILITY_ERROR = "admissibility-error"
+
+
+class NoiseScenarioFactory:
+    """
+    Picklable scenario factory for Monte Carlo runs:
+        factory(rng) -> StochasticNoiseScenario(sigma, rng=rng)
+    """
+
+    def __init__(self, sigma: float):
+        self.sigma = sigma
+
+    def __call__(self, rng: np.random.Generator) -> StochasticNoiseScenario:
+        return StochasticNoiseScenario(self.sigma, rng=rng)
+
+
+@dataclass
+class MonteCarloResult:
+    """
+    Aggregated output of a Monte Carlo run.
+
+        n_paths          — number of simulated paths
+        breach_count     — paths with a breach
+        breach_types     — breach count per breach type; paths aborted by
+                           an AdmissibilityError count as
+                           "admissibility-error"
+        breach_step_hist — (horizon+1,) number of engine breaches at each step
+        alive            — (horizon+1,) paths with a recorded point at t
+        fxi_mean         — (horizon+1,) mean FXI(t) over alive paths
+        fxi_bin_edges    — (bins+1,) edges of the FXI histogram
+        fxi_hist         — (horizon+1, bins) FXI(t) counts per bin
+    """
+    n_paths: int
+    breach_count: int
+    breach_types: Dict[str, int]
+    breach_step_hist: np.ndarray
+    alive: np.ndarray
+    fxi_mean: np.ndarray
+    fxi_bin_edges: np.ndarray
+    fxi_hist: np.ndarray
+
+    @property
+    def breach_probability(self) -> float:
+        return self.breach_count / self.n_paths
+
+    def fxi_percentiles(self, q: Sequence[float]) -> np.ndarray:
+        """
+        FXI(t) percentile bands, shape (len(q), horizon+1).
+
+        q are percentiles in [0, 100]. Values are linearly interpolated
+        within histogram bins, so the resolution is one bin width.
+        Steps without alive paths are NaN.
+        """
+        q = np.asarray(q, dtype=np.float64) / 100.0
+        cum = np.cumsum(self.fxi_hist, axis=1)
+        edges = self.fxi_bin_edges
+        out = np.full((len(q), cum.shape[0]), np.nan)
+
+        for t in range(cum.shape[0]):
+            total = cum[t, -1]
+            if total == 0:
+                continue
+            targets = q * total
+            k = np.searchsorted(cum[t], targets, side="left")
+            k = np.minimum(k, len(edges) - 2)
+            below = np.where(k > 0, cum[t, k - 1], 0)
+            in_bin = self.fxi_hist[t, k]
+            frac = np.divide(targets - below, in_bin,
+                             out=np.zeros_like(targets), where=in_bin > 0)
+            out[:, t] = edges[k] + frac * (edges[k + 1] - edges[k])
+        return out
+
+
+def _sparse_hist(hist: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Occupied cells of a (steps, bins) count array, row-compressed:
+    (indptr, bin indices, counts), cells of step t at indptr[t]:indptr[t+1].
+    """
+    steps, cols = np.nonzero(hist)
+    indptr = np.searchsorted(steps, np.arange(hist.shape[0] + 1))
+    return (indptr.astype(np.min_scalar_type(len(steps))),
+            cols.astype(np.min_scalar_type(hist.shape[1] - 1)),
+            hist[steps, cols])
+
+
+def _run_chunk(task: tuple) -> Dict[str, Any]:
+    """
+    Worker: simulate paths [start, stop) and return their aggregates.
+    """
+    (initial_state, operator, scenario_factory, horizon, config,
+     entropy, start, stop, edges) = task
+
+    bins = len(edges) - 1
+    breach_step_hist = np.zeros(horizon + 1, dtype=np.int64)
+    alive = np.zeros(horizon + 1, dtype=np.int64)
+    fxi_sum = np.zeros(horizon + 1)
+    fxi_hist = np.zeros((horizon + 1, bins), dtype=np.min_scalar_type(stop - start))
+    breach_types: Dict[str, int] = {}
+    rows = np.arange(horizon + 1)
+
+    for i in range(start, stop):
+        # i-th child of SeedSequence(entropy), without spawning all children
+        seq = np.random.SeedSequence(entropy, spawn_key=(i,))
+        scenario = scenario_factory(np.random.default_rng(seq))
+        try:
+            result = run_simulation(initial_state, operator, scenario, horizon, config,
+                                    columnar=True, record="scalars-only")
+        except AdmissibilityError:
+            # state left the admissible domain (State.validate); the step is
+            # not known, so the path counts as a breach without a trajectory
+            breach_types[ADMISSIBILITY_ERROR] = breach_types.get(ADMISSIBILITY_ERROR, 0) + 1
+            continue
+
+        n = len(result.fxi)
+        alive[:n] += 1
+        fxi_sum[:n] += result.fxi
+        k = np.clip(np.searchsorted(edges, result.fxi, side="right") - 1, 0, bins - 1)
+        np.add.at(fxi_hist, (rows[:n], k), 1)
+
+        if result.breach_occurred:
+            breach_step_hist[result.breach_step] += 1
+            breach_types[result.breach_type] = breach_types.get(result.breach_type, 0) + 1
+
+    return {
+        "breach_step_hist": breach_step_hist,
+        "alive": alive,
+        "fxi_sum": fxi_sum,
+        "fxi_hist": _sparse_hist(fxi_hist),
+        "breach_types": breach_types,
+    }
+
+
+def run_monte_carlo(
+    initial_state: State,
+    operator: BaseOperator,
+    scenario_factory: ScenarioFactory,
+    horizon: int,
+    n_paths: int,
+    seed: int,
+    config: Optional[dict] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 256,
+    bins: int = 512
+) -> MonteCarloResult:
+    """
+    Run `n_paths` independent stochastic FRE paths and aggregate them.
+
+    Parameters:
+        initial_state    — starting structural state S0 (shared by all paths)
+        operator         — corrective operator E
+        scenario_factory — callable(rng) -> fresh scenario for one path;
+                           must be picklable when workers > 1
+                           (e.g. NoiseScenarioFactory(sigma))
+        horizon          — number of steps per path
+        n_paths          — number of paths M
+        seed             — master seed of the SeedSequence
+        config           — optional engine config (see run_simulation)
+        workers          — number of worker processes; None or 1 runs
+                           in the current process
+        chunk_size       — paths per task (part of the reproducibility key)
+        bins             — FXI histogram bins over [fxi_min, fxi_max]
+
+    Returns:
+        MonteCarloResult with breach statistics and FXI bands.
+    """
+    if horizon <= 0:
+        raise ValueError("horizon must be positive")
+    if n_paths <= 0:
+        raise ValueError("n_paths must be positive")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    _, fxi_min, fxi_max = _capacity_limits(config or {}, initial_state)
+    edges = np.linspace(fxi_min, fxi_max, bins + 1)
+    entropy = np.random.SeedSequence(seed).entropy
+
+    tasks = [
+        (initial_state, operator, scenario_factory, horizon, config,
+         entropy, start, min(start + chunk_size, n_paths), edges)
+        for start in range(0, n_paths, chunk_size)
+    ]
+
+    if workers is None or workers <= 1:
+        chunks = list(map(_run_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_run_chunk, tasks))
+
+    # Combine in chunk order (float sums are order-sensitive)
+    breach_step_hist = np.zeros(horizon + 1, dtype=np.int64)
+    alive = np.zeros(horizon + 1, dtype=np.int64)
+    fxi_sum = np.zeros(horizon + 1)
+    fxi_hist = np.zeros((horizon + 1, bins), dtype=np.int64)
+    steps = np.arange(horizon + 1)
+    breach_types: Dict[str, int] = {}
+    for chunk in chunks:
+        breach_step_hist += chunk["breach_step_hist"]
+        alive += chunk["alive"]
+        fxi_sum += chunk["fxi_sum"]
+        indptr, cols, counts = chunk["fxi_hist"]
+        fxi_hist[np.repeat(steps, np.diff(indptr)), cols] += counts
+        for name, count in chunk["breach_types"].items():
+            breach_types[name] = breach_types.get(name, 0) + count
+
+    fxi_mean = np.divide(fxi_sum, alive, out=np.full(horizon + 1, np.nan), where=alive > 0)
+
+    return MonteCarloResult(
+        n_paths=n_paths,
+        breach_count=sum(breach_types.values()),
+        breach_types=dict(sorted(breach_types.items())),
+        breach_step_hist=breach_step_hist,
+        alive=alive,
+        fxi_mean=fxi_mean,
+        fxi_bin_edges=edges,
+        fxi_hist=fxi_hist,
+    )
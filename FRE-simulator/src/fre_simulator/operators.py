@@ -32,6 +32,11 @@ corrective rule and serves as the reference operator used in:
 - validation tests,
 - baseline experiments.
 
+Nonlinear operators of the admissible classes (Specification Sections 8,
+29 and 46) are provided as SaturatingOperator, PiecewiseLinearOperator,
+DegradingOperator and MemoryOperator, each with a scalar apply() and an
+equivalent NumPy apply_batch() kernel for the batch engine.
+
 Additional operators may be defined as extensions, provided they follow
 the same structural constraints.
 """
@@ -39,8 +44,14 @@ the same structural constraints.
 # operators.py
 # Corrective operators for FRE Simulator V2.0
 # Implements FXI update rules, contractivity κ, and operator base class.
+# Linear, saturating, piecewise-linear, degrading and memory-regulated operators.
 
+import bisect
+import math
 from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
 
 
 class BaseOperator:
@@ -49,6 +60,12 @@ class BaseOperator:
     All operators must implement:
       - apply(fxi): returns next FXI value
       - kappa(prev_fxi, next_fxi): computes contractivity coefficient κ
+
+    Batch engines additionally call:
+      - apply_batch(fxi): next FXI for an array of FXI values
+      - kappa_batch(prev_fxi, next_fxi): κ for arrays of FXI values
+    The base implementations are correct for any operator; subclasses
+    override them with vectorized kernels.
     """
 
     def apply(self, fxi: float) -> float:
@@ -66,6 +83,38 @@ class BaseOperator:
             return 0.0
         return numerator / denominator
 
+    def linear_coefficient(self):
+        """
+        Contraction factor α if the operator acts as
+            FXI(t+1) = 1 + α ⋅ (FXI(t) − 1),   0 ≤ α < 1
+        on the whole admissible range (no clipping), otherwise None.
+
+        Used by the engine's closed-form fast path. Non-linear operators
+        keep the default (None).
+        """
+        return None
+
+    def apply_batch(self, fxi: np.ndarray) -> np.ndarray:
+        """
+        Apply the operator to an array of FXI values.
+        Generic fallback: element-wise call of apply().
+        """
+        fxi = np.asarray(fxi, dtype=np.float64)
+        out = np.fromiter((self.apply(float(x)) for x in fxi.ravel()),
+                          dtype=np.float64, count=fxi.size)
+        return out.reshape(fxi.shape)
+
+    def kappa_batch(self, prev_fxi: np.ndarray, next_fxi: np.ndarray) -> np.ndarray:
+        """
+        Vectorized contractivity measure, identical to kappa() per element:
+            κ = |FXI(t+1) − 1| / |FXI(t) − 1|,   κ = 0 at exact equilibrium
+        """
+        numerator = np.abs(np.asarray(next_fxi, dtype=np.float64) - 1.0)
+        denominator = np.abs(np.asarray(prev_fxi, dtype=np.float64) - 1.0)
+        out = np.zeros(np.broadcast(numerator, denominator).shape)
+        np.divide(numerator, denominator, out=out, where=denominator != 0)
+        return out
+
 
 @dataclass
 class DefaultOperator(BaseOperator):
@@ -75,8 +124,8 @@ class DefaultOperator(BaseOperator):
         FXI(t+1) = 1 + α ⋅ (FXI(t) − 1)
     where 0 < α < 1 ensures contractivity.
 
-    This is a placeholder baseline operator.
-    More advanced nonlinear operators will be added later.
+    This is the baseline operator; nonlinear operators (saturating,
+    piecewise-linear, degrading, memory-regulated) are defined below.
     """
     alpha: float = 0.7  # contraction strength (default moderate correction)
 
@@ -97,3 +146,311 @@ class DefaultOperator(BaseOperator):
             next_fxi = self.FXI_MAX
 
         return next_fxi
+
+    def linear_coefficient(self):
+        """
+        α for 0 ≤ α < 1: the contraction stays between FXI(t) and 1,
+        so the clipping to [FXI_MIN, FXI_MAX] never activates.
+        """
+        if np.ndim(self.alpha) == 0 and 0.0 <= self.alpha < 1.0:
+            return float(self.alpha)
+        return None
+
+    def apply_batch(self, fxi: np.ndarray) -> np.ndarray:
+        """
+        Vectorized contraction with the same clipping as apply().
+        `alpha` may be a scalar or an array broadcastable against `fxi`.
+        """
+        next_fxi = 1.0 + self.alpha * (np.asarray(fxi, dtype=np.float64) - 1.0)
+        next_fxi = np.where(next_fxi < self.FXI_MIN, self.FXI_MIN, next_fxi)
+        next_fxi = np.where(next_fxi > self.FXI_MAX, self.FXI_MAX, next_fxi)
+        return next_fxi
+
+
+# ---------------------------------------------------------------------------
+# Nonlinear operators
+#
+# All act on the FXI deviation d = FXI − 1 and are odd in d, so they move
+# FXI toward 1 from either side without overshooting it:
+#
+#     FXI(t+1) = 1 + sign(d) ⋅ g(|d|),   0 ≤ g(|d|) ≤ |d|
+#
+# Each provides a scalar apply() and a NumPy apply_batch() computing the
+# same map; κ is the measured ratio |FXI(t+1) − 1| / |FXI(t) − 1| of
+# BaseOperator (kappa / kappa_batch).
+#
+# DegradingOperator and MemoryOperator carry state from step to step: the
+# scalar state advances with each apply() call, and a separate per-row
+# state array with each apply_batch() call (rows keep their positions, as
+# in run_simulation_batch). The engines (run_simulation, iter_simulation,
+# run_simulation_batch, run_vector_batch, FRESession) call reset() at the
+# start of each run, so one instance can be reused.
+# ---------------------------------------------------------------------------
+
+SATURATION_KINDS = ("tanh", "rational")
+
+
+@dataclass
+class SaturatingOperator(BaseOperator):
+    """
+    Operator saturation (Specification Sections 29, 46): the correction
+    grows linearly near equilibrium and saturates at `limit`.
+
+        c(d) = L ⋅ tanh((1 − α) ⋅ d / L)              kind="tanh"
+        c(d) = (1 − α) ⋅ d / (1 + (1 − α) ⋅ |d| / L)  kind="rational"
+        FXI(t+1) = 1 + d − c(d)
+
+    Near d = 0 this is DefaultOperator's contraction α; for |d| ≫ L the
+    correction tends to L (E_max), so κ → 1 (saturation-induced
+    contraction failure). (A logistic correction 2σ(2x) − 1 equals tanh x.)
+    """
+    alpha: float = 0.7
+    limit: float = 0.2
+    kind: str = "tanh"
+
+    def __post_init__(self):
+        if not 0.0 <= self.alpha < 1.0:
+            raise ValueError(f"alpha must be in [0, 1), got {self.alpha}")
+        if self.limit <= 0.0:
+            raise ValueError(f"limit must be positive, got {self.limit}")
+        if self.kind not in SATURATION_KINDS:
+            raise ValueError(f"kind must be one of {SATURATION_KINDS}, got {self.kind!r}")
+
+    def apply(self, fxi: float) -> float:
+        d = fxi - 1.0
+        gain = 1.0 - self.alpha
+        if self.kind == "tanh":
+            correction = self.limit * math.tanh(gain * d / self.limit)
+        else:
+            correction = gain * d / (1.0 + gain * abs(d) / self.limit)
+        return 1.0 + (d - correction)
+
+    def apply_batch(self, fxi: np.ndarray) -> np.ndarray:
+        d = np.asarray(fxi, dtype=np.float64) - 1.0
+        gain = 1.0 - self.alpha
+        if self.kind == "tanh":
+            correction = self.limit * np.tanh(gain * d / self.limit)
+        else:
+            correction = gain * d / (1.0 + gain * np.abs(d) / self.limit)
+        return 1.0 + (d - correction)
+
+
+@dataclass
+class PiecewiseLinearOperator(BaseOperator):
+    """
+    Piecewise-linear contraction of |d| with breakpoints b₀ < b₁ < … and
+    slopes s₀, s₁, … (one more slope than breakpoints):
+
+        g(|d|) = continuous, g(0) = 0, slope sₖ on [bₖ₋₁, bₖ]
+
+    A first slope of 1 is a dead band: deviations up to b₀ are not
+    corrected. Slopes must lie in [0, 1].
+
+    Example — dead band of 0.02, then α = 0.6, weaker (0.8) beyond 0.5:
+        PiecewiseLinearOperator(breakpoints=(0.02, 0.5), slopes=(1.0, 0.6, 0.8))
+    """
+    breakpoints: Tuple[float, ...] = (0.02,)
+    slopes: Tuple[float, ...] = (1.0, 0.7)
+
+    def __post_init__(self):
+        self.breakpoints = tuple(float(b) for b in self.breakpoints)
+        self.slopes = tuple(float(s) for s in self.slopes)
+        if len(self.slopes) != len(self.breakpoints) + 1:
+            raise ValueError(f"{len(self.breakpoints)} breakpoints need "
+                             f"{len(self.breakpoints) + 1} slopes, got {len(self.slopes)}")
+        b = self.breakpoints
+        if any(x <= 0.0 for x in b) or any(y <= x for x, y in zip(b, b[1:])):
+            raise ValueError(f"breakpoints must be positive and increasing, got {b}")
+        if any(not 0.0 <= s <= 1.0 for s in self.slopes):
+            raise ValueError(f"slopes must lie in [0, 1], got {self.slopes}")
+        # g at 0 and at each breakpoint
+        knots = [0.0]
+        for k, x in enumerate(b):
+            knots.append(knots[-1] + self.slopes[k] * (x - (b[k - 1] if k else 0.0)))
+        self._x = np.array((0.0,) + b)
+        self._y = np.array(knots)
+        self._s = np.array(self.slopes)
+
+    def apply(self, fxi: float) -> float:
+        d = fxi - 1.0
+        r = abs(d)
+        k = bisect.bisect_left(self.breakpoints, r)
+        start = self.breakpoints[k - 1] if k else 0.0
+        g = float(self._y[k]) + self.slopes[k] * (r - start)
+        return 1.0 + math.copysign(g, d)
+
+    def apply_batch(self, fxi: np.ndarray) -> np.ndarray:
+        d = np.asarray(fxi, dtype=np.float64) - 1.0
+        r = np.abs(d)
+        k = np.searchsorted(self._x[1:], r, side="left")
+        g = self._y[k] + self._s[k] * (r - self._x[k])
+        return 1.0 + np.copysign(g, d)
+
+
+@dataclass
+class DegradingOperator(BaseOperator):
+    """
+    Contraction driven by a degrading viability κ_v (as in
+    demos/fre_collapse_boundary.py):
+
+        FXI(t+1)  = 1 + k_base ⋅ κ_v ⋅ (FXI(t) − 1)
+        κ_v      ← max(κ_v − degrade, 0)        after each step
+
+    κ_v reaching 0 is the viability (collapse) boundary; `viability` and
+    `collapsed` report the scalar state, `batch_viability` the per-row
+    state of apply_batch. Reset by the engines at the start of each run.
+    """
+    k_base: float = 0.4
+    kappa0: float = 0.8
+    degrade: float = 0.03
+
+    def __post_init__(self):
+        if not 0.0 <= self.k_base * self.kappa0 < 1.0:
+            raise ValueError("k_base ⋅ kappa0 must be in [0, 1)")
+        if self.kappa0 < 0.0 or self.degrade < 0.0:
+            raise ValueError("kappa0 and degrade must be non-negative")
+        self.reset()
+
+    def reset(self):
+        """Restore the initial viability (scalar and batch state)."""
+        self.viability = float(self.kappa0)
+        self.batch_viability: Optional[np.ndarray] = None
+
+    @property
+    def collapsed(self) -> bool:
+        return self.viability == 0.0
+
+    def apply(self, fxi: float) -> float:
+        k = self.k_base * self.viability
+        self.viability = max(self.viability - self.degrade, 0.0)
+        return 1.0 + k * (fxi - 1.0)
+
+    def apply_batch(self, fxi: np.ndarray) -> np.ndarray:
+        fxi = np.asarray(fxi, dtype=np.float64)
+        if self.batch_viability is None or self.batch_viability.shape != fxi.shape:
+            self.batch_viability = np.full(fxi.shape, float(self.kappa0))
+        k = self.k_base * self.batch_viability
+        np.maximum(self.batch_viability - self.degrade, 0.0, out=self.batch_viability)
+        return 1.0 + k * (fxi - 1.0)
+
+
+@dataclass
+class MemoryOperator(BaseOperator):
+    """
+    Memory-regulated correction G_M: accumulated structural memory M
+    (irreversible load) weakens the contraction without removing it.
+
+        M        ← decay ⋅ M + load ⋅ |FXI(t) − 1|       (before each step)
+        k(M)     = 1 − (1 − α) / (1 + β ⋅ M)
+        FXI(t+1) = 1 + k(M) ⋅ (FXI(t) − 1)
+
+    k starts at α for M = 0 and approaches 1 as memory builds up, but
+    stays below 1 (memory does not destroy reversibility). decay = 1
+    keeps all memory. `memory` is the scalar state, `batch_memory` the
+    per-row state of apply_batch. Reset by the engines at the start of
+    each run.
+    """
+    alpha: float = 0.5
+    beta: float = 5.0
+    load: float = 1.0
+    decay: float = 1.0
+    memory0: float = 0.0
+
+    def __post_init__(self):
+        if not 0.0 <= self.alpha < 1.0:
+            raise ValueError(f"alpha must be in [0, 1), got {self.alpha}")
+        if self.beta < 0.0 or self.load < 0.0 or self.memory0 < 0.0:
+            raise ValueError("beta, load and memory0 must be non-negative")
+        if not 0.0 <= self.decay <= 1.0:
+            raise ValueError(f"decay must be in [0, 1], got {self.decay}")
+        self.reset()
+
+    def reset(self):
+        """Restore the initial memory (scalar and batch state)."""
+        self.memory = float(self.memory0)
+        self.batch_memory: Optional[np.ndarray] = None
+
+    def apply(self, fxi: float) -> float:
+        d = fxi - 1.0
+        self.memory = self.decay * self.memory + self.load * abs(d)
+        k = 1.0 - (1.0 - self.alpha) / (1.0 + self.beta * self.memory)
+        return 1.0 + k * d
+
+    def apply_batch(self, fxi: np.ndarray) -> np.ndarray:
+        d = np.asarray(fxi, dtype=np.float64) - 1.0
+        if self.batch_memory is None or self.batch_memory.shape != d.shape:
+            self.batch_memory = np.full(d.shape, float(self.memory0))
+        self.batch_memory = self.decay * self.batch_memory + self.load * np.abs(d)
+        k = 1.0 - (1.0 - self.alpha) / (1.0 + self.beta * self.batch_memory)
+        return 1.0 + k * d
+
+
+class MatrixOperator:
+    """
+    Matrix / affine corrective operator on the deviation vector Δ⃗ ∈ ℝᵈ:
+
+        E(Δ⃗) = K ⋅ Q ⋅ Δ⃗ + b
+
+    Parameters:
+        K — contraction: scalar, (d,) diagonal or (d, d) matrix
+        Q — optional (d, d) mixing matrix (e.g. an orthogonal permutation
+            coupling the axes); identity if None
+        b — optional (d,) offset (affine operator); zero if None
+
+    The operator acts on one vector (d,) or a batch (B, d); a batch costs
+    one matmul. Used by the vector batch engine (run_vector_batch).
+    """
+
+    def __init__(self, K, Q=None, b=None, dim=None):
+        K = np.asarray(K, dtype=np.float64)
+        if dim is None:
+            if K.ndim > 0:
+                dim = K.shape[0]
+            elif Q is not None:
+                dim = np.shape(Q)[0]
+            elif b is not None:
+                dim = np.shape(b)[0]
+            else:
+                raise ValueError("dim is required for a scalar K without Q or b")
+        d = int(dim)
+
+        if K.ndim == 0:
+            K_matrix = float(K) * np.eye(d)
+        elif K.shape == (d,):
+            K_matrix = np.diag(K)
+        elif K.shape == (d, d):
+            K_matrix = K
+        else:
+            raise ValueError(f"K must be a scalar, ({d},) or ({d}, {d}), got shape {K.shape}")
+
+        if Q is not None:
+            Q = np.asarray(Q, dtype=np.float64)
+            if Q.shape != (d, d):
+                raise ValueError(f"Q must have shape ({d}, {d}), got {Q.shape}")
+        if b is not None:
+            b = np.asarray(b, dtype=np.float64)
+            if b.shape != (d,):
+                raise ValueError(f"b must have shape ({d},), got {b.shape}")
+
+        self.dim = d
+        self.K = K
+        self.Q = Q
+        self.b = b
+        # M = K ⋅ Q, applied to row vectors as Δ ⋅ Mᵀ
+        self.matrix = K_matrix if Q is None else K_matrix @ Q
+        self._matrix_t = np.ascontiguousarray(self.matrix.T)
+
+    def apply_vector(self, delta: np.ndarray) -> np.ndarray:
+        """E(Δ⃗) for one vector (d,) or a batch (B, d)."""
+        out = np.asarray(delta, dtype=np.float64) @ self._matrix_t
+        if self.b is not None:
+            out += self.b
+        return out
+
+    def jacobian(self, delta=None) -> np.ndarray:
+        """∂E/∂Δ⃗ = K ⋅ Q, the same (d, d) matrix for every Δ⃗."""
+        return self.matrix
+
+    def __repr__(self):
+        b = None if self.b is None else self.b.tolist()
+        return f"MatrixOperator(matrix={self.matrix.tolist()!r}, b={b!r})"
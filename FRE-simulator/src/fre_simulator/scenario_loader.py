@@ -0,0 +1,423 @@
+"""
+Scenario Loader Module — FRE Simulator V2.0
+===========================================
+
+This module defines a **declarative scenario format** (plain dicts / JSON)
+and a loader that compiles each definition once into an executable
+scenario.
+
+Format (every section optional):
+
+    {
+      "name":     "level1_soft",
+      "validate": false,
+      "events": [ {"t": 5, "shift": {"qp": 0.2}, "scale": {...}, "set": {...}} ],
+      "ramps":  [ {"start": 3, "end": 9, "scale": {"qf": 0.9}} ],
+      "bands":  [ {"start": 3, "end": 117, "every": 3,
+                   "pattern": [{"m": 0.005}, {"m": -0.004}]} ],
+      "drift":  [ {"attr": "m_ref", "base": 1.0, "amplitude": 0.03,
+                   "period": 60, "phase": 0.0, "start": 1, "end": 120} ],
+      "noise":  [ {"attr": "qp", "sigma": 0.001, "probability": 1.0,
+                   "start": 1, "end": null} ]
+    }
+
+    events — one-off updates at step t
+    ramps  — the same update on every step of [start, end]
+             (e.g. the progressive qf ← qf ⋅ (1 − α) shock)
+    bands  — periodic updates at start, start + every, … ≤ end; a "pattern"
+             cycles through a list of shifts, a "shift"/"scale"/"set" repeats
+    drift  — reference drift: attr ← base + amplitude ⋅ sin(2π t/period + phase)
+             on every step of [start, end]
+    noise  — attr += N(0, sigma) on every step of [start, end], each with
+             the given probability
+
+Updates are {attribute: value} mappings; values are numbers or lists (for
+vector attributes such as VectorState.x). Within a step, updates of all
+sections are merged as in CompiledScenario: sets (drift first, later
+entries win), then scales (multiplied), then shifts (summed in listed
+order); noise is drawn last. "validate" calls state.compute_delta() and
+state.validate() after each event, as the 5D stress levels do.
+
+Compilation:
+    The deterministic sections become one CompiledScenario (sparse event
+    table). Compiled programs are cached by the SHA-256 of the canonical
+    JSON of the definition, so repeated loads of the same definition skip
+    parsing and compilation. A drift, ramp or band without "end" runs to
+    the horizon, which must then be given (and becomes part of the cache
+    key).
+
+Named scenarios (the JSON spec's "scenario" field) resolve through a
+registry, see register_scenario(); "empty" is built in.
+"""
+
+# scenario_loader.py
+# Declarative scenario definitions, compilation and content-hash cache
+# for FRE Simulator V2.0.
+
+import hashlib
+import json
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from .scenarios import BaseScenario, CompiledScenario
+
+
+SECTIONS = ("events", "ramps", "bands", "drift", "noise")
+
+# Compiled programs kept by the loader (least recently used are evicted)
+CACHE_SIZE = 256
+
+Definition = Union[str, Mapping[str, Any]]
+
+
+class NoiseSpec(NamedTuple):
+    """Gaussian noise on one attribute over steps [start, end] (end None: open)."""
+    attr: str
+    sigma: Any
+    probability: float
+    start: int
+    end: Optional[int]
+
+
+@dataclass(frozen=True)
+class ScenarioProgram:
+    """
+    Compiled form of a definition.
+
+        digest — content hash of the canonical definition
+        name   — "name" of the definition, if any
+        table  — deterministic part as a CompiledScenario (shared, read-only)
+        noise  — noise specs, drawn per run
+    """
+    digest: str
+    name: Optional[str]
+    table: CompiledScenario
+    noise: Tuple[NoiseSpec, ...]
+
+    @property
+    def deterministic(self) -> bool:
+        return not self.noise
+
+    def scenario(self, seed: Optional[int] = None, rng=None) -> BaseScenario:
+        """
+        Executable scenario: the shared table itself if deterministic,
+        otherwise a fresh CompiledNoiseScenario with its own random stream.
+        """
+        if self.deterministic:
+            return self.table
+        if rng is not None:
+            return CompiledNoiseScenario(self.table, self.noise, rng)
+        return CompiledNoiseScenario(self.table, self.noise, np.random.default_rng(seed), seed)
+
+
+class CompiledNoiseScenario(BaseScenario):
+    """
+    Compiled event table followed by Gaussian noise updates.
+
+    Parameters:
+        table — deterministic CompiledScenario (may be shared)
+        noise — sequence of NoiseSpec
+        rng   — numpy.random.Generator of this run
+        seed  — seed of rng, if it was created from one (identifies the
+                stream, e.g. for result caching)
+    """
+
+    def __init__(self, table: CompiledScenario, noise, rng, seed: Optional[int] = None):
+        self.table = table
+        self.noise = tuple(noise)
+        self.seed = seed
+        self._rng = rng
+
+    def _active(self, t: int):
+        return [spec for spec in self.noise
+                if spec.start <= t and (spec.end is None or t <= spec.end)]
+
+    def next_event(self, t: int) -> Optional[int]:
+        candidates = [max(t, spec.start) for spec in self.noise
+                      if spec.end is None or t <= spec.end]
+        table_next = self.table.next_event(t)
+        if table_next is not None:
+            candidates.append(table_next)
+        return min(candidates) if candidates else None
+
+    def apply(self, state, t: int):
+        state = self.table.apply(state, t)
+        noisy = False
+        for spec in self._active(t):
+            if spec.probability < 1.0 and self._rng.random() >= spec.probability:
+                continue
+            setattr(state, spec.attr, getattr(state, spec.attr) + self._rng.normal(0.0, spec.sigma))
+            noisy = True
+        if noisy and self.table.validate:
+            state.compute_delta()
+            state.validate()
+        return state
+
+    def apply_batch(self, states, t: int):
+        states = self.table.apply_batch(states, t)
+        for spec in self._active(t):
+            column = getattr(states, spec.attr)
+            eps = self._rng.normal(0.0, spec.sigma, size=column.shape)
+            if spec.probability < 1.0:
+                eps[self._rng.random(column.shape[0]) >= spec.probability] = 0.0
+            setattr(states, spec.attr, column + eps)
+        return states
+
+
+# ---------------------------------------------------------
+# Canonical form and hashing
+# ---------------------------------------------------------
+
+def canonical_json(obj: Any) -> str:
+    """Canonical JSON text (sorted keys, no whitespace) of a definition."""
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), allow_nan=False)
+
+
+def definition_digest(definition: Mapping[str, Any]) -> str:
+    """SHA-256 hex digest of the canonical JSON of a definition."""
+    return hashlib.sha256(canonical_json(definition).encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------
+
+_UPDATE_KINDS = ("set", "scale", "shift")
+
+
+def _value(value):
+    if isinstance(value, (list, tuple)):
+        return np.asarray(value, dtype=np.float64)
+    return float(value)
+
+
+def _check_keys(entry: Mapping[str, Any], allowed, where: str):
+    unknown = set(entry) - set(allowed)
+    if unknown:
+        raise ValueError(f"{where}: unknown keys {sorted(unknown)}")
+
+
+def _window(entry: Mapping[str, Any], where: str, horizon: Optional[int]):
+    start = int(entry.get("start", 1))
+    end = entry.get("end")
+    if end is None:
+        if horizon is None:
+            raise ValueError(f"{where}: open-ended (no 'end'), a horizon is required")
+        end = horizon
+    end = int(end)
+    if start < 1 or end < start:
+        raise ValueError(f"{where}: need 1 <= start <= end, got [{start}, {end}]")
+    return start, end
+
+
+class _Schedule:
+    """Accumulates per-step updates before building the CompiledScenario."""
+
+    def __init__(self):
+        self.steps = {kind: {} for kind in _UPDATE_KINDS}
+
+    def add(self, t: int, update: Mapping[str, Mapping[str, Any]]):
+        for kind in _UPDATE_KINDS:
+            for name, value in update.get(kind, {}).items():
+                value = _value(value)
+                step = self.steps[kind].setdefault(t, {})
+                if name not in step or kind == "set":
+                    step[name] = value
+                elif kind == "scale":
+                    step[name] = step[name] * value
+                else:
+                    step[name] = step[name] + value
+
+    def compile(self, validate: bool) -> CompiledScenario:
+        return CompiledScenario.from_events(
+            sets=self.steps["set"], scales=self.steps["scale"], shifts=self.steps["shift"],
+            validate=validate,
+        )
+
+
+def _updates(entry: Mapping[str, Any], where: str):
+    update = {kind: entry[kind] for kind in _UPDATE_KINDS if kind in entry}
+    for kind, values in update.items():
+        if not isinstance(values, Mapping):
+            raise ValueError(f"{where}: '{kind}' must map attributes to values")
+    return update
+
+
+def compile_definition(definition: Mapping[str, Any],
+                       horizon: Optional[int] = None) -> ScenarioProgram:
+    """
+    Compile a declarative definition (see module docstring) without caching.
+
+    Raises:
+        ValueError — malformed definition
+    """
+    _check_keys(definition, ("name", "validate", "version") + SECTIONS, "scenario")
+    schedule = _Schedule()
+
+    for i, entry in enumerate(definition.get("drift", ())):
+        where = f"drift[{i}]"
+        _check_keys(entry, ("attr", "base", "amplitude", "period", "phase", "start", "end"), where)
+        start, end = _window(entry, where, horizon)
+        base = float(entry.get("base", 1.0))
+        amplitude = float(entry["amplitude"])
+        period = float(entry["period"])
+        phase = float(entry.get("phase", 0.0))
+        if period <= 0.0:
+            raise ValueError(f"{where}: period must be positive")
+        for t in range(start, end + 1):
+            value = base + amplitude * math.sin(2.0 * math.pi * (t / period) + phase)
+            schedule.add(t, {"set": {entry["attr"]: value}})
+
+    for i, entry in enumerate(definition.get("events", ())):
+        where = f"events[{i}]"
+        _check_keys(entry, ("t",) + _UPDATE_KINDS, where)
+        if int(entry["t"]) < 1:
+            raise ValueError(f"{where}: t must be >= 1")
+        schedule.add(int(entry["t"]), _updates(entry, where))
+
+    for i, entry in enumerate(definition.get("ramps", ())):
+        where = f"ramps[{i}]"
+        _check_keys(entry, ("start", "end") + _UPDATE_KINDS, where)
+        start, end = _window(entry, where, horizon)
+        update = _updates(entry, where)
+        for t in range(start, end + 1):
+            schedule.add(t, update)
+
+    for i, entry in enumerate(definition.get("bands", ())):
+        where = f"bands[{i}]"
+        _check_keys(entry, ("start", "end", "every", "pattern") + _UPDATE_KINDS, where)
+        start, end = _window(entry, where, horizon)
+        every = int(entry.get("every", 1))
+        if every < 1:
+            raise ValueError(f"{where}: every must be >= 1")
+        if "pattern" in entry:
+            pattern = [{"shift": shift} for shift in entry["pattern"]]
+            if not pattern:
+                raise ValueError(f"{where}: empty pattern")
+        else:
+            pattern = [_updates(entry, where)]
+        for k, t in enumerate(range(start, end + 1, every)):
+            schedule.add(t, pattern[k % len(pattern)])
+
+    noise = []
+    for i, entry in enumerate(definition.get("noise", ())):
+        where = f"noise[{i}]"
+        _check_keys(entry, ("attr", "sigma", "probability", "start", "end"), where)
+        start = int(entry.get("start", 1))
+        end = entry.get("end")
+        sigma = _value(entry["sigma"])
+        probability = float(entry.get("probability", 1.0))
+        if np.any(np.asarray(sigma) < 0.0) or not 0.0 < probability <= 1.0:
+            raise ValueError(f"{where}: need sigma >= 0 and 0 < probability <= 1")
+        noise.append(NoiseSpec(entry["attr"], sigma, probability, start,
+                               None if end is None else int(end)))
+
+    return ScenarioProgram(
+        digest=definition_digest(definition),
+        name=definition.get("name"),
+        table=schedule.compile(bool(definition.get("validate", False))),
+        noise=tuple(noise),
+    )
+
+
+# ---------------------------------------------------------
+# Registry and cached loading
+# ---------------------------------------------------------
+
+SCENARIO_LIBRARY: Dict[str, Dict[str, Any]] = {
+    "empty": {"name": "empty"},
+}
+
+_PROGRAMS: "OrderedDict[Tuple[str, Optional[int]], ScenarioProgram]" = OrderedDict()
+_TEXT_DIGESTS: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _open_ended(definition: Mapping[str, Any]) -> bool:
+    """True if the compiled table depends on the horizon."""
+    return any(entry.get("end") is None for section in ("drift", "ramps", "bands")
+               for entry in definition.get(section, ()))
+
+
+def register_scenario(name: str, definition: Mapping[str, Any]) -> None:
+    """
+    Register a named definition (e.g. "level3_critical") for load_scenario.
+    Definitions that do not depend on the horizon are compiled once here
+    to validate them.
+    """
+    definition = json.loads(canonical_json(definition))   # detached, JSON-clean copy
+    definition.setdefault("name", name)
+    if not _open_ended(definition):
+        compile_definition(definition)
+    SCENARIO_LIBRARY[name] = definition
+
+
+def _remember(cache: OrderedDict, key, value):
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def load_program(source: Definition, horizon: Optional[int] = None) -> ScenarioProgram:
+    """
+    Compiled program of a definition, from the cache when possible.
+
+    `source` is a definition mapping, its JSON text, or a registered name.
+    """
+    definition = None
+    if isinstance(source, str):
+        text = source.strip()
+        if not text.startswith("{"):
+            if text not in SCENARIO_LIBRARY:
+                raise ValueError(f"unknown scenario {text!r}")
+            definition = SCENARIO_LIBRARY[text]
+            digest = definition_digest(definition)
+        elif text in _TEXT_DIGESTS:
+            digest = _TEXT_DIGESTS[text]
+            _TEXT_DIGESTS.move_to_end(text)
+        else:
+            definition = json.loads(text)
+            digest = definition_digest(definition)
+            _remember(_TEXT_DIGESTS, text, digest)
+    else:
+        definition = source
+        digest = definition_digest(definition)
+
+    for key in ((digest, None), (digest, horizon)):
+        program = _PROGRAMS.get(key)
+        if program is not None:
+            _PROGRAMS.move_to_end(key)
+            return program
+
+    if definition is None:
+        definition = json.loads(source)
+    key = (digest, horizon if _open_ended(definition) else None)
+    program = compile_definition(definition, horizon)
+    _remember(_PROGRAMS, key, program)
+    return program
+
+
+def load_scenario(source: Definition, horizon: Optional[int] = None,
+                  seed: Optional[int] = None, rng=None) -> BaseScenario:
+    """
+    Executable scenario for a definition, JSON text or registered name.
+
+    Deterministic definitions return the cached, shared CompiledScenario;
+    definitions with noise return a new CompiledNoiseScenario per call,
+    drawing from `rng` or numpy.random.default_rng(seed).
+
+    Example:
+        scenario = load_scenario({"events": [{"t": 5, "shift": {"qp": 0.2}}]})
+        result = run_simulation(state, operator, scenario, horizon=50)
+    """
+    return load_program(source, horizon).scenario(seed=seed, rng=rng)
+
+
+def clear_scenario_cache() -> None:
+    """Drop all cached compiled programs."""
+    _PROGRAMS.clear()
+    _TEXT_DIGESTS.clear()
@@ -35,10 +35,13 @@ baseline simulations, including the reference example included with FRE 2.0.
 # Implements deterministic and stochastic stress scenarios.
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from bisect import bisect_left
+from typing import Any, Dict, Mapping, Optional
 import random
 
-from .state import State
+import numpy as np
+
+from .state import State, StateBlock
 
 
 class BaseScenario(ABC):
@@ -60,6 +63,39 @@ class BaseScenario(ABC):
         """Apply scenario logic at time step t."""
         raise NotImplementedError
 
+    def next_event(self, t: int) -> Optional[int]:
+        """
+        First step s >= t at which apply() may modify the state,
+        or None if the scenario never acts again.
+
+        Steps before s are "quiet": the engine may skip calling apply()
+        on them. The default declares every step as a potential event.
+        """
+        return t
+
+    def compile(self) -> "CompiledScenario":
+        """
+        Export the shock schedule as a CompiledScenario (sparse event table).
+
+        Only deterministic scenarios whose shocks do not depend on the
+        state can be compiled; the default raises NotImplementedError.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} has no static shock schedule"
+        )
+
+    def apply_batch(self, states: StateBlock, t: int) -> StateBlock:
+        """
+        Apply scenario logic at time step t to every row of a StateBlock.
+
+        Used by the batch engine. Same in-place convention as apply().
+        Scenarios that cannot be expressed as column operations keep this
+        default and are rejected by the batch engine.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support batch evaluation"
+        )
+
 
 class EmptyScenario(BaseScenario):
     """
@@ -71,6 +107,15 @@ class EmptyScenario(BaseScenario):
         # no modification
         return state
 
+    def next_event(self, t: int) -> Optional[int]:
+        return None
+
+    def compile(self) -> "CompiledScenario":
+        return CompiledScenario([])
+
+    def apply_batch(self, states: StateBlock, t: int) -> StateBlock:
+        return states
+
 
 class SingleStepShockScenario(BaseScenario):
     """
@@ -85,29 +130,66 @@ class SingleStepShockScenario(BaseScenario):
         qp_shift    — additive change to qp at t0 (default 0.0)
         qf_shift    — additive change to qf at t0 (default 0.0)
         delta_shift — additive change to Δ at t0 (optional, default 0.0)
+        fxi_shift   — additive change to FXI at t0 (optional, default 0.0)
 
     Notes:
         - After modifying qp/qf, delta can be recomputed via state.compute_delta()
           in the engine if needed.
+        - For batch evaluation, t0 and the shifts may also be arrays with
+          one value per row (e.g. a parameter sweep); next_event() and the
+          scalar apply() require scalars.
     """
 
     def __init__(self,
                  t0: int,
                  qp_shift: float = 0.0,
                  qf_shift: float = 0.0,
-                 delta_shift: float = 0.0):
+                 delta_shift: float = 0.0,
+                 fxi_shift: float = 0.0):
         self.t0 = t0
         self.qp_shift = qp_shift
         self.qf_shift = qf_shift
         self.delta_shift = delta_shift
+        self.fxi_shift = fxi_shift
+
+    def next_event(self, t: int) -> Optional[int]:
+        return self.t0 if t <= self.t0 else None
+
+    def compile(self) -> "CompiledScenario":
+        if np.ndim(self.t0) != 0:
+            raise ValueError("per-row shock times cannot be compiled into one table")
+        shifts = {"qp": self.qp_shift, "qf": self.qf_shift,
+                  "delta": self.delta_shift, "fxi": self.fxi_shift}
+        return CompiledScenario([self.t0], shifts={
+            name: [value] for name, value in shifts.items() if np.any(value != 0.0)
+        })
 
     def apply(self, state: State, t: int) -> State:
         if t == self.t0:
             state.qp += self.qp_shift
             state.qf += self.qf_shift
             state.delta += self.delta_shift
+            state.fxi += self.fxi_shift
         return state
 
+    def apply_batch(self, states: StateBlock, t: int) -> StateBlock:
+        if np.ndim(self.t0) == 0:
+            if t == self.t0:
+                states.qp += self.qp_shift
+                states.qf += self.qf_shift
+                states.delta += self.delta_shift
+                states.fxi += self.fxi_shift
+            return states
+
+        # per-row shock times: shift only the rows shocked at t
+        hit = np.asarray(self.t0) == t
+        if hit.any():
+            states.qp += np.where(hit, self.qp_shift, 0.0)
+            states.qf += np.where(hit, self.qf_shift, 0.0)
+            states.delta += np.where(hit, self.delta_shift, 0.0)
+            states.fxi += np.where(hit, self.fxi_shift, 0.0)
+        return states
+
 
 class ProgressiveShockScenario(BaseScenario):
     """
@@ -135,11 +217,23 @@ class ProgressiveShockScenario(BaseScenario):
         self.t_end = t_end
         self.alpha = alpha
 
+    def next_event(self, t: int) -> Optional[int]:
+        return max(t, self.t_start) if t <= self.t_end else None
+
+    def compile(self) -> "CompiledScenario":
+        times = np.arange(self.t_start, self.t_end + 1)
+        return CompiledScenario(times, scales={"qf": np.full(len(times), 1.0 - self.alpha)})
+
     def apply(self, state: State, t: int) -> State:
         if self.t_start <= t <= self.t_end:
             state.qf *= (1.0 - self.alpha)
         return state
 
+    def apply_batch(self, states: StateBlock, t: int) -> StateBlock:
+        if self.t_start <= t <= self.t_end:
+            states.qf *= (1.0 - self.alpha)
+        return states
+
 
 class StochasticNoiseScenario(BaseScenario):
     """
@@ -155,15 +249,214 @@ class StochasticNoiseScenario(BaseScenario):
     Parameters:
         sigma — standard deviation of noise
         seed  — random seed for reproducibility (optional)
+        rng   — explicit random stream (optional, overrides seed):
+                a random.Random or a numpy.random.Generator, e.g. one
+                spawned per path by the Monte Carlo runner
     """
 
-    def __init__(self, sigma: float, seed: Optional[int] = None):
+    def __init__(self, sigma: float, seed: Optional[int] = None, rng=None):
         if sigma <= 0:
             raise ValueError("sigma must be positive")
         self.sigma = sigma
-        self._rng = random.Random(seed) if seed is not None else random
+        self.seed = seed
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random
+        self._rng = rng
+        # numpy Generators draw with normal(), random.Random with normalvariate()
+        self._normal = getattr(rng, "normalvariate", None) or rng.normal
 
     def apply(self, state: State, t: int) -> State:
-        eps = self._rng.normalvariate(0.0, self.sigma)
+        eps = self._normal(0.0, self.sigma)
         state.qp += eps
         return state
+
+
+class VectorShockScenario(BaseScenario):
+    """
+    Single-step shock of a vector state at time t0.
+
+    Update rule (t = t0):
+        x ← x + shift
+
+    Parameters:
+        t0    — time step of the shock
+        shift — additive change to the configuration x, shape (d,)
+                (or (B, d) for one shift per row of a VectorBlock)
+
+    Works with VectorState (scalar engines) and VectorBlock
+    (run_vector_batch).
+    """
+
+    def __init__(self, t0: int, shift):
+        self.t0 = t0
+        self.shift = np.asarray(shift, dtype=np.float64)
+
+    def next_event(self, t: int) -> Optional[int]:
+        return self.t0 if t <= self.t0 else None
+
+    def compile(self) -> "CompiledScenario":
+        return CompiledScenario([self.t0], shifts={"x": self.shift[None]})
+
+    def apply(self, state, t: int):
+        if t == self.t0:
+            state.x = state.x + self.shift
+        return state
+
+    def apply_batch(self, states, t: int):
+        if t == self.t0:
+            states.x = states.x + self.shift
+        return states
+
+
+class CompiledScenario(BaseScenario):
+    """
+    Deterministic scenario stored as a sparse event table.
+
+    Row i of the table acts at step times[i] (sorted, unique) and, in this
+    order,
+        sets   — assigns attribute values (e.g. a reference shift m_ref)
+        scales — multiplies attributes (e.g. qf ← qf ⋅ (1 − α))
+        shifts — adds component deltas (e.g. L += −0.3, or x += Δx⃗)
+
+    Each of sets / scales / shifts maps an attribute name to an array whose
+    first axis runs over the table rows; entries may be scalars (one value
+    per row) or vectors (e.g. shifts of VectorState.x, shape (n, d)).
+    Neutral entries (shift 0, scale 1, set NaN) leave the attribute alone.
+
+    Step lookup is a dict access and next_event() a bisection, so engines
+    skip quiet steps without calling apply(), and the table is read-only,
+    so one compiled scenario can be shared by any number of runs and
+    batches.
+
+    Parameters:
+        times    — event steps
+        sets, scales, shifts — see above
+        validate — call state.compute_delta() and state.validate() after
+                   each event (as the 5D stress levels do); apply() only
+    """
+
+    def __init__(self,
+                 times,
+                 sets: Optional[Mapping[str, Any]] = None,
+                 scales: Optional[Mapping[str, Any]] = None,
+                 shifts: Optional[Mapping[str, Any]] = None,
+                 validate: bool = False):
+        times = np.asarray(times, dtype=np.int64).reshape(-1)
+        if np.any(np.diff(times) <= 0):
+            raise ValueError("times must be strictly increasing")
+        self.times = times
+        self.sets = self._columns(sets, len(times))
+        self.scales = self._columns(scales, len(times))
+        self.shifts = self._columns(shifts, len(times))
+        self.validate = validate
+
+        self._times = times.tolist()
+        self._rows = {t: self._actions(i) for i, t in enumerate(self._times)}
+
+    @staticmethod
+    def _columns(columns: Optional[Mapping[str, Any]], n: int) -> Dict[str, np.ndarray]:
+        out = {}
+        for name, values in (columns or {}).items():
+            values = np.array(values, dtype=np.float64)
+            if values.ndim == 0 or values.shape[0] != n:
+                raise ValueError(f"{name}: expected one entry per event ({n})")
+            values.setflags(write=False)
+            out[name] = values
+        return out
+
+    @staticmethod
+    def _value(value: np.ndarray):
+        return value.item() if value.ndim == 0 else value
+
+    def _actions(self, i: int):
+        """Non-neutral (kind, name, value) updates of table row i, in order."""
+        actions = []
+        for name, values in self.sets.items():
+            if not np.all(np.isnan(values[i])):
+                actions.append(("set", name, self._value(values[i])))
+        for name, values in self.scales.items():
+            if np.any(values[i] != 1.0):
+                actions.append(("scale", name, self._value(values[i])))
+        for name, values in self.shifts.items():
+            if np.any(values[i] != 0.0):
+                actions.append(("shift", name, self._value(values[i])))
+        return actions
+
+    @classmethod
+    def from_events(cls,
+                    sets: Optional[Mapping[int, Mapping[str, Any]]] = None,
+                    scales: Optional[Mapping[int, Mapping[str, Any]]] = None,
+                    shifts: Optional[Mapping[int, Mapping[str, Any]]] = None,
+                    validate: bool = False) -> "CompiledScenario":
+        """
+        Build the table from per-step mappings, e.g.
+
+            CompiledScenario.from_events(shifts={5: {"L": -0.3, "R": 0.3}})
+
+        Each argument maps a step t to {attribute: value}; steps may
+        appear in any of them.
+        """
+        events = (sets or {}, scales or {}, shifts or {})
+        times = sorted(set().union(*events))
+        index = {t: i for i, t in enumerate(times)}
+
+        def columns(by_step, neutral):
+            names = {}
+            for t, updates in by_step.items():
+                for name, value in updates.items():
+                    names.setdefault(name, {})[index[t]] = value
+            out = {}
+            for name, rows in names.items():
+                shape = np.shape(next(iter(rows.values())))
+                column = np.full((len(times),) + shape, neutral)
+                for i, value in rows.items():
+                    column[i] = value
+                out[name] = column
+            return out
+
+        return cls(times, sets=columns(events[0], np.nan), scales=columns(events[1], 1.0),
+                   shifts=columns(events[2], 0.0), validate=validate)
+
+    def __len__(self):
+        return len(self._times)
+
+    def compile(self) -> "CompiledScenario":
+        return self
+
+    def next_event(self, t: int) -> Optional[int]:
+        i = bisect_left(self._times, t)
+        return self._times[i] if i < len(self._times) else None
+
+    def apply(self, state, t: int):
+        actions = self._rows.get(t)
+        if actions is None:
+            return state
+        for kind, name, value in actions:
+            if kind == "set":
+                current = getattr(state, name)
+                if np.ndim(value):
+                    value = np.where(np.isnan(value), current, value)
+                setattr(state, name, value)
+            elif kind == "scale":
+                setattr(state, name, getattr(state, name) * value)
+            else:
+                setattr(state, name, getattr(state, name) + value)
+        if self.validate:
+            state.compute_delta()
+            state.validate()
+        return state
+
+    def apply_batch(self, states, t: int):
+        actions = self._rows.get(t)
+        if actions is None:
+            return states
+        for kind, name, value in actions:
+            column = getattr(states, name)
+            if kind == "set":
+                column = np.where(np.isnan(value), column, value)
+            elif kind == "scale":
+                column = column * value
+            else:
+                column = column + value
+            setattr(states, name, column)
+        return states
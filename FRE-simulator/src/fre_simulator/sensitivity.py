@@ -0,0 +1,141 @@
+"""
+Sensitivity Module — FRE Simulator V2.0
+=======================================
+
+This module implements the **structural sensitivity diagnostics** of the
+vector deviation Δ⃗ ∈ ℝᵈ.
+
+Structural Sensitivity Matrix (gradient of the weighted norm):
+
+    S = ∂‖Δ⃗‖_W / ∂Δ⃗ = W Δ⃗ / ‖Δ⃗‖_W
+
+Unit deviation direction:
+
+    u = Δ⃗ / ‖Δ⃗‖_W                   (‖u‖_W = 1)
+
+Operator Jacobian J = ∂E/∂Δ⃗ of a vector operator E:
+
+- analytic for operators providing `jacobian(delta)` (MatrixOperator:
+  J = K ⋅ Q, constant; diagonal K gives a diagonal J),
+- central finite differences otherwise, evaluated for all B states and
+  all d axes in a single batched `apply_vector` call.
+
+The directional gain g = ‖J u‖_W is the first-order contraction of
+‖Δ⃗‖_W along the current direction (g < 1: locally contracting).
+
+All functions accept one vector (d,) or a batch (B, d). At Δ⃗ = 0 the
+sensitivity and direction are zero.
+"""
+
+# sensitivity.py
+# Sensitivity vector, unit direction and operator Jacobian for FRE Simulator V2.0.
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+
+
+# Default step of the central finite differences
+FD_STEP = 1e-6
+
+
+def _norms(delta: np.ndarray, weights: Optional[np.ndarray]):
+    """(W Δ⃗, ‖Δ⃗‖_W) over the last axis."""
+    w_delta = delta if weights is None else delta @ weights
+    norm = np.sqrt(np.maximum(np.einsum("...i,...i->...", w_delta, delta), 0.0))
+    return w_delta, norm
+
+
+def _divide_rows(vec: np.ndarray, norm: np.ndarray) -> np.ndarray:
+    """vec / norm row-wise, zero where norm = 0."""
+    norm = np.asarray(norm)[..., None]
+    out = np.zeros(np.broadcast(vec, norm).shape)
+    np.divide(vec, norm, out=out, where=norm != 0)
+    return out
+
+
+def sensitivity_vector(delta: Any, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """S = W Δ⃗ / ‖Δ⃗‖_W (zero at Δ⃗ = 0), same shape as `delta`."""
+    delta = np.asarray(delta, dtype=np.float64)
+    w_delta, norm = _norms(delta, weights)
+    return _divide_rows(w_delta, norm)
+
+
+def unit_direction(delta: Any, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """u = Δ⃗ / ‖Δ⃗‖_W (zero at Δ⃗ = 0), same shape as `delta`."""
+    delta = np.asarray(delta, dtype=np.float64)
+    _, norm = _norms(delta, weights)
+    return _divide_rows(delta, norm)
+
+
+def finite_difference_jacobian(fn, delta: Any, step: float = FD_STEP) -> np.ndarray:
+    """
+    Central-difference Jacobian of a batched vector function.
+
+        J[b, i, j] = (fnᵢ(Δ⃗_b + h eⱼ) − fnᵢ(Δ⃗_b − h eⱼ)) / 2h
+
+    All 2⋅B⋅d perturbed vectors go through one call of `fn`, which must
+    map (N, d) → (N, d). Returns (d, d) for one vector, (B, d, d) for a
+    batch.
+    """
+    delta = np.asarray(delta, dtype=np.float64)
+    single = delta.ndim == 1
+    batch = np.atleast_2d(delta)
+    n, d = batch.shape
+
+    offsets = step * np.eye(d)                                   # row j = h eⱼ
+    probes = np.concatenate([batch[:, None, :] + offsets, batch[:, None, :] - offsets])
+    values = np.asarray(fn(probes.reshape(-1, d))).reshape(2, n, d, d)   # [±, b, j, i]
+    jac = ((values[0] - values[1]) / (2.0 * step)).transpose(0, 2, 1)
+    return jac[0] if single else jac
+
+
+def operator_jacobian(operator, delta: Any, step: float = FD_STEP) -> np.ndarray:
+    """
+    J = ∂E/∂Δ⃗ at `delta`: analytic if the operator provides jacobian(),
+    finite differences over apply_vector() otherwise.
+
+    An analytic Jacobian may be returned as one (d, d) matrix valid for
+    every state (linear operators).
+    """
+    if hasattr(operator, "jacobian"):
+        return operator.jacobian(delta)
+    return finite_difference_jacobian(operator.apply_vector, delta, step)
+
+
+def directional_gain(jacobian: np.ndarray, direction: np.ndarray,
+                     weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """g = ‖J u‖_W per row; `jacobian` is (d, d) or (B, d, d)."""
+    if jacobian.ndim == 2:
+        ju = direction @ jacobian.T
+    else:
+        ju = np.einsum("...ij,...j->...i", jacobian, direction)
+    return _norms(ju, weights)[1]
+
+
+@dataclass
+class SensitivityResult:
+    """
+    Per-step sensitivity diagnostics of a vector batch run.
+
+    Arrays are (B, T, …) like the series of the run; entries past a row's
+    length are NaN.
+
+        sensitivity — S(t) = ∂‖Δ⃗‖_W/∂Δ⃗ at the recorded Δ⃗(t), (B, T, d)
+        direction   — u(t) = Δ⃗(t)/‖Δ⃗(t)‖_W, (B, T, d)
+        gain        — ‖J(t) u‖_W for the operator step into t, with J and u
+                      taken at the pre-operator deviation; NaN at t=0,
+                      (B, T)
+        jacobian    — (d, d) if the operator Jacobian is constant, else
+                      (B, d, d) at each row's last operator step
+        analytic    — True if the Jacobian came from operator.jacobian()
+        jacobians   — J(t) of the operator step into t, like gain (NaN at
+                      t=0), (B, T, d, d); only with record_jacobians=True
+    """
+    sensitivity: np.ndarray
+    direction: np.ndarray
+    gain: np.ndarray
+    jacobian: np.ndarray
+    analytic: bool
+    jacobians: Optional[np.ndarray] = None
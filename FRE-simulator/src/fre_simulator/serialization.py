@@ -0,0 +1,211 @@
+"""
+Serialization Module — FRE Simulator V2.0
+=========================================
+
+This module converts simulation results to and from the FRE JSON output
+format (`docs/FRE-V2.0-JSON-Spec.md`, Section 2):
+
+    {
+      "fxi_series":   [...],          # FXI(t), t = 0…T
+      "delta_series": [...],          # Δ(t)
+      "zones":        [...],          # zone names
+      "kappa_series": [null, ...],    # κ(t), null at t=0
+      "meta": {"horizon", "scenario", "converged", "converged_step",
+               "breach", "version"}
+    }
+
+`breach` is null or {"step", "type"}. State snapshots and scenario events
+are not part of the format.
+
+to_json writes the document piecewise from the result's columns (float64
+arrays of a ColumnarSimulationResult, or the lists of a SimulationResult)
+in chunks, so no intermediate dict or full-size string is built when
+writing to a file-like object. Floats use the shortest round-trip repr
+(as json.dumps), optionally rounded to `precision` decimals; non-finite
+values are written as null.
+"""
+
+# serialization.py
+# FRE JSON output format for FRE Simulator V2.0
+# Chunked, streaming to_json / from_json of simulation results.
+
+import io
+import json
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from .zones import ZONE_NAMES
+from .engine import SimulationResult, ColumnarSimulationResult
+
+
+API_VERSION = "FRE-2.0"
+
+# Values formatted per write
+CHUNK_SIZE = 8192
+
+Result = Union[SimulationResult, ColumnarSimulationResult]
+
+
+def result_meta(result: Result, horizon: Optional[int] = None,
+                scenario: Optional[str] = None) -> Dict[str, Any]:
+    """Spec "meta" object of a result."""
+    n = len(result.fxi) if isinstance(result, ColumnarSimulationResult) else len(result.fxi_series)
+    breach = None
+    if result.breach_occurred:
+        breach = {"step": result.breach_step, "type": result.breach_type}
+    return {
+        "horizon": n - 1 if horizon is None else horizon,
+        "scenario": scenario,
+        "converged": result.converged,
+        "converged_step": result.converged_step,
+        "breach": breach,
+        "version": API_VERSION,
+    }
+
+
+def _floats(values, precision: Optional[int]) -> Iterator[str]:
+    """Comma-separated float chunks of an array or list (None/NaN/inf → null)."""
+    for start in range(0, len(values), CHUNK_SIZE):
+        chunk = np.asarray(values[start:start + CHUNK_SIZE], dtype=np.float64)
+        if precision is not None:
+            chunk = np.round(chunk, precision)
+        items = chunk.tolist()
+        finite = np.isfinite(chunk)
+        if finite.all():
+            text = ",".join(map(float.__repr__, items))
+        else:
+            text = ",".join(float.__repr__(v) if ok else "null"
+                            for v, ok in zip(items, finite.tolist()))
+        yield text if start == 0 else "," + text
+
+
+def _zones(result: Result) -> Iterator[str]:
+    if isinstance(result, ColumnarSimulationResult):
+        names = [json.dumps(name) for name in result.zone_names]
+        codes = result.zone_codes
+        for start in range(0, len(codes), CHUNK_SIZE):
+            text = ",".join(names[c] for c in codes[start:start + CHUNK_SIZE].tolist())
+            yield text if start == 0 else "," + text
+    else:
+        zones = result.stability_zones
+        for start in range(0, len(zones), CHUNK_SIZE):
+            text = ",".join(map(json.dumps, zones[start:start + CHUNK_SIZE]))
+            yield text if start == 0 else "," + text
+
+
+def iter_json(result: Result, horizon: Optional[int] = None, scenario: Optional[str] = None,
+              precision: Optional[int] = None,
+              meta: Optional[Mapping[str, Any]] = None) -> Iterator[str]:
+    """Text chunks of the FRE JSON document of a result (see to_json)."""
+    if isinstance(result, ColumnarSimulationResult):
+        fxi, delta, kappa = result.fxi, result.delta, result.kappa
+    else:
+        fxi, delta, kappa = result.fxi_series, result.delta_series, result.kappa_series
+
+    yield '{"fxi_series":['
+    yield from _floats(fxi, precision)
+    yield '],"delta_series":['
+    yield from _floats(delta, precision)
+    yield '],"zones":['
+    yield from _zones(result)
+    yield '],"kappa_series":['
+    if len(kappa):
+        yield "null"                      # κ not defined at t=0
+        for text in _floats(kappa[1:], precision):
+            yield text if text.startswith(",") else "," + text
+    yield '],"meta":'
+    yield json.dumps({**result_meta(result, horizon, scenario), **(meta or {})})
+    yield "}"
+
+
+def to_json(result: Result, fp=None, horizon: Optional[int] = None,
+            scenario: Optional[str] = None, precision: Optional[int] = None,
+            meta: Optional[Mapping[str, Any]] = None) -> Optional[str]:
+    """
+    Serialize a result in the FRE JSON output format.
+
+    Parameters:
+        result    — SimulationResult or ColumnarSimulationResult
+        fp        — optional file-like object (text or binary) to stream
+                    into; if None, the document is returned as a string
+        horizon   — meta.horizon (default: number of recorded steps)
+        scenario  — meta.scenario identifier
+        precision — round floats to this many decimals (None: exact)
+        meta      — extra meta fields (override the defaults)
+
+    Example:
+        with open("run.json", "w") as f:
+            to_json(result, f, horizon=200, scenario="level1_soft", precision=6)
+    """
+    chunks = iter_json(result, horizon, scenario, precision, meta)
+    if fp is None:
+        return "".join(chunks)
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(fp, "mode", ""):
+        for chunk in chunks:
+            fp.write(chunk.encode("utf-8"))
+    else:
+        for chunk in chunks:
+            fp.write(chunk)
+    return None
+
+
+def _series(values: Sequence[Optional[float]]) -> np.ndarray:
+    return np.array(values, dtype=np.float64)   # null → NaN
+
+
+def from_json(source, columnar: bool = False, with_meta: bool = False):
+    """
+    Read a result written by to_json (or any document in the format).
+
+    Parameters:
+        source    — JSON text (str/bytes), a parsed dict, or a file-like object
+        columnar  — return a ColumnarSimulationResult instead of a
+                    SimulationResult
+        with_meta — return (result, meta)
+
+    State snapshots, scenario events and the breach/final states are not
+    part of the format and come back empty / None.
+    """
+    if isinstance(source, (str, bytes, bytearray)):
+        document = json.loads(source)
+    elif isinstance(source, Mapping):
+        document = source
+    else:
+        document = json.load(source)
+
+    meta = document.get("meta", {})
+    breach = meta.get("breach")
+    common = dict(
+        state_series=[],
+        scenario_events=[],
+        breach_occurred=breach is not None,
+        breach_step=breach["step"] if breach else None,
+        breach_state=None,
+        breach_type=breach["type"] if breach else None,
+        converged=bool(meta.get("converged", False)),
+        converged_step=meta.get("converged_step"),
+    )
+    zones = document["zones"]
+
+    if columnar:
+        names = list(ZONE_NAMES) + [z for z in dict.fromkeys(zones) if z not in ZONE_NAMES]
+        index = {name: i for i, name in enumerate(names)}
+        result = ColumnarSimulationResult(
+            fxi=_series(document["fxi_series"]),
+            delta=_series(document["delta_series"]),
+            kappa=_series(document["kappa_series"]),
+            zone_codes=np.array([index[z] for z in zones], dtype=np.int8),
+            zone_names=tuple(names),
+            **common,
+        )
+    else:
+        kappa = list(document["kappa_series"])
+        result = SimulationResult(
+            fxi_series=list(document["fxi_series"]),
+            delta_series=list(document["delta_series"]),
+            kappa_series=kappa,
+            stability_zones=list(zones),
+            **common,
+        )
+    return (result, meta) if with_meta else result
@@ -0,0 +1,593 @@
+"""
+Service Module — FRE Simulator V2.0
+===================================
+
+This module implements the **JSON-over-HTTP simulation service** described
+in `docs/FRE-V2.0-Integration-API.md`:
+
+    POST /fre/v2/simulate   — run one simulation (request/response below)
+    GET  /fre/v2/metrics    — queue depth, batching and error counters
+    GET  /fre/v2/health     — liveness
+
+Request (FRE JSON Input Specification):
+
+    {
+      "fxi": 1.1275, "delta": 0.2550, "horizon": 20,
+      "scenario": "empty",            # registered name or inline definition
+      "params": {"kappa": 0.4},       # DefaultOperator contraction α
+      "config": {...},                # optional engine config (run_simulation)
+      "seed": 7,                      # stochastic scenarios only
+      "version": "FRE-2.0"            # optional, must match
+    }
+
+Response: fxi_series, delta_series, zones, kappa_series and meta (horizon,
+scenario, converged, converged_step, breach, version). Errors use the
+canonical format {"error": {"type", "message", "details"}}.
+
+Execution:
+    Requests are validated on the event loop, then queued by group
+    (scenario, horizon, config). A group is flushed after `batch_window`
+    seconds or at `max_batch` requests and evaluated as one
+    run_simulation_batch (per-row κ as the operator α) in a worker process.
+    Stochastic scenarios run one row per request with their own seed.
+    Batching never changes an answer: if a row leaves the admissible
+    domain, the group is re-run row by row and only the requests whose
+    own row failed get an InvalidInput error (the scenario drives that
+    state out of the domain).
+    With a ResultCache, repeated requests are answered from the cache
+    before queueing.
+
+    Convergence (meta.converged) uses the engine criterion of the
+    "convergence" config entry; when the request gives none,
+    DEFAULT_CONVERGENCE applies. The series always cover t = 0…horizon in
+    "fill" mode.
+
+Backpressure:
+    At most `max_queue` requests may be queued or running; further
+    requests are rejected immediately with HTTP 503.
+
+Run from the command line:
+
+    python -m fre_simulator.service --port 8080 --workers 4
+"""
+
+# service.py
+# Asyncio HTTP service for FRE Simulator V2.0
+# Request validation, batch coalescing, process-pool execution, metrics.
+
+import argparse
+import asyncio
+import json
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .state import StateBlock, initial_state
+from .operators import DefaultOperator
+from .engine import _calm_runs, _convergence
+from .batch import run_simulation_batch
+from .scenario_loader import SCENARIO_LIBRARY, canonical_json, load_program
+from .cache import ResultCache, request_key
+from .serialization import API_VERSION
+
+
+# Convergence criterion used when a request sets no "convergence" config
+DEFAULT_CONVERGENCE = {"tol": 1e-12, "steps": 10, "mode": "fill"}
+
+# Engine config keys a request may set
+CONFIG_KEYS = ("zone_thresholds", "capacity_limits", "convergence")
+
+# Canonical error types → HTTP status
+ERROR_STATUS = {
+    "InvalidInput": 400,
+    "UnknownScenario": 404,
+    "OperatorError": 422,
+    "SimulationError": 500,
+    "InternalError": 500,
+}
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 422: "Unprocessable Entity",
+            500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class ServiceError(Exception):
+    """Error reported to the client in the canonical error format."""
+
+    def __init__(self, error_type: str, message: str,
+                 details: Optional[Dict[str, Any]] = None, status: Optional[int] = None):
+        super().__init__(message)
+        self.error_type = error_type
+        self.message = message
+        self.details = details or {}
+        self.status = status or ERROR_STATUS[error_type]
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"error": {"type": self.error_type, "message": self.message,
+                          "details": self.details}}
+
+
+# ---------------------------------------------------------
+# Request validation
+# ---------------------------------------------------------
+
+def _number(request: Mapping[str, Any], key: str) -> float:
+    value = request.get(key)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise ServiceError("InvalidInput", f"'{key}' must be a finite number", {"field": key})
+    return float(value)
+
+
+def parse_request(request: Any, max_horizon: int) -> Dict[str, Any]:
+    """
+    Validate a simulate request and resolve its scenario.
+
+    Returns a dict with fxi, delta, kappa, horizon, scenario (definition),
+    scenario_name, config, seed and the compiled program.
+
+    Raises:
+        ServiceError
+    """
+    if not isinstance(request, dict):
+        raise ServiceError("InvalidInput", "request body must be a JSON object")
+    version = request.get("version", API_VERSION)
+    if version != API_VERSION:
+        raise ServiceError("InvalidInput", f"unsupported version {version!r}",
+                           {"field": "version", "supported": API_VERSION})
+
+    fxi = _number(request, "fxi")
+    delta = _number(request, "delta")
+    horizon = request.get("horizon")
+    if isinstance(horizon, bool) or not isinstance(horizon, int) or not 1 <= horizon <= max_horizon:
+        raise ServiceError("InvalidInput", f"'horizon' must be an integer in [1, {max_horizon}]",
+                           {"field": "horizon"})
+    try:
+        initial_state(delta=delta, fxi=fxi, qp=1.0 + delta, qf=1.0, q=1.0, w=1.0, u=1.0).validate()
+    except ValueError as e:
+        raise ServiceError("InvalidInput", str(e), {"field": "fxi/delta"}) from None
+
+    params = request.get("params") or {}
+    if not isinstance(params, dict):
+        raise ServiceError("InvalidInput", "'params' must be an object", {"field": "params"})
+    kappa = params.get("kappa", DefaultOperator.alpha)
+    if isinstance(kappa, bool) or not isinstance(kappa, (int, float)) or not 0.0 <= kappa < 1.0:
+        raise ServiceError("OperatorError", "'params.kappa' must be a number in [0, 1)",
+                           {"field": "params.kappa"})
+
+    config = request.get("config") or {}
+    if not isinstance(config, dict) or set(config) - set(CONFIG_KEYS):
+        raise ServiceError("InvalidInput", f"'config' may only set {CONFIG_KEYS}",
+                           {"field": "config"})
+    config = {"convergence": DEFAULT_CONVERGENCE, **config}
+    try:
+        _convergence(config)
+    except (TypeError, ValueError) as e:
+        raise ServiceError("InvalidInput", str(e), {"field": "config.convergence"}) from None
+
+    scenario = request.get("scenario", "empty")
+    if isinstance(scenario, str):
+        if scenario not in SCENARIO_LIBRARY:
+            raise ServiceError("UnknownScenario", f"unknown scenario {scenario!r}",
+                               {"scenario": scenario})
+        definition, name = SCENARIO_LIBRARY[scenario], scenario
+    elif isinstance(scenario, dict):
+        definition, name = scenario, scenario.get("name")
+    else:
+        raise ServiceError("InvalidInput", "'scenario' must be a name or a definition",
+                           {"field": "scenario"})
+    try:
+        program = load_program(definition, horizon)
+    except (TypeError, ValueError, KeyError) as e:
+        raise ServiceError("InvalidInput", f"invalid scenario definition: {e}",
+                           {"field": "scenario"}) from None
+
+    seed = request.get("seed")
+    if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int) or seed < 0):
+        raise ServiceError("InvalidInput", "'seed' must be a non-negative integer", {"field": "seed"})
+
+    return {
+        "fxi": fxi, "delta": delta, "kappa": float(kappa), "horizon": horizon,
+        "scenario": definition, "scenario_name": name or program.digest,
+        "config": config, "seed": seed, "program": program,
+    }
+
+
+# ---------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------
+
+def _settle_step(scenario, horizon: int) -> int:
+    """First step t after which the scenario declares no event (horizon + 1: never)."""
+    t = 0
+    while t <= horizon:
+        upcoming = scenario.next_event(t + 1)
+        if upcoming is None:
+            return t
+        t = upcoming
+    return horizon + 1
+
+
+def _responses(batch, rows, horizon, scenario, convergence, names) -> List[Dict[str, Any]]:
+    """Spec responses of a batch result, with the engine convergence rule applied."""
+    tol, steps, mode = convergence
+    settle = _settle_step(scenario, horizon)
+    out = []
+    for i in range(len(rows)):
+        n = int(batch.lengths[i])
+        fxi = batch.fxi[i, :n].copy()
+        delta = batch.delta[i, :n].copy()
+        kappa = batch.kappa[i, :n].copy()
+        zones = batch.zone_codes[i, :n].copy()
+
+        converged_step = None
+        if not batch.breach_occurred[i]:
+            calm = (np.abs(fxi - 1.0) <= tol) & (np.abs(delta) <= tol)
+            hits = np.flatnonzero((_calm_runs(calm, 0) >= steps) & (np.arange(n) >= settle))
+            if len(hits):
+                converged_step = int(hits[0])
+                end = converged_step + 1
+                if mode == "stop":
+                    fxi, delta, kappa, zones = fxi[:end], delta[:end], kappa[:end], zones[:end]
+                else:
+                    for column in (fxi, delta, kappa, zones):
+                        column[end:] = column[converged_step]
+
+        kappa_series = kappa.tolist()
+        kappa_series[0] = None
+        breach = None
+        if batch.breach_occurred[i]:
+            breach = {"step": int(batch.breach_step[i]),
+                      "type": batch.breach_types[batch.breach_code[i]]}
+        out.append({
+            "fxi_series": fxi.tolist(),
+            "delta_series": delta.tolist(),
+            "zones": [batch.zone_names[z] for z in zones.tolist()],
+            "kappa_series": kappa_series,
+            "meta": {
+                "horizon": horizon,
+                "scenario": names[i],
+                "converged": converged_step is not None,
+                "converged_step": converged_step,
+                "breach": breach,
+                "version": API_VERSION,
+            },
+        })
+    return out
+
+
+def _inadmissible(error: ValueError) -> Dict[str, Any]:
+    """Canonical error body of a single-row run that left the admissible domain."""
+    message = str(error)
+    if message.startswith("row 0: "):
+        message = message[len("row 0: "):]
+    return ServiceError("InvalidInput", f"scenario leaves the admissible domain: {message}",
+                        {"field": "scenario"}).to_json()
+
+
+def _simulate_group(task: tuple) -> List[Dict[str, Any]]:
+    """
+    Worker: evaluate one group of requests sharing scenario, horizon and
+    config. `rows` are (fxi, delta, kappa, seed, scenario_name) tuples.
+
+    Returns one response per row, in order; a row that left the admissible
+    domain gets a canonical error body ({"error": …}) instead.
+    """
+    definition, horizon, config, rows = task
+    program = load_program(definition, horizon)
+    convergence = _convergence(config)
+    engine_config = {k: v for k, v in config.items() if k != "convergence"}
+
+    def block(part):
+        fxi = np.array([r[0] for r in part])
+        delta = np.array([r[1] for r in part])
+        return StateBlock(delta=delta, fxi=fxi, qp=1.0 + delta, qf=1.0, q=1.0, w=1.0, u=1.0)
+
+    if program.deterministic:
+        scenario = program.scenario()
+        try:
+            batch = run_simulation_batch(block(rows), DefaultOperator(alpha=np.array([r[2] for r in rows])),
+                                         scenario, horizon, engine_config)
+        except ValueError:
+            pass   # some row is inadmissible: isolate it below
+        else:
+            return _responses(batch, rows, horizon, scenario, convergence, [r[4] for r in rows])
+
+    out = []
+    for row in rows:
+        scenario = program.scenario(seed=row[3]) if not program.deterministic else program.scenario()
+        try:
+            batch = run_simulation_batch(block([row]), DefaultOperator(alpha=row[2]),
+                                         scenario, horizon, engine_config)
+        except ValueError as e:
+            out.append(_inadmissible(e))
+            continue
+        out.extend(_responses(batch, [row], horizon, scenario, convergence, [row[4]]))
+    return out
+
+
+# ---------------------------------------------------------
+# Service
+# ---------------------------------------------------------
+
+class FREService:
+    """
+    Batching FRE simulation service.
+
+    Parameters:
+        workers      — worker processes; 0 runs batches in a thread of
+                       the current process (no process pool)
+        batch_window — seconds a group waits for more requests
+        max_batch    — flush a group at this many requests
+        max_queue    — queued + running requests before rejecting (503)
+        max_horizon  — largest accepted horizon
+        max_body     — largest accepted request body in bytes
+        executor     — explicit executor (overrides workers)
+        cache        — optional ResultCache; repeated requests are answered
+                       from it without queueing (stochastic scenarios
+                       only when seeded)
+
+    `await service.submit(request)` evaluates one request dict directly;
+    `await service.start(host, port)` serves HTTP.
+    """
+
+    def __init__(self, workers: int = 1, batch_window: float = 0.002, max_batch: int = 1024,
+                 max_queue: int = 10_000, max_horizon: int = 100_000, max_body: int = 1 << 20,
+                 executor: Optional[Executor] = None, cache: Optional[ResultCache] = None):
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_queue = max_queue
+        self.max_horizon = max_horizon
+        self.max_body = max_body
+        self.cache = cache
+        self._own_executor = executor is None and workers > 0
+        self._executor = executor or (ProcessPoolExecutor(max_workers=workers) if workers > 0 else None)
+
+        self._groups: Dict[Tuple, List[Tuple[tuple, asyncio.Future, dict]]] = {}
+        self._timers: Dict[Tuple, asyncio.TimerHandle] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+        self.queue_depth = 0
+        self.in_flight_batches = 0
+        self.counters = dict.fromkeys(
+            ("requests", "responses", "errors", "rejected", "batches", "batched_requests"), 0)
+        self.max_batch_seen = 0
+
+    # metrics
+
+    def metrics(self) -> Dict[str, Any]:
+        batches = self.counters["batches"]
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue": self.max_queue,
+            "pending_groups": len(self._groups),
+            "in_flight_batches": self.in_flight_batches,
+            **{f"{name}_total": value for name, value in self.counters.items()},
+            "mean_batch_size": self.counters["batched_requests"] / batches if batches else 0.0,
+            "max_batch_size": self.max_batch_seen,
+            "cache": self.cache.stats() if self.cache is not None else None,
+        }
+
+    # request path
+
+    async def submit(self, request: Any) -> Dict[str, Any]:
+        """
+        Evaluate one simulate request.
+
+        Raises:
+            ServiceError — invalid request, overload or simulation failure
+        """
+        self.counters["requests"] += 1
+        try:
+            parsed = parse_request(request, self.max_horizon)
+            cache_key = self._cache_key(parsed)
+            if cache_key is not None:
+                response = self.cache.get(cache_key)
+                if response is not None:
+                    self.counters["responses"] += 1
+                    return response
+            if self.queue_depth >= self.max_queue:
+                self.counters["rejected"] += 1
+                raise ServiceError("InternalError", "server overloaded, retry later",
+                                   {"reason": "overloaded", "queue_depth": self.queue_depth},
+                                   status=503)
+            key = (parsed["program"].digest, parsed["horizon"], canonical_json(parsed["config"]))
+            row = (parsed["fxi"], parsed["delta"], parsed["kappa"], parsed["seed"],
+                   parsed["scenario_name"])
+
+            future = asyncio.get_running_loop().create_future()
+            group = self._groups.setdefault(key, [])
+            group.append((row, future, parsed))
+            self.queue_depth += 1
+            if len(group) >= self.max_batch:
+                self._flush(key)
+            elif len(group) == 1:
+                self._timers[key] = asyncio.get_running_loop().call_later(
+                    self.batch_window, self._flush, key)
+            try:
+                response = await future
+            finally:
+                self.queue_depth -= 1
+        except ServiceError:
+            self.counters["errors"] += 1
+            raise
+        if cache_key is not None:
+            self.cache.put(cache_key, response)
+        self.counters["responses"] += 1
+        return response
+
+    def _cache_key(self, parsed: Dict[str, Any]) -> Optional[str]:
+        """Result-cache key of a parsed request; None if not cached (unseeded noise)."""
+        if self.cache is None:
+            return None
+        deterministic = parsed["program"].deterministic
+        if not deterministic and parsed["seed"] is None:
+            return None
+        return request_key({
+            "api": API_VERSION,
+            "state": [parsed["fxi"], parsed["delta"]],
+            "kappa": parsed["kappa"],
+            "horizon": parsed["horizon"],
+            "scenario": [parsed["program"].digest, parsed["scenario_name"]],
+            "config": parsed["config"],
+            "seed": None if deterministic else parsed["seed"],
+        })
+
+    def _flush(self, key):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        group = self._groups.pop(key, None)
+        if group:
+            asyncio.ensure_future(self._run_group(group))
+
+    async def _run_group(self, group):
+        first = group[0][2]
+        task = (first["scenario"], first["horizon"], first["config"], [g[0] for g in group])
+        self.in_flight_batches += 1
+        self.counters["batches"] += 1
+        self.counters["batched_requests"] += len(group)
+        self.max_batch_seen = max(self.max_batch_seen, len(group))
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _simulate_group, task)
+        except Exception as e:   # noqa: BLE001 — reported to every client of the batch
+            error = ServiceError("SimulationError", f"simulation failed: {e}")
+            for _, future, _ in group:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            for (_, future, _), result in zip(group, results):
+                if future.done():
+                    continue
+                if "error" in result:
+                    error = result["error"]
+                    future.set_exception(ServiceError(error["type"], error["message"],
+                                                      error["details"]))
+                else:
+                    future.set_result(result)
+        finally:
+            self.in_flight_batches -= 1
+
+    # HTTP
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        if path == "/fre/v2/simulate":
+            if method != "POST":
+                return 405, ServiceError("InvalidInput", "use POST").to_json()
+            try:
+                request = json.loads(body)
+            except ValueError:
+                self.counters["requests"] += 1
+                self.counters["errors"] += 1
+                return 400, ServiceError("InvalidInput", "body is not valid JSON").to_json()
+            try:
+                return 200, await self.submit(request)
+            except ServiceError as e:
+                return e.status, e.to_json()
+            except Exception as e:   # noqa: BLE001
+                return 500, ServiceError("InternalError", str(e)).to_json()
+        if path == "/fre/v2/metrics" and method == "GET":
+            return 200, self.metrics()
+        if path == "/fre/v2/health" and method == "GET":
+            return 200, {"status": "ok", "version": API_VERSION}
+        return 404, ServiceError("InvalidInput", f"no route {method} {path}", status=404).to_json()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    method, path, version = line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    # no usable body boundary: answer and drop the connection
+                    status, payload = 400, ServiceError(
+                        "InvalidInput", "invalid Content-Length",
+                        {"field": "content-length"}).to_json()
+                    keep_alive = False
+                elif length > self.max_body:
+                    status, payload = 413, ServiceError("InvalidInput", "request body too large",
+                                                        status=413).to_json()
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = await self._route(method, path.split("?")[0], body)
+                    keep_alive = (version == "HTTP/1.1"
+                                  and headers.get("connection", "").lower() != "close")
+
+                data = json.dumps(payload).encode("utf-8")
+                head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                        f"Content-Type: application/json\r\n"
+                        f"Content-Length: {len(data)}\r\n")
+                if not keep_alive:
+                    head += "Connection: close\r\n"
+                writer.write(head.encode("latin-1") + b"\r\n" + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        """Start serving HTTP; returns the asyncio server (port 0 picks a free port)."""
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server
+
+    async def close(self):
+        """Stop the server and release the worker pool."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._own_executor:
+            self._executor.shutdown(wait=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FRE V2.0 JSON simulation service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes (0: run in-process)")
+    parser.add_argument("--batch-window", type=float, default=0.002,
+                        help="seconds to coalesce requests into a batch")
+    parser.add_argument("--max-batch", type=int, default=1024)
+    parser.add_argument("--max-queue", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    async def serve():
+        service = FREService(workers=args.workers, batch_window=args.batch_window,
+                             max_batch=args.max_batch, max_queue=args.max_queue)
+        server = await service.start(args.host, args.port)
+        print(f"FRE service listening on http://{args.host}:{args.port}/fre/v2/simulate")
+        try:
+            await server.serve_forever()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+Session Module — FRE Simulator V2.0
+===================================
+
+This module implements the **online form** of the FRE evolution loop.
+
+A `FRESession` holds one live structural state and advances it by exactly
+one step per external tick (e.g. one market or protocol update):
+
+    1. Apply external update            (qp, qf, ... from the live feed)
+    2. Recompute Δ(t) = qp/qf − 1
+    3. FXI(t+1) = E(FXI(t))
+    4. Capacity check on FXI             (breach, step not applied)
+    5. Update state, Δ = FXI − 1, validate
+    6. Classify stability zone, compute κ
+    7. Capacity check on Δ               (breach, step applied)
+
+This is the same step as in `engine.iter_simulation`, with the external
+update in place of the scenario. Thresholds and capacity limits are read
+once at construction; each tick mutates the session state in place and
+allocates only the returned StepRecord (plus a copy of the state on ticks
+with an external update, and of a stateful operator's attributes, both
+restored if the tick is rejected).
+
+Running diagnostics (κ statistics, zone dwell times, breach status) are
+updated incrementally, so no trajectory has to be kept.
+"""
+
+# session.py
+# Stateful online engine for FRE Simulator V2.0
+# One FRE step per external tick, running diagnostics, no trajectory buffers.
+
+from collections import deque
+import copy
+from typing import Any, Deque, Dict, Mapping, Optional
+
+from .state import State, STATE_FIELDS
+from .operators import BaseOperator
+from .zones import ZoneClassifier
+from .engine import StepRecord, _capacity_limits, _reset_operator
+
+
+class FRESession:
+    """
+    Persistent FRE session advancing one step per external tick.
+
+    Attributes:
+        state          — live structural state S(t) (owned by the session)
+        zones          — ZoneClassifier built from the config
+        t              — number of executed steps
+        zone           — stability zone of the current FXI
+        breach_occurred, breach_step, breach_type
+        kappa_count, kappa_mean, kappa_min, kappa_max, kappa_last
+                       — running κ statistics
+        zone_dwell     — steps spent in each zone, including t=0
+        zone_run       — consecutive steps in the current zone
+        history        — deque of the last `history` StepRecords, or None
+        monitor        — EarlyWarningMonitor fed with every record, or None
+    """
+
+    __slots__ = (
+        "operator", "zones", "state", "t", "zone",
+        "_delta_max", "_fxi_min", "_fxi_max",
+        "breach_occurred", "breach_step", "breach_type",
+        "kappa_count", "kappa_sum", "kappa_min", "kappa_max", "kappa_last",
+        "zone_dwell", "zone_run", "history", "monitor", "_stateful",
+    )
+
+    def __init__(
+        self,
+        initial_state: State,
+        operator: BaseOperator,
+        config: Optional[dict] = None,
+        history: int = 0,
+        monitor: Any = None
+    ):
+        """
+        Parameters:
+            initial_state — starting structural state S0 (copied)
+            operator      — corrective operator E
+            config        — optional dict, same keys as run_simulation
+            history       — number of recent StepRecords to keep (0 = none)
+            monitor       — optional EarlyWarningMonitor; observes t=0 and
+                            every step (events in monitor.events)
+        """
+        cfg = config or {}
+        self.operator = operator
+        # per-run operator state (see operators.py) is rolled back with a rejected tick
+        self._stateful = callable(getattr(operator, "reset", None))
+        self.zones = ZoneClassifier.from_config(cfg)
+        self._delta_max, self._fxi_min, self._fxi_max = _capacity_limits(cfg, initial_state)
+        self.history: Optional[Deque[StepRecord]] = deque(maxlen=history) if history > 0 else None
+        self.monitor = monitor
+        self.reset(initial_state)
+
+    def reset(self, initial_state: State):
+        """
+        Restart the session from a new state S0 (copied and validated).
+        Diagnostics, history, the monitor and the operator's per-run state
+        are cleared.
+        """
+        self.state = copy.copy(initial_state)  # copy to avoid mutating caller's object
+        self.state.validate()
+        _reset_operator(self.operator)
+        self.t = 0
+        self.zone = self.zones.classify(self.state.fxi)
+
+        self.breach_occurred = False
+        self.breach_step: Optional[int] = None
+        self.breach_type: Optional[str] = None
+
+        self.kappa_count = 0
+        self.kappa_sum = 0.0
+        self.kappa_min = float("inf")
+        self.kappa_max = float("-inf")
+        self.kappa_last: Optional[float] = None
+
+        self.zone_dwell = dict.fromkeys(self.zones.zone_names, 0)
+        self.zone_dwell[self.zone] = 1
+        self.zone_run = 1
+
+        first = StepRecord(0, self.state.fxi, self.state.delta, None, self.zone, None)
+        if self.history is not None:
+            self.history.clear()
+            self.history.append(first)
+        if self.monitor is not None:
+            self.monitor.reset()
+            self.monitor.observe(first)
+
+    @property
+    def kappa_mean(self) -> Optional[float]:
+        return self.kappa_sum / self.kappa_count if self.kappa_count else None
+
+    def _breach(self, t: int, breach_type: str):
+        self.breach_occurred = True
+        self.breach_step = t
+        self.breach_type = breach_type
+
+    def step(self, external_update: Optional[Mapping[str, float]] = None) -> Optional[StepRecord]:
+        """
+        Advance the session by one FRE step.
+
+        Parameters:
+            external_update — mapping of State components to their new
+                              values for this tick, e.g. {"qp": 1.02,
+                              "qf": 0.99}; None applies no update
+
+        Returns:
+            StepRecord of the new step, or None if the step breached before
+            producing a point (FXI capacity / Δ computation breach). A Δ
+            capacity breach returns its record; check `breach_occurred`.
+
+        Raises:
+            RuntimeError — the session has already breached (see reset)
+            ValueError   — unknown component, or the updated state is not
+                           admissible; the tick is rejected and the session
+                           keeps its state (and a stateful operator its
+                           per-run state) from before the update
+        """
+        if self.breach_occurred:
+            raise RuntimeError(
+                f"session breached at step {self.breach_step} ({self.breach_type}); "
+                "call reset() to continue"
+            )
+
+        state = self.state
+        t = self.t + 1
+
+        # 1) Apply external update (all keys checked first; the previous
+        #    state is kept until the updated one has been validated)
+        backup = operator_backup = None
+        if external_update:
+            for name in external_update:
+                if name not in STATE_FIELDS:
+                    raise ValueError(f"unknown state component {name!r}")
+            backup = copy.copy(state)
+            for name, value in external_update.items():
+                setattr(state, name, value)
+        if self._stateful:
+            operator_backup = dict(vars(self.operator))
+
+        try:
+            # 2) Recompute Δ(t) from qp, qf
+            try:
+                state.compute_delta()
+            except ZeroDivisionError as e:
+                self.t = t
+                self._breach(t, f"delta-computation-error: {e}")
+                return None
+
+            # 3) Compute FXI(t+1) via operator E
+            prev_fxi = state.fxi
+            next_fxi = self.operator.apply(prev_fxi)
+
+            if next_fxi < self._fxi_min or next_fxi > self._fxi_max:
+                self.t = t
+                self._breach(t, "fxi-capacity-breach")
+                return None
+
+            # 4) Update state from operator result
+            state.update_from_operator(next_fxi)
+        except ValueError:
+            # rejected tick: restore the state before the update (in place)
+            if backup is not None:
+                for name in getattr(type(state), "__slots__", None) or vars(backup):
+                    setattr(state, name, getattr(backup, name))
+            if operator_backup is not None:
+                vars(self.operator).update(operator_backup)
+            raise
+        self.t = t
+
+        # 5) Classify stability zone, update dwell times
+        zone = self.zones.classify(state.fxi)
+        self.zone_dwell[zone] += 1
+        if zone == self.zone:
+            self.zone_run += 1
+        else:
+            self.zone = zone
+            self.zone_run = 1
+
+        # 6) Compute κ, update running statistics
+        kappa_value = self.operator.kappa(prev_fxi, state.fxi)
+        self.kappa_count += 1
+        self.kappa_sum += kappa_value
+        self.kappa_last = kappa_value
+        if kappa_value < self.kappa_min:
+            self.kappa_min = kappa_value
+        if kappa_value > self.kappa_max:
+            self.kappa_max = kappa_value
+
+        # 7) Check Δ capacity
+        if abs(state.delta) > self._delta_max:
+            self._breach(t, "delta-capacity-breach")
+
+        record = StepRecord(t, state.fxi, state.delta, kappa_value, zone, None)
+        if self.history is not None:
+            self.history.append(record)
+        if self.monitor is not None:
+            self.monitor.observe(record)
+        return record
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """
+        Snapshot of the running diagnostics as a plain dict.
+        """
+        return {
+            "t": self.t,
+            "fxi": self.state.fxi,
+            "delta": self.state.delta,
+            "zone": self.zone,
+            "zone_run": self.zone_run,
+            "zone_dwell": dict(self.zone_dwell),
+            "kappa": {
+                "count": self.kappa_count,
+                "mean": self.kappa_mean,
+                "min": self.kappa_min if self.kappa_count else None,
+                "max": self.kappa_max if self.kappa_count else None,
+                "last": self.kappa_last,
+            },
+            "breach_occurred": self.breach_occurred,
+            "breach_step": self.breach_step,
+            "breach_type": self.breach_type,
+            "warnings": dict(self.monitor.active) if self.monitor is not None else None,
+        }
@@ -13,6 +13,17 @@ and contains:
 - Zone:  Stability zone classification for the current state
 - Step:  Discrete time index in the evolution trajectory
 
+Three storage layouts implement the same state protocol
+(validate / compute_delta / update_from_operator):
+
+- `State`        — regular dataclass (reference form),
+- `CompactState` — slotted variant without a per-instance `__dict__`,
+- `StateBlock`   — struct-of-arrays columns for many states, with
+                   `StateRow` views onto single rows.
+
+validate() raises `AdmissibilityError`, a ValueError subclass, so callers
+can tell a state that left the admissible domain from other errors.
+
 The State object is intentionally minimal. It stores only the information
 required by the FRE evolution loop and corrective operator E⃗. All dynamics
 are implemented in `engine.py`.
@@ -24,7 +35,13 @@ This module is fully deterministic and side-effect free.
 # Structural state representation for FRE Simulator V2.0
 # Implements: Δ(t), FXI(t), admissibility checks, and initial state creation.
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+
+class AdmissibilityError(ValueError):
+    """A state component violates the FRE-2.0 admissibility conditions."""
 
 
 @dataclass
@@ -58,16 +75,16 @@ class State:
     def validate(self):
         """Validate admissibility conditions for all state components."""
         if abs(self.delta) > self.DELTA_MAX:
-            raise ValueError(f"Δ(t)={self.delta} exceeds admissible bound ±{self.DELTA_MAX}")
+            raise AdmissibilityError(f"Δ(t)={self.delta} exceeds admissible bound ±{self.DELTA_MAX}")
 
         if not (self.FXI_MIN <= self.fxi <= self.FXI_MAX):
-            raise ValueError(f"FXI(t)={self.fxi} outside admissible range [{self.FXI_MIN}, {self.FXI_MAX}]")
+            raise AdmissibilityError(f"FXI(t)={self.fxi} outside admissible range [{self.FXI_MIN}, {self.FXI_MAX}]")
 
         # qp, qf, q, w, u must be positive (structural quantities)
         for name, value in [("qp", self.qp), ("qf", self.qf), ("q", self.q),
                             ("w", self.w), ("u", self.u)]:
             if value <= 0:
-                raise ValueError(f"{name} must be positive, got {value}")
+                raise AdmissibilityError(f"{name} must be positive, got {value}")
 
     def compute_delta(self):
         """
@@ -97,6 +114,62 @@ class State:
         self.validate()
 
 
+# Structural components shared by all state layouts
+STATE_FIELDS = ("delta", "fxi", "qp", "qf", "q", "w", "u")
+
+
+class CompactState:
+    """
+    Slotted structural state with the components and methods of State.
+
+    Instances have no per-instance __dict__, which roughly halves the
+    memory of a live state compared to the State dataclass. Use it for
+    large numbers of long-lived states; the engine accepts it wherever
+    it accepts State.
+    """
+    __slots__ = STATE_FIELDS
+
+    # capacity thresholds (same defaults as State)
+    DELTA_MAX = State.DELTA_MAX
+    FXI_MIN = State.FXI_MIN
+    FXI_MAX = State.FXI_MAX
+
+    def __init__(self, delta: float, fxi: float, qp: float, qf: float,
+                 q: float, w: float, u: float):
+        self.delta = delta
+        self.fxi = fxi
+        self.qp = qp
+        self.qf = qf
+        self.q = q
+        self.w = w
+        self.u = u
+
+    @classmethod
+    def from_state(cls, state) -> "CompactState":
+        """Compact copy of any object with the State components."""
+        return cls(*(getattr(state, name) for name in STATE_FIELDS))
+
+    # same admissibility rules and dynamics as State
+    validate = State.validate
+    compute_delta = State.compute_delta
+    compute_fxi = State.compute_fxi
+    update_from_operator = State.update_from_operator
+
+    def __copy__(self):
+        return CompactState(self.delta, self.fxi, self.qp, self.qf, self.q, self.w, self.u)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in STATE_FIELDS)
+
+    __hash__ = None
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in STATE_FIELDS)
+        return f"CompactState({values})"
+
+
 def initial_state(delta: float, fxi: float, qp: float, qf: float,
                   q: float, w: float, u: float) -> State:
     """
@@ -114,3 +187,154 @@ def initial_state(delta: float, fxi: float, qp: float, qf: float,
     )
     state.validate()
     return state
+
+
+@dataclass
+class StateBlock:
+    """
+    Struct-of-arrays container for many structural states S0.
+
+    Each component is a contiguous float64 column with one row per state
+    (e.g. one row per account). Used by the batch engine, which evolves
+    all rows at once with array operations.
+
+    Scalar components are broadcast to the common row count, so
+        StateBlock(delta=d, fxi=f, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+    is valid for arrays d, f of equal length.
+    """
+    delta: np.ndarray
+    fxi: np.ndarray
+    qp: np.ndarray
+    qf: np.ndarray
+    q: np.ndarray
+    w: np.ndarray
+    u: np.ndarray
+
+    # capacity thresholds (same defaults as State)
+    DELTA_MAX = State.DELTA_MAX
+    FXI_MIN = State.FXI_MIN
+    FXI_MAX = State.FXI_MAX
+
+    def __post_init__(self):
+        names = [f.name for f in fields(self)]
+        columns = np.broadcast_arrays(
+            *[np.asarray(getattr(self, name), dtype=np.float64) for name in names]
+        )
+        for name, column in zip(names, columns):
+            if column.ndim != 1:
+                raise ValueError(f"{name} must be one-dimensional")
+            # own, writable, contiguous copy of each column
+            setattr(self, name, np.array(column, dtype=np.float64))
+
+    def __len__(self):
+        return self.fxi.shape[0]
+
+    @classmethod
+    def from_states(cls, states) -> "StateBlock":
+        """
+        Pack a sequence of states (State, CompactState, StateRow, ...)
+        into columns.
+        """
+        states = list(states)
+        return cls(**{
+            name: np.fromiter((getattr(s, name) for s in states), dtype=np.float64, count=len(states))
+            for name in STATE_FIELDS
+        })
+
+    def row(self, i: int) -> "StateRow":
+        """Live view of row i (reads and writes go to the columns)."""
+        n = len(self)
+        if not -n <= i < n:
+            raise IndexError(f"row {i} out of range for {n} states")
+        return StateRow(self, i % n)
+
+    def rows(self):
+        """Iterate over live views of all rows."""
+        for i in range(len(self)):
+            yield StateRow(self, i)
+
+    def validate(self, rows=None):
+        """
+        Validate admissibility conditions for all rows, or for the rows
+        selected by the boolean mask `rows`.
+        Raises AdmissibilityError naming the first offending row, with the
+        same checks as State.validate().
+        """
+        def _first_bad(bad):
+            if rows is not None:
+                bad &= rows
+            return int(np.argmax(bad)) if bad.any() else None
+
+        i = _first_bad(np.abs(self.delta) > self.DELTA_MAX)
+        if i is not None:
+            raise AdmissibilityError(f"row {i}: Δ(t)={self.delta[i]} exceeds admissible bound ±{self.DELTA_MAX}")
+
+        i = _first_bad(~((self.FXI_MIN <= self.fxi) & (self.fxi <= self.FXI_MAX)))
+        if i is not None:
+            raise AdmissibilityError(f"row {i}: FXI(t)={self.fxi[i]} outside admissible range [{self.FXI_MIN}, {self.FXI_MAX}]")
+
+        for name in ("qp", "qf", "q", "w", "u"):
+            value = getattr(self, name)
+            i = _first_bad(value <= 0)
+            if i is not None:
+                raise AdmissibilityError(f"row {i}: {name} must be positive, got {value[i]}")
+
+
+def _column_property(name: str) -> property:
+    """Property reading/writing one component of a StateBlock row."""
+    def fget(self):
+        return float(getattr(self._block, name)[self._i])
+
+    def fset(self, value):
+        getattr(self._block, name)[self._i] = value
+
+    return property(fget, fset, doc=f"{name} of the viewed row")
+
+
+class StateRow:
+    """
+    View of one row of a StateBlock with the State protocol.
+
+    Components read from and write to the block's columns, so
+    validate(), compute_delta() and update_from_operator() act on the
+    row in place. Copying a view (copy.copy, as the engine does for its
+    working state) returns a detached CompactState.
+    """
+    __slots__ = ("_block", "_i")
+
+    def __init__(self, block: StateBlock, i: int):
+        self._block = block
+        self._i = i
+
+    @property
+    def DELTA_MAX(self):
+        return self._block.DELTA_MAX
+
+    @property
+    def FXI_MIN(self):
+        return self._block.FXI_MIN
+
+    @property
+    def FXI_MAX(self):
+        return self._block.FXI_MAX
+
+    delta = _column_property("delta")
+    fxi = _column_property("fxi")
+    qp = _column_property("qp")
+    qf = _column_property("qf")
+    q = _column_property("q")
+    w = _column_property("w")
+    u = _column_property("u")
+
+    # same admissibility rules and dynamics as State
+    validate = State.validate
+    compute_delta = State.compute_delta
+    compute_fxi = State.compute_fxi
+    update_from_operator = State.update_from_operator
+
+    def __copy__(self):
+        return CompactState.from_state(self)
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in STATE_FIELDS)
+        return f"StateRow({self._i}: {values})"
@@ -0,0 +1,217 @@
+"""
+Trajectory Store Module — FRE Simulator V2.0
+============================================
+
+This module keeps the output series of a batch simulation in a
+**memory-mapped file**, so batches larger than RAM (e.g. 1M rows × 1k
+steps ≈ 24 GB of FXI/Δ/κ) can be simulated and analysed.
+
+File layout (little-endian):
+
+    offset 0      magic  b"FRETRJ01"
+    offset 8      uint32 header length L
+    offset 12     header: UTF-8 JSON, L bytes, padded to HEADER_SIZE
+                  {"format", "rows", "steps", "width", "complete",
+                   "zone_names", "columns": {name: {"dtype", "shape", "offset"}}}
+    column blocks, each starting on an ALIGN boundary:
+        fxi, delta, kappa  — float64 (steps, rows), time-major
+        zone_codes         — int8    (steps, rows), −1 past a row's end
+        lengths, breach_step — int64 (rows,)
+        breach_code        — int8    (rows,)
+
+Step t of a time-major column is one contiguous block of `rows` values,
+which is what the batch engine writes per step. The engine prepares and
+flushes the file in chunks of `chunk_steps` steps, so only the current
+chunk has to be resident. `width` (recorded steps) and `complete` are set
+when the run finishes.
+
+TrajectoryStore.result() returns a BatchSimulationResult whose series
+are (rows, width) views of the memory maps (no copy); zone statistics,
+plotting and record export read them directly.
+"""
+
+# store.py
+# Memory-mapped trajectory storage for FRE Simulator V2.0
+# On-disk header + column blocks, chunked preparation and flushing.
+
+import json
+import os
+import struct
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from .zones import ZONE_NAMES
+
+
+MAGIC = b"FRETRJ01"
+HEADER_SIZE = 4096
+ALIGN = 4096
+
+# (name, dtype, fill value) of the time-major columns
+TIME_COLUMNS = (
+    ("fxi", np.float64, np.nan),
+    ("delta", np.float64, np.nan),
+    ("kappa", np.float64, np.nan),
+    ("zone_codes", np.int8, -1),
+)
+
+# (name, dtype) of the per-row columns
+ROW_COLUMNS = (
+    ("lengths", np.int64),
+    ("breach_step", np.int64),
+    ("breach_code", np.int8),
+)
+
+
+def _layout(rows: int, steps: int) -> Dict[str, Dict[str, Any]]:
+    columns = {}
+    offset = HEADER_SIZE
+    specs = [(name, dtype, [steps, rows]) for name, dtype, _ in TIME_COLUMNS]
+    specs += [(name, dtype, [rows]) for name, dtype in ROW_COLUMNS]
+    for name, dtype, shape in specs:
+        dtype = np.dtype(dtype)
+        columns[name] = {"dtype": dtype.str, "shape": shape, "offset": offset}
+        size = int(np.prod(shape)) * dtype.itemsize
+        offset += -(-size // ALIGN) * ALIGN
+    return columns
+
+
+class TrajectoryStore:
+    """
+    Memory-mapped batch trajectories (see module docstring for the layout).
+
+    Create with TrajectoryStore.create (done by run_simulation_batch with
+    `storage=`), reopen with TrajectoryStore.open.
+
+        fxi, delta, kappa, zone_codes — (steps, rows) np.memmap columns
+        lengths, breach_step, breach_code — (rows,) np.memmap columns
+    """
+
+    def __init__(self, path: str, header: Dict[str, Any], mode: str, chunk_steps: int = 64):
+        self.path = os.fspath(path)
+        self.header = header
+        self.mode = mode
+        self.chunk_steps = chunk_steps
+        for name, spec in header["columns"].items():
+            shape = tuple(spec["shape"])
+            if 0 in shape:
+                column = np.empty(shape, dtype=spec["dtype"])
+            else:
+                column = np.memmap(self.path, dtype=spec["dtype"], mode=mode,
+                                   offset=spec["offset"], shape=shape)
+            setattr(self, name, column)
+
+    @property
+    def rows(self) -> int:
+        return self.header["rows"]
+
+    @property
+    def steps(self) -> int:
+        return self.header["steps"]
+
+    @property
+    def width(self) -> int:
+        return self.header["width"]
+
+    @property
+    def complete(self) -> bool:
+        return self.header["complete"]
+
+    @property
+    def zone_names(self):
+        return tuple(self.header["zone_names"])
+
+    # header
+
+    @staticmethod
+    def _write_header(f, header: Dict[str, Any]):
+        text = json.dumps(header).encode("utf-8")
+        if len(MAGIC) + 4 + len(text) > HEADER_SIZE:
+            raise ValueError("trajectory header too large")
+        f.seek(0)
+        f.write(MAGIC + struct.pack("<I", len(text)) + text)
+
+    @classmethod
+    def create(cls, path, rows: int, steps: int, chunk_steps: int = 64) -> "TrajectoryStore":
+        """New store for `rows` trajectories of up to `steps` points (file is overwritten)."""
+        if chunk_steps <= 0:
+            raise ValueError("chunk_steps must be positive")
+        columns = _layout(rows, steps)
+        last = columns[ROW_COLUMNS[-1][0]]
+        size = last["offset"] + rows * np.dtype(last["dtype"]).itemsize
+        header = {"format": 1, "rows": rows, "steps": steps, "width": 0, "complete": False,
+                  "zone_names": list(ZONE_NAMES), "columns": columns}
+        with open(path, "wb") as f:
+            cls._write_header(f, header)
+            f.truncate(size)
+        return cls(path, header, "r+", chunk_steps)
+
+    @classmethod
+    def open(cls, path, mode: str = "r") -> "TrajectoryStore":
+        """Open an existing store ("r" read-only, "r+" read-write)."""
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path!r} is not an FRE trajectory store")
+            (length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(length).decode("utf-8"))
+        return cls(path, header, mode)
+
+    # writing (batch engine)
+
+    def prepare(self, t: int) -> int:
+        """
+        Flush the steps before t and reset the next chunk of steps
+        [t, t + chunk_steps) to NaN / −1. Returns the first step after it.
+        """
+        if t > 0:
+            self.flush()
+        stop = min(t + self.chunk_steps, self.steps)
+        for name, _, fill in TIME_COLUMNS:
+            getattr(self, name)[t:stop] = fill
+        return stop
+
+    def finalize(self, width: int, lengths: np.ndarray, breach_step: np.ndarray,
+                 breach_code: np.ndarray, zone_names: Sequence[str]):
+        """Store per-row results, mark the run complete and flush."""
+        self.lengths[:] = lengths
+        self.breach_step[:] = breach_step
+        self.breach_code[:] = breach_code
+        self.header.update(width=int(width), complete=True, zone_names=list(zone_names))
+        self.flush()
+        with open(self.path, "r+b") as f:
+            self._write_header(f, self.header)
+
+    def flush(self):
+        for name in self.header["columns"]:
+            column = getattr(self, name)
+            if isinstance(column, np.memmap):
+                column.flush()
+
+    # reading
+
+    def result(self, width: Optional[int] = None):
+        """
+        BatchSimulationResult over the stored series; (rows, width) views
+        of the memory maps, no data is copied.
+        """
+        from .batch import BatchSimulationResult
+        width = self.width if width is None else width
+        return BatchSimulationResult(
+            fxi=self.fxi[:width].T,
+            delta=self.delta[:width].T,
+            kappa=self.kappa[:width].T,
+            zone_codes=self.zone_codes[:width].T,
+            lengths=self.lengths,
+            breach_step=self.breach_step,
+            breach_code=self.breach_code,
+            zone_names=self.zone_names,
+        )
+
+
+def open_trajectories(path) -> "BatchSimulationResult":
+    """Read-only, memory-mapped BatchSimulationResult of a completed store."""
+    store = TrajectoryStore.open(path)
+    if not store.complete:
+        raise ValueError(f"{path!r}: simulation did not complete")
+    return store.result()
@@ -0,0 +1,266 @@
+"""
+Sweep Module — FRE Simulator V2.0
+=================================
+
+This module evaluates **stress surfaces**: grids of FRE simulations over
+the parameters
+
+    alpha       — contraction of DefaultOperator
+    shock_size  — additive single-step shock (FXI by default)
+    shock_time  — step t0 of the shock
+
+The grid is the Cartesian product of the given axes. Every grid point is
+one row of a StateBlock, and rows are evolved together by the batch engine
+(`run_simulation_batch`) with per-row α and per-row shocks, so a grid costs
+a few array operations per step instead of one `run_simulation` per point.
+
+Memory:
+    Rows are processed in chunks of `chunk_size`; a chunk holds its
+    (horizon+1, chunk_size) series only until its metrics are reduced.
+    Chunks can run in parallel worker processes.
+
+Per grid point the sweep reports
+
+    breach_step     — step of the first breach, −1 if none
+    max_deviation   — max |FXI(t) − 1| over the recorded series
+    time_to_stable  — steps from the shock until FXI enters the first
+                      (stable) zone and stays there to the horizon;
+                      NaN if never, or if the row breached
+    mean_kappa      — mean κ(t) over the recorded steps t ≥ 1
+"""
+
+# sweep.py
+# Parameter-sweep engine for FRE Simulator V2.0
+# Cartesian grids over (alpha, shock size, shock time), chunked batch evaluation.
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .state import State, StateBlock, STATE_FIELDS
+from .operators import DefaultOperator
+from .scenarios import SingleStepShockScenario
+from .batch import run_simulation_batch
+
+
+# Sweepable parameters and their values when no axis is given
+SWEEP_DEFAULTS = {"alpha": 0.7, "shock_size": 0.0, "shock_time": 1}
+
+# Component shifted by the shock (SingleStepShockScenario keyword)
+SHOCK_COMPONENTS = {"fxi": "fxi_shift", "qp": "qp_shift", "qf": "qf_shift"}
+
+SWEEP_METRICS = ("breach_step", "max_deviation", "time_to_stable", "mean_kappa")
+
+
+@dataclass
+class SweepResult:
+    """
+    Labelled metric cube of a parameter sweep.
+
+        axes — ordered mapping axis name → coordinate array; the metric
+               arrays have one dimension per axis, in this order
+        breach_step, max_deviation, time_to_stable, mean_kappa
+             — metric arrays (see module docstring)
+    """
+    axes: Dict[str, np.ndarray]
+    breach_step: np.ndarray
+    max_deviation: np.ndarray
+    time_to_stable: np.ndarray
+    mean_kappa: np.ndarray
+
+    metrics = SWEEP_METRICS
+
+    @property
+    def dims(self):
+        return tuple(self.axes)
+
+    @property
+    def shape(self):
+        return self.breach_step.shape
+
+    @property
+    def breach_occurred(self) -> np.ndarray:
+        return self.breach_step >= 0
+
+    def sel(self, **coords) -> Dict[str, Any]:
+        """
+        Metrics at the given axis coordinates (exact match), e.g.
+            result.sel(alpha=0.9, shock_time=10)
+        Axes not named keep their full extent.
+        """
+        index = []
+        for name, values in self.axes.items():
+            if name not in coords:
+                index.append(slice(None))
+                continue
+            hits = np.flatnonzero(values == coords.pop(name))
+            if len(hits) == 0:
+                raise KeyError(f"{name}: no such coordinate")
+            index.append(int(hits[0]))
+        if coords:
+            raise KeyError(f"unknown axes: {sorted(coords)}")
+        index = tuple(index)
+        return {metric: getattr(self, metric)[index] for metric in self.metrics}
+
+    def to_xarray(self):
+        """
+        Convert to an xarray.Dataset (requires the optional xarray package).
+        """
+        try:
+            import xarray as xr
+        except ImportError:
+            raise ImportError("to_xarray() requires the xarray package") from None
+        return xr.Dataset(
+            {metric: (self.dims, getattr(self, metric)) for metric in self.metrics},
+            coords=self.axes,
+        )
+
+
+def _run_chunk(task: tuple) -> Dict[str, np.ndarray]:
+    """
+    Worker: evaluate grid points [start, stop) as one batch and reduce
+    them to per-point metrics.
+    """
+    initial_state, params, shock_key, horizon, config = task
+    n = len(params["alpha"])
+
+    states = StateBlock(**{name: np.full(n, getattr(initial_state, name)) for name in STATE_FIELDS})
+    shock_time = params["shock_time"]
+    scenario = SingleStepShockScenario(t0=shock_time, **{shock_key: params["shock_size"]})
+    result = run_simulation_batch(states, DefaultOperator(alpha=params["alpha"]),
+                                  scenario, horizon, config)
+
+    width = result.fxi.shape[1]
+    steps = np.arange(width)
+    recorded = steps < result.lengths[:, None]
+
+    max_deviation = np.nanmax(np.abs(result.fxi - 1.0), axis=1)
+
+    kappa_steps = recorded[:, 1:]
+    kappa_count = kappa_steps.sum(axis=1)
+    kappa_sum = np.where(kappa_steps, result.kappa[:, 1:], 0.0).sum(axis=1)
+    mean_kappa = np.full(n, np.nan)
+    np.divide(kappa_sum, kappa_count, out=mean_kappa, where=kappa_count > 0)
+
+    # first step from which every recorded point is in zone 0 (stable)
+    unstable = recorded & (result.zone_codes != 0)
+    last_unstable = np.where(unstable.any(axis=1),
+                             width - 1 - np.argmax(unstable[:, ::-1], axis=1), -1)
+    settle = np.maximum(last_unstable + 1, shock_time)
+    time_to_stable = (settle - shock_time).astype(np.float64)
+    time_to_stable[(settle >= result.lengths) | result.breach_occurred] = np.nan
+
+    return {
+        "breach_step": result.breach_step,
+        "max_deviation": max_deviation,
+        "time_to_stable": time_to_stable,
+        "mean_kappa": mean_kappa,
+    }
+
+
+def evaluate_points(
+    initial_state: State,
+    params: Mapping[str, Any],
+    horizon: int,
+    config: Optional[dict] = None,
+    shock: str = "fxi",
+    chunk_size: int = 4096,
+    workers: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Metrics of a flat list of parameter points (no grid).
+
+    `params` maps every SWEEP_DEFAULTS parameter to a 1-D array with one
+    entry per point (scalars are broadcast). Points are evaluated in
+    batches of `chunk_size`, optionally in `workers` processes.
+
+    Returns:
+        dict metric → 1-D array over the points (SWEEP_METRICS).
+    """
+    if horizon <= 0:
+        raise ValueError("horizon must be positive")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if shock not in SHOCK_COMPONENTS:
+        raise ValueError(f"shock must be one of {tuple(SHOCK_COMPONENTS)}, got {shock!r}")
+
+    size = max(np.size(params[name]) for name in SWEEP_DEFAULTS)
+    points = {
+        "alpha": np.broadcast_to(params["alpha"], size).astype(np.float64),
+        "shock_size": np.broadcast_to(params["shock_size"], size).astype(np.float64),
+        "shock_time": np.broadcast_to(params["shock_time"], size).astype(np.int64),
+    }
+
+    state = State(**{name: getattr(initial_state, name) for name in STATE_FIELDS})
+    tasks = [
+        (state, {k: v[start:start + chunk_size] for k, v in points.items()},
+         SHOCK_COMPONENTS[shock], horizon, config)
+        for start in range(0, size, chunk_size)
+    ]
+
+    if workers is None or workers <= 1:
+        chunks = list(map(_run_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_run_chunk, tasks))
+
+    return {
+        metric: np.concatenate([chunk[metric] for chunk in chunks])
+        for metric in SWEEP_METRICS
+    }
+
+
+def run_sweep(
+    initial_state: State,
+    axes: Mapping[str, Sequence[float]],
+    horizon: int,
+    config: Optional[dict] = None,
+    defaults: Optional[Mapping[str, float]] = None,
+    shock: str = "fxi",
+    chunk_size: int = 4096,
+    workers: Optional[int] = None
+) -> SweepResult:
+    """
+    Evaluate the FRE stress surface over a Cartesian parameter grid.
+
+    Parameters:
+        initial_state — starting structural state S0 (shared by all points)
+        axes          — mapping of parameter → coordinates, e.g.
+                        {"alpha": [...], "shock_size": [...], "shock_time": [...]};
+                        parameters from SWEEP_DEFAULTS, in the order of the
+                        result dimensions
+        horizon       — number of steps per point
+        config        — optional engine config (see run_simulation)
+        defaults      — values of the parameters without an axis
+                        (overrides SWEEP_DEFAULTS)
+        shock         — component shifted by the shock: "fxi", "qp" or "qf"
+        chunk_size    — grid points per batch (bounds memory)
+        workers       — number of worker processes; None or 1 runs
+                        in the current process
+
+    Returns:
+        SweepResult with one metric array per SWEEP_METRICS entry.
+    """
+    unknown = (set(axes) | set(defaults or {})) - set(SWEEP_DEFAULTS)
+    if unknown:
+        raise ValueError(f"unknown sweep parameters {sorted(unknown)}; "
+                         f"expected {tuple(SWEEP_DEFAULTS)}")
+
+    coords = {name: np.asarray(values) for name, values in axes.items()}
+    for name, values in coords.items():
+        if values.ndim != 1 or len(values) == 0:
+            raise ValueError(f"axis {name!r} must be a non-empty 1-D sequence")
+    fixed = {**SWEEP_DEFAULTS, **(defaults or {})}
+    shape = tuple(len(values) for values in coords.values())
+
+    # Flattened grid, one entry per point
+    mesh = np.meshgrid(*coords.values(), indexing="ij") if coords else []
+    grid = {name: m.ravel() for name, m in zip(coords, mesh)}
+    params = {name: grid.get(name, fixed[name]) for name in SWEEP_DEFAULTS}
+    metrics = evaluate_points(initial_state, params, horizon, config, shock,
+                              chunk_size, workers)
+    return SweepResult(axes=coords, **{
+        metric: values.reshape(shape) for metric, values in metrics.items()
+    })
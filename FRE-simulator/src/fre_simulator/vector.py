@@ -0,0 +1,544 @@
+"""
+Vector Engine Module — FRE Simulator V2.0
+=========================================
+
+This module implements the **vector form** of the structural deviation.
+
+A structural configuration X ∈ ℝᵈ deviates from its reference X* by
+
+    Δ⃗ = X − X*
+
+and the scalar quantities used by the evolution loop are derived from the
+weighted norm of the FRE specification:
+
+    ‖Δ⃗‖_W = √(Δ⃗ᵀ W Δ⃗)          (W symmetric positive definite, default I)
+    FXI   = 1 + s ⋅ ‖Δ⃗‖_W       (s = fxi_scale)
+
+Two layouts are provided:
+
+- `VectorState` — one state with the State protocol
+  (validate / compute_delta / update_from_operator), usable with
+  `run_simulation`, `iter_simulation` and `FRESession` and any scalar
+  operator: the FXI contraction k = |FXI(t+1) − 1| / |FXI(t) − 1| is
+  applied to Δ⃗ as Δ⃗ ← k ⋅ Q ⋅ Δ⃗ with an optional mixing matrix Q
+  (rescaled to ‖Δ⃗‖_W = |FXI(t+1) − 1| / s when Q does not preserve the
+  W-norm, so the stored FXI is the operator's).
+- `VectorBlock` — B states as (B, d) arrays, evolved by
+  `run_vector_batch` under a matrix / affine operator
+  E(Δ⃗) = K ⋅ Q ⋅ Δ⃗ + b (`MatrixOperator`) with one matmul per step.
+"""
+
+# vector.py
+# d-dimensional deviation Δ⃗, weighted norm ‖Δ⃗‖_W, matrix-operator batch engine.
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+
+from .state import State, AdmissibilityError
+from .operators import MatrixOperator
+from .scenarios import BaseScenario
+from .zones import ZoneClassifier
+from .engine import _capacity_limits, _reset_operator
+from .sensitivity import (
+    FD_STEP,
+    SensitivityResult,
+    sensitivity_vector,
+    unit_direction,
+    operator_jacobian,
+    directional_gain,
+)
+from .diagnostics import FRERecords, THETA_CRIT
+from .batch import (
+    BatchSimulationResult,
+    _BREACH_FXI,
+    _BREACH_DELTA,
+)
+
+
+def _weight_matrix(weights: Any, d: int) -> Optional[np.ndarray]:
+    """
+    Validate a weight matrix W for dimension d; None stands for W = I.
+    A one-dimensional `weights` is taken as the diagonal of W.
+    """
+    if weights is None:
+        return None
+    W = np.asarray(weights, dtype=np.float64)
+    if W.ndim == 1:
+        W = np.diag(W)
+    if W.shape != (d, d):
+        raise ValueError(f"weight matrix must have shape ({d}, {d}), got {W.shape}")
+    if not np.allclose(W, W.T):
+        raise ValueError("weight matrix must be symmetric")
+    try:
+        np.linalg.cholesky(W)
+    except np.linalg.LinAlgError:
+        raise ValueError("weight matrix must be positive definite") from None
+    return W
+
+
+def weighted_norm(delta: Any, weights: Optional[np.ndarray] = None) -> Any:
+    """
+    ‖Δ⃗‖_W = √(Δ⃗ᵀ W Δ⃗) over the last axis of `delta`.
+
+    `delta` may be one vector (d,) or a batch (B, d); W = I if `weights`
+    is None. Returns a float for a single vector, an array otherwise.
+    """
+    delta = np.asarray(delta, dtype=np.float64)
+    if weights is None:
+        sq = np.einsum("...i,...i->...", delta, delta)
+    else:
+        sq = np.einsum("...i,...i->...", delta @ weights, delta)
+    # rounding can leave tiny negative values for W ≠ I
+    norm = np.sqrt(np.maximum(sq, 0.0))
+    return float(norm) if norm.ndim == 0 else norm
+
+
+class VectorState:
+    """
+    Structural state with a d-dimensional deviation Δ⃗ = x − x_ref.
+
+    Components:
+        x         — actual structural configuration, float64 array (d,)
+        x_ref     — reference (equilibrium) configuration, array (d,)
+        weights   — weight matrix W of ‖Δ⃗‖_W (None = identity)
+        fxi_scale — s in FXI = 1 + s ⋅ ‖Δ⃗‖_W
+        mixing    — optional matrix Q applied to Δ⃗ on each correction
+        delta     — ‖Δ⃗‖_W (derived)
+        fxi       — FXI (derived)
+
+    Scenarios modify `x` (or `x_ref`). Copies (copy.copy, as taken by the
+    engine for snapshots) own their configuration arrays.
+    """
+    __slots__ = ("x", "x_ref", "weights", "fxi_scale", "mixing", "delta", "fxi")
+
+    # capacity thresholds (same defaults as State)
+    DELTA_MAX = State.DELTA_MAX
+    FXI_MIN = State.FXI_MIN
+    FXI_MAX = State.FXI_MAX
+
+    def __init__(self, x: Any, x_ref: Any = None, weights: Any = None,
+                 fxi_scale: float = 1.0, mixing: Any = None):
+        self.x = np.array(x, dtype=np.float64)
+        if self.x.ndim != 1:
+            raise ValueError("x must be one-dimensional")
+        d = self.x.shape[0]
+        self.x_ref = np.zeros(d) if x_ref is None else np.array(x_ref, dtype=np.float64)
+        if self.x_ref.shape != (d,):
+            raise ValueError(f"x_ref must have shape ({d},), got {self.x_ref.shape}")
+        self.weights = _weight_matrix(weights, d)
+        self.fxi_scale = float(fxi_scale)
+        self.mixing = None if mixing is None else np.asarray(mixing, dtype=np.float64)
+        if self.mixing is not None and self.mixing.shape != (d, d):
+            raise ValueError(f"mixing matrix must have shape ({d}, {d}), got {self.mixing.shape}")
+        self.compute_delta()
+
+    @property
+    def dim(self) -> int:
+        return self.x.shape[0]
+
+    @property
+    def delta_vec(self) -> np.ndarray:
+        """Deviation vector Δ⃗ = x − x_ref."""
+        return self.x - self.x_ref
+
+    def validate(self):
+        """Validate admissibility of ‖Δ⃗‖_W and FXI."""
+        if abs(self.delta) > self.DELTA_MAX:
+            raise AdmissibilityError(f"‖Δ‖_W={self.delta} exceeds admissible bound {self.DELTA_MAX}")
+
+        if not (self.FXI_MIN <= self.fxi <= self.FXI_MAX):
+            raise AdmissibilityError(f"FXI(t)={self.fxi} outside admissible range [{self.FXI_MIN}, {self.FXI_MAX}]")
+
+    def compute_delta(self):
+        """Recompute ‖Δ⃗‖_W and FXI = 1 + s ⋅ ‖Δ⃗‖_W from x and x_ref."""
+        self.delta = weighted_norm(self.x - self.x_ref, self.weights)
+        self.fxi = 1.0 + self.fxi_scale * self.delta
+        return self.delta
+
+    def update_from_operator(self, new_fxi_value):
+        """
+        Apply the FXI contraction of operator E to Δ⃗:
+            k = |FXI(t+1) − 1| / |FXI(t) − 1|,   Δ⃗ ← k ⋅ Q ⋅ Δ⃗
+        then recompute ‖Δ⃗‖_W and FXI. At equilibrium (FXI = 1) Δ⃗ = 0.
+
+        With a mixing matrix Q the direction QΔ⃗ is rescaled to
+        ‖Δ⃗‖_W = |FXI(t+1) − 1| / s, so the new FXI equals
+        `new_fxi_value` (for FXI(t+1) ≥ 1) whether or not Q preserves
+        the W-norm; the engine's capacity check on FXI(t+1) then
+        describes the stored state.
+        """
+        prev_dev = self.fxi - 1.0
+        delta_vec = self.x - self.x_ref
+        if prev_dev == 0.0 or self.delta == 0.0:
+            self.x = self.x_ref.copy()
+        elif self.mixing is None:
+            k_eff = abs((new_fxi_value - 1.0) / prev_dev)
+            self.x = self.x_ref + k_eff * delta_vec
+        else:
+            delta_vec = self.mixing @ delta_vec
+            norm = weighted_norm(delta_vec, self.weights)
+            if norm == 0.0:
+                self.x = self.x_ref.copy()
+            else:
+                self.x = self.x_ref + abs(new_fxi_value - 1.0) / (self.fxi_scale * norm) * delta_vec
+        self.compute_delta()
+        self.validate()
+
+    def __copy__(self):
+        clone = VectorState.__new__(VectorState)
+        clone.x = self.x.copy()
+        clone.x_ref = self.x_ref.copy()
+        clone.weights = self.weights
+        clone.fxi_scale = self.fxi_scale
+        clone.mixing = self.mixing
+        clone.delta = self.delta
+        clone.fxi = self.fxi
+        return clone
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (np.array_equal(self.x, other.x) and np.array_equal(self.x_ref, other.x_ref)
+                and self.delta == other.delta and self.fxi == other.fxi)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return (f"VectorState(x={self.x.tolist()!r}, x_ref={self.x_ref.tolist()!r}, "
+                f"delta={self.delta!r}, fxi={self.fxi!r})")
+
+
+@dataclass
+class VectorBlock:
+    """
+    B structural states with d-dimensional deviations, as (B, d) arrays.
+
+        x, x_ref  — configurations; x_ref may be given as one (d,) vector
+                    shared by all rows
+        weights   — weight matrix W of ‖Δ⃗‖_W, shared by all rows (None = I)
+        fxi_scale — s in FXI = 1 + s ⋅ ‖Δ⃗‖_W
+    """
+    x: np.ndarray
+    x_ref: Any = None
+    weights: Any = None
+    fxi_scale: float = 1.0
+
+    # capacity thresholds (same defaults as State)
+    DELTA_MAX = State.DELTA_MAX
+    FXI_MIN = State.FXI_MIN
+    FXI_MAX = State.FXI_MAX
+
+    def __post_init__(self):
+        x = np.array(self.x, dtype=np.float64)
+        if x.ndim != 2:
+            raise ValueError("x must have shape (B, d)")
+        ref = np.zeros(x.shape[1]) if self.x_ref is None else np.asarray(self.x_ref, dtype=np.float64)
+        try:
+            ref = np.array(np.broadcast_to(ref, x.shape))
+        except ValueError:
+            raise ValueError(f"x_ref of shape {ref.shape} does not match x of shape {x.shape}") from None
+        self.x = x
+        self.x_ref = ref
+        self.weights = _weight_matrix(self.weights, x.shape[1])
+        self.fxi_scale = float(self.fxi_scale)
+
+    def __len__(self):
+        return self.x.shape[0]
+
+    @property
+    def dim(self) -> int:
+        return self.x.shape[1]
+
+    @classmethod
+    def from_states(cls, states) -> "VectorBlock":
+        """
+        Stack VectorStates of equal dimension, weights and fxi_scale.
+        (Mixing matrices are not used by the batch engine; the operator
+        carries Q.)
+        """
+        states = list(states)
+        if not states:
+            raise ValueError("at least one state is required")
+        first = states[0]
+        for s in states[1:]:
+            same_w = (s.weights is None and first.weights is None) or (
+                s.weights is not None and first.weights is not None
+                and np.array_equal(s.weights, first.weights))
+            if s.dim != first.dim or not same_w or s.fxi_scale != first.fxi_scale:
+                raise ValueError("states must share dimension, weights and fxi_scale")
+        return cls(
+            x=np.stack([s.x for s in states]),
+            x_ref=np.stack([s.x_ref for s in states]),
+            weights=first.weights,
+            fxi_scale=first.fxi_scale,
+        )
+
+    def delta_vec(self) -> np.ndarray:
+        """Deviation vectors Δ⃗ = x − x_ref, shape (B, d)."""
+        return self.x - self.x_ref
+
+    def norms(self) -> np.ndarray:
+        """‖Δ⃗‖_W per row."""
+        return weighted_norm(self.x - self.x_ref, self.weights)
+
+    def fxi(self) -> np.ndarray:
+        """FXI = 1 + s ⋅ ‖Δ⃗‖_W per row."""
+        return 1.0 + self.fxi_scale * self.norms()
+
+    def validate(self, rows=None):
+        """
+        Validate admissibility of ‖Δ⃗‖_W and FXI for all rows, or for the
+        rows selected by the boolean mask `rows`.
+        """
+        norm = self.norms()
+        fxi = 1.0 + self.fxi_scale * norm
+
+        def _first_bad(bad):
+            if rows is not None:
+                bad &= rows
+            return int(np.argmax(bad)) if bad.any() else None
+
+        i = _first_bad(norm > self.DELTA_MAX)
+        if i is not None:
+            raise AdmissibilityError(f"row {i}: ‖Δ‖_W={norm[i]} exceeds admissible bound {self.DELTA_MAX}")
+
+        i = _first_bad(~((self.FXI_MIN <= fxi) & (fxi <= self.FXI_MAX)))
+        if i is not None:
+            raise AdmissibilityError(f"row {i}: FXI(t)={fxi[i]} outside admissible range [{self.FXI_MIN}, {self.FXI_MAX}]")
+
+
+@dataclass
+class VectorBatchResult(BatchSimulationResult):
+    """
+    Output of run_vector_batch: the BatchSimulationResult series with
+    delta = ‖Δ⃗‖_W, plus
+
+        final_delta — Δ⃗ of each row after its last recorded step, (B, d)
+        delta_vec   — Δ⃗ trajectories, (B, T, d), if requested (NaN past
+                      a row's length)
+        shocked_vec — post-scenario, pre-operator Δ⃗′ of step t, (B, T, d),
+                      recorded with delta_vec (NaN at t=0)
+        sensitivity — SensitivityResult, if requested
+        x_ref, weights, fxi_scale — reference configuration (B, d), W and
+                      s of the block
+    """
+    final_delta: Optional[np.ndarray] = None
+    delta_vec: Optional[np.ndarray] = None
+    shocked_vec: Optional[np.ndarray] = None
+    sensitivity: Optional[SensitivityResult] = None
+    x_ref: Optional[np.ndarray] = None
+    weights: Optional[np.ndarray] = None
+    fxi_scale: float = 1.0
+
+    def records(self, theta_crit: float = THETA_CRIT, repeller_zone: str = "critical") -> FRERecords:
+        """
+        Full FRERecord diagnostics (Section 57.1) of a run recorded with
+        record_vectors=True; fields are computed lazily on first access.
+        """
+        return FRERecords(self, theta_crit, repeller_zone)
+
+
+def run_vector_batch(
+    initial_states: VectorBlock,
+    operator: MatrixOperator,
+    scenario: BaseScenario,
+    horizon: int,
+    config: Optional[dict] = None,
+    record_vectors: bool = False,
+    sensitivity: bool = False,
+    fd_step: float = FD_STEP,
+    record_jacobians: bool = False
+) -> VectorBatchResult:
+    """
+    Evolve every row of a VectorBlock under E(Δ⃗) = K ⋅ Q ⋅ Δ⃗ + b.
+
+    Steps per iteration t (same order and breach rules as
+    run_simulation_batch):
+        1. Apply scenario (scenario.apply_batch on the block)
+        2. Δ⃗(t) = x − x_ref
+        3. Δ⃗(t+1) = E(Δ⃗(t)) for all rows, one matmul
+        4. Capacity check on FXI            (fxi-capacity breach, step not stored)
+        5. Update x = x_ref + Δ⃗(t+1), validate
+        6. Classify stability zone, κ = ‖Δ⃗(t+1)‖_W / ‖Δ⃗(t)‖_W
+        7. Capacity check on ‖Δ⃗‖_W          (delta-capacity breach, step stored)
+
+    Parameters:
+        initial_states — VectorBlock with one initial state per row
+        operator       — MatrixOperator of the block's dimension, or any
+                         operator with `dim` and a batched apply_vector()
+        scenario       — scenario supporting apply_batch on a VectorBlock
+                         (EmptyScenario, VectorShockScenario)
+        horizon        — number of steps
+        config         — optional dict, same keys as run_simulation
+        record_vectors — if True, also store the Δ⃗ and post-scenario Δ⃗′
+                         trajectories (needed by VectorBatchResult.records)
+        sensitivity    — if True, run the sensitivity diagnostics stage:
+                         S(t), u(t), the operator Jacobian (analytic via
+                         operator.jacobian(), else batched central finite
+                         differences with step `fd_step`) and the
+                         directional gain ‖J u‖_W, for all rows at once
+        fd_step        — finite-difference step for operators without
+                         an analytic Jacobian
+        record_jacobians — if True (implies sensitivity), also keep the
+                         Jacobian of every step, (B, T, d, d); by default
+                         only the last one is kept to bound memory
+
+    Returns:
+        VectorBatchResult with per-row trajectories and breach data.
+    """
+    if horizon <= 0:
+        raise ValueError("horizon must be positive")
+    if operator.dim != initial_states.dim:
+        raise ValueError(f"operator dimension {operator.dim} does not match "
+                         f"state dimension {initial_states.dim}")
+
+    cfg = config or {}
+    classifier = ZoneClassifier.from_config(cfg)
+    delta_max, fxi_min, fxi_max = _capacity_limits(cfg, initial_states)
+    _reset_operator(operator)
+    sensitivity = sensitivity or record_jacobians
+
+    # Working copy (avoid mutating caller's block)
+    states = VectorBlock(initial_states.x, initial_states.x_ref,
+                         initial_states.weights, initial_states.fxi_scale)
+    states.validate()
+    W, scale = states.weights, states.fxi_scale
+
+    # Time-major buffers: step t is one contiguous row of B values
+    n, d = states.x.shape
+    fxi_out = np.full((horizon + 1, n), np.nan)
+    delta_out = np.full((horizon + 1, n), np.nan)
+    kappa_out = np.full((horizon + 1, n), np.nan)
+    zone_out = np.full((horizon + 1, n), -1, dtype=np.int8)
+    vec_out = np.full((horizon + 1, n, d), np.nan) if record_vectors else None
+    shock_out = np.full((horizon + 1, n, d), np.nan) if record_vectors else None
+    if sensitivity:
+        sens_out = np.full((horizon + 1, n, d), np.nan)
+        dir_out = np.full((horizon + 1, n, d), np.nan)
+        gain_out = np.full((horizon + 1, n), np.nan)
+        analytic = hasattr(operator, "jacobian")
+        jac_last = None
+        jac_out = np.full((horizon + 1, n, d, d), np.nan) if record_jacobians else None
+    lengths = np.ones(n, dtype=np.int64)
+    breach_step = np.full(n, -1, dtype=np.int64)
+    breach_code = np.zeros(n, dtype=np.int8)
+
+    # Record initial point (t=0)
+    delta_vec = states.x - states.x_ref
+    norm = weighted_norm(delta_vec, W)
+    fxi = 1.0 + scale * norm
+    fxi_out[0] = fxi
+    delta_out[0] = norm
+    zone_out[0] = classifier.classify_array(fxi)
+    if record_vectors:
+        vec_out[0] = delta_vec
+    if sensitivity:
+        sens_out[0] = sensitivity_vector(delta_vec, W)
+        dir_out[0] = unit_direction(delta_vec, W)
+    final_delta = delta_vec.copy()
+
+    active = np.ones(n, dtype=bool)
+
+    for t in range(1, horizon + 1):
+        if not active.any():
+            break
+
+        # 1) Apply scenario at step t
+        states = scenario.apply_batch(states, t)
+
+        # 2) Δ⃗(t) from the (possibly shocked) configuration
+        delta_vec = states.x - states.x_ref
+        norm = weighted_norm(delta_vec, W)
+        prev_fxi = 1.0 + scale * norm
+
+        # 3) Δ⃗(t+1) = E(Δ⃗(t))
+        next_vec = operator.apply_vector(delta_vec)
+
+        # Sensitivity stage: Jacobian and gain at the pre-operator Δ⃗(t)
+        if sensitivity:
+            jac = operator_jacobian(operator, delta_vec, fd_step)
+            gain = directional_gain(jac, unit_direction(delta_vec, W), W)
+        next_norm = weighted_norm(next_vec, W)
+        next_fxi = 1.0 + scale * next_norm
+
+        # Enforce capacity limits on FXI explicitly
+        fxi_breach = active & ((next_fxi < fxi_min) | (next_fxi > fxi_max))
+        if fxi_breach.any():
+            breach_step[fxi_breach] = t
+            breach_code[fxi_breach] = _BREACH_FXI
+            active &= ~fxi_breach
+
+        # 4) Update configuration (active rows only)
+        states.x = np.where(active[:, None], states.x_ref + next_vec, states.x)
+        states.validate(active)
+
+        # 5) Classify stability zone, 6) compute κ
+        zones = classifier.classify_array(next_fxi)
+        kappa = np.zeros(n)
+        np.divide(next_norm, norm, out=kappa, where=norm != 0)
+
+        # 7) Check ‖Δ⃗‖_W capacity (breach step is still stored)
+        delta_breach = active & (next_norm > delta_max)
+        if delta_breach.any():
+            breach_step[delta_breach] = t
+            breach_code[delta_breach] = _BREACH_DELTA
+
+        # 8) Store trajectories
+        np.copyto(fxi_out[t], next_fxi, where=active)
+        np.copyto(delta_out[t], next_norm, where=active)
+        np.copyto(kappa_out[t], kappa, where=active)
+        np.copyto(zone_out[t], zones, where=active)
+        np.copyto(final_delta, next_vec, where=active[:, None])
+        if record_vectors:
+            np.copyto(vec_out[t], next_vec, where=active[:, None])
+            np.copyto(shock_out[t], delta_vec, where=active[:, None])
+        if sensitivity:
+            np.copyto(sens_out[t], sensitivity_vector(next_vec, W), where=active[:, None])
+            np.copyto(dir_out[t], unit_direction(next_vec, W), where=active[:, None])
+            np.copyto(gain_out[t], gain, where=active)
+            if record_jacobians:
+                np.copyto(jac_out[t], jac, where=active[:, None, None])
+            if jac.ndim == 2:
+                jac_last = jac
+            else:
+                if jac_last is None:
+                    jac_last = np.full((n, d, d), np.nan)
+                np.copyto(jac_last, jac, where=active[:, None, None])
+        lengths += active
+
+        active &= ~delta_breach
+
+    # (B, T) views over the time-major buffers
+    width = int(lengths.max())
+    sens_result = None
+    if sensitivity:
+        if jac_last is None:
+            # no operator step was recorded
+            jac_last = operator_jacobian(operator, final_delta, fd_step)
+        sens_result = SensitivityResult(
+            sensitivity=sens_out[:width].transpose(1, 0, 2),
+            direction=dir_out[:width].transpose(1, 0, 2),
+            gain=gain_out[:width].T,
+            jacobian=jac_last,
+            analytic=analytic,
+            jacobians=jac_out[:width].transpose(1, 0, 2, 3) if record_jacobians else None,
+        )
+    return VectorBatchResult(
+        fxi=fxi_out[:width].T,
+        delta=delta_out[:width].T,
+        kappa=kappa_out[:width].T,
+        zone_codes=zone_out[:width].T,
+        lengths=lengths,
+        breach_step=breach_step,
+        breach_code=breach_code,
+        zone_names=classifier.zone_names,
+        final_delta=final_delta,
+        delta_vec=vec_out[:width].transpose(1, 0, 2) if record_vectors else None,
+        shocked_vec=shock_out[:width].transpose(1, 0, 2) if record_vectors else None,
+        sensitivity=sens_result,
+        x_ref=states.x_ref,
+        weights=W,
+        fxi_scale=scale,
+    )
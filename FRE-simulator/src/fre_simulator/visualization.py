@@ -3,6 +3,7 @@
 # Provides FXI, Δ, stability zone and combined trajectory visualization.
 
 import matplotlib.pyplot as plt
+import numpy as np
 from typing import Optional
 
 from .engine import SimulationResult
@@ -113,3 +114,34 @@ def plot_combined(result: SimulationResult,
     plt.suptitle(title)
     plt.tight_layout()
     plt.show()
+
+
+def plot_zone_occupancy(result,
+                        figsize=(12, 4),
+                        title: Optional[str] = "Zone Occupancy"):
+    """
+    Share of batch rows in each stability zone over time.
+
+    Works on any BatchSimulationResult, including memory-mapped ones
+    (run_simulation_batch with storage=): the counts are reduced block by
+    block from the time-major series (BatchSimulationResult.zone_counts).
+    """
+    colors = {
+        "stable": "green",
+        "stressed": "gold",
+        "critical": "red"
+    }
+    counts = result.zone_counts()
+    totals = np.maximum(counts.sum(axis=1, keepdims=True), 1)
+    shares = (counts / totals).T
+
+    plt.figure(figsize=figsize)
+    plt.stackplot(range(counts.shape[0]), shares,
+                  labels=result.zone_names,
+                  colors=[colors.get(name, "gray") for name in result.zone_names])
+    plt.title(title)
+    plt.xlabel("t")
+    plt.ylabel("share of rows")
+    plt.legend(loc="upper right")
+    plt.tight_layout()
+    plt.show()
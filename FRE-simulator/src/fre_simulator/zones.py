@@ -0,0 +1,149 @@
+"""
+Zones Module — FRE Simulator V2.0
+=================================
+
+This module implements the **stability zone classification** shared by the
+scalar, streaming, session and batch engines.
+
+Zones are ordered by the deviation |FXI − 1| from structural equilibrium.
+With upper bounds b₀ < b₁ < … the zone index of a value is
+
+    i = min { k : |FXI − 1| ≤ bₖ }      (last zone if no bound holds)
+
+The default classifier reproduces the FRE 2.0 zones:
+
+    stable    |FXI − 1| ≤ eps1
+    stressed  eps1 < |FXI − 1| ≤ eps2
+    critical  |FXI − 1| > eps2
+
+Optionally, the **compressed** zone of the JSON specification (structural
+state below equilibrium) is emitted for FXI < 1 − c. It takes precedence
+over the deviation zones on the lower side and has the last code.
+
+Zones are reported either as names or as compact int8 codes (the index
+into `zone_names`). Arrays are classified with one `searchsorted` call.
+"""
+
+# zones.py
+# Stability zone classifier for FRE Simulator V2.0
+# Ordered |FXI − 1| bands, optional compressed zone, scalar and array paths.
+
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+
+# Default zone names (index = compact integer zone code)
+ZONE_NAMES = ("stable", "stressed", "critical")
+COMPRESSED = "compressed"
+
+# Default thresholds of the FRE 2.0 zones
+DEFAULT_EPS1 = 0.02
+DEFAULT_EPS2 = 0.10
+
+
+class ZoneClassifier:
+    """
+    Stability zone classifier built once from ordered thresholds.
+
+        zone_names — names indexed by zone code; deviation zones first,
+                     then "compressed" if enabled
+        bounds     — inclusive upper bounds of |FXI − 1| for all
+                     deviation zones but the last
+        compressed — FXI < 1 − compressed is the compressed zone,
+                     None if disabled
+        codes      — name → code lookup
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str] = ZONE_NAMES,
+        bounds: Sequence[float] = (DEFAULT_EPS1, DEFAULT_EPS2),
+        compressed: Optional[float] = None
+    ):
+        names = tuple(names)
+        bounds = tuple(float(b) for b in bounds)
+        if len(names) != len(bounds) + 1:
+            raise ValueError(f"{len(names)} zones need {len(names) - 1} bounds, got {len(bounds)}")
+        if any(b < 0.0 for b in bounds) or any(b2 <= b1 for b1, b2 in zip(bounds, bounds[1:])):
+            raise ValueError(f"zone bounds must be non-negative and increasing, got {bounds}")
+        if compressed is not None and compressed < 0.0:
+            raise ValueError(f"compressed threshold must be non-negative, got {compressed}")
+
+        self.zone_names = names + ((COMPRESSED,) if compressed is not None else ())
+        if len(set(self.zone_names)) != len(self.zone_names):
+            raise ValueError(f"zone names must be unique, got {self.zone_names}")
+
+        self.bounds = bounds
+        self.compressed = compressed
+        self.codes = {name: code for code, name in enumerate(self.zone_names)}
+
+        self._bounds_array = np.asarray(bounds, dtype=np.float64)
+        self._last = len(names) - 1
+        self._compressed_code = len(names) if compressed is not None else None
+
+    @classmethod
+    def from_config(cls, cfg: dict) -> "ZoneClassifier":
+        """
+        Build the classifier of an engine config.
+
+        Accepted keys (in order of precedence):
+            "zones": ZoneClassifier instance, or
+                     { "names": [...], "bounds": [...], "compressed": float }
+            "zone_thresholds": { "eps1": float, "eps2": float, "compressed": float }
+        """
+        zones = cfg.get("zones")
+        if isinstance(zones, ZoneClassifier):
+            return zones
+        if zones is not None:
+            return cls(zones["names"], zones["bounds"], zones.get("compressed"))
+
+        zone_cfg = cfg.get("zone_thresholds", {})
+        return cls(
+            ZONE_NAMES,
+            (zone_cfg.get("eps1", DEFAULT_EPS1), zone_cfg.get("eps2", DEFAULT_EPS2)),
+            zone_cfg.get("compressed"),
+        )
+
+    def code(self, fxi: float) -> int:
+        """Zone code of a single FXI value."""
+        dev = abs(fxi - 1.0)
+        if self._compressed_code is not None and fxi < 1.0 and dev > self.compressed:
+            return self._compressed_code
+        for i, bound in enumerate(self.bounds):
+            if dev <= bound:
+                return i
+        return self._last
+
+    def classify(self, fxi: float) -> str:
+        """Zone name of a single FXI value."""
+        return self.zone_names[self.code(fxi)]
+
+    def classify_array(self, fxi: Any) -> np.ndarray:
+        """
+        Zone codes (int8) of an array of FXI values, same shape.
+        NaN values fall into the last deviation zone, as in the scalar path.
+        """
+        fxi = np.asarray(fxi, dtype=np.float64)
+        dev = np.abs(fxi - 1.0)
+        codes = np.searchsorted(self._bounds_array, dev, side="left").astype(np.int8)
+        if self._compressed_code is not None:
+            codes[(fxi < 1.0) & (dev > self.compressed)] = self._compressed_code
+        return codes
+
+    def names_of(self, codes: Any) -> List[str]:
+        """Zone names of an array of zone codes."""
+        return [self.zone_names[code] for code in np.asarray(codes).ravel().tolist()]
+
+    def __eq__(self, other):
+        if not isinstance(other, ZoneClassifier):
+            return NotImplemented
+        return (self.zone_names, self.bounds, self.compressed) == \
+            (other.zone_names, other.bounds, other.compressed)
+
+    def __hash__(self):
+        return hash((self.zone_names, self.bounds, self.compressed))
+
+    def __repr__(self):
+        return (f"ZoneClassifier(names={self.zone_names[:self._last + 1]!r}, "
+                f"bounds={self.bounds!r}, compressed={self.compressed!r})")
@@ -0,0 +1,111 @@
+# tests/test_batch.py
+# Equivalence tests: batch engine vs. scalar engine for FRE Simulator V2.0.
+
+import numpy as np
+import pytest
+
+from fre_simulator import (
+    initial_state,
+    StateBlock,
+    DefaultOperator,
+    EmptyScenario,
+    SingleStepShockScenario,
+    ProgressiveShockScenario,
+    StochasticNoiseScenario,
+    run_simulation,
+    run_simulation_batch,
+)
+
+
+def _make_block():
+    """
+    Helper: a block of admissible initial states with varied FXI.
+    """
+    fxi = np.array([1.0, 1.5, 0.6, 2.0, 1.01, 4.9])
+    return StateBlock(
+        delta=fxi - 1.0,
+        fxi=fxi,
+        qp=1.0,
+        qf=1.0,
+        q=1.0,
+        w=1.0,
+        u=1.0,
+    )
+
+
+def _assert_rows_match(block, batch, operator, scenario_factory, horizon, config=None):
+    for i in range(len(block)):
+        S0 = initial_state(
+            delta=block.delta[i], fxi=block.fxi[i], qp=block.qp[i],
+            qf=block.qf[i], q=block.q[i], w=block.w[i], u=block.u[i],
+        )
+        scalar = run_simulation(S0, operator, scenario_factory(), horizon, config)
+        row = batch.row(i)
+
+        assert row.fxi_series == scalar.fxi_series
+        assert row.delta_series == scalar.delta_series
+        assert row.kappa_series == scalar.kappa_series
+        assert row.stability_zones == scalar.stability_zones
+        assert row.breach_occurred == scalar.breach_occurred
+        assert row.breach_step == scalar.breach_step
+        assert row.breach_type == scalar.breach_type
+
+
+def test_batch_matches_scalar_bit_for_bit():
+    """
+    Default operator + empty scenario:
+    every batch row must equal the scalar engine exactly (no tolerance).
+    """
+    block = _make_block()
+    op = DefaultOperator(alpha=0.7)
+    result = run_simulation_batch(block, op, EmptyScenario(), horizon=40)
+
+    assert result.fxi.shape == (len(block), 41)
+    assert not result.breach_occurred.any()
+    _assert_rows_match(block, result, op, EmptyScenario, horizon=40)
+
+
+def test_batch_matches_scalar_with_breaches_and_shocks():
+    """
+    Narrow capacity limits and deterministic scenarios:
+    per-row breach step/type and truncated series must match the scalar engine.
+    """
+    block = _make_block()
+    op = DefaultOperator(alpha=0.9)
+    config = {
+        "zone_thresholds": {"eps1": 0.05, "eps2": 0.2},
+        "capacity_limits": {"delta": 0.5, "fxi_min": 0.5, "fxi_max": 1.6},
+    }
+
+    for factory in (
+        lambda: SingleStepShockScenario(t0=3, qp_shift=0.5),
+        lambda: ProgressiveShockScenario(t_start=2, t_end=6, alpha=0.2),
+    ):
+        result = run_simulation_batch(block, op, factory(), horizon=15, config=config)
+        assert result.breach_occurred.any()
+        _assert_rows_match(block, result, op, factory, horizon=15, config=config)
+
+
+def test_batch_breach_masks():
+    """
+    Breach codes expose per-row masks by breach type.
+    """
+    block = _make_block()
+    config = {"capacity_limits": {"fxi_min": 0.5, "fxi_max": 1.6}}
+    result = run_simulation_batch(block, DefaultOperator(alpha=0.9), EmptyScenario(),
+                                  horizon=5, config=config)
+
+    mask = result.breach_mask("fxi-capacity-breach")
+    assert mask.tolist() == [False, False, False, True, False, True]
+    assert (result.breach_step[mask] == 1).all()
+    assert (result.lengths[mask] == 1).all()
+    assert (result.zone_codes[mask, 1:] == -1).all()
+
+
+def test_batch_rejects_stochastic_scenario():
+    """
+    Scenarios without a column form are rejected instead of silently diverging.
+    """
+    with pytest.raises(NotImplementedError):
+        run_simulation_batch(_make_block(), DefaultOperator(),
+                             StochasticNoiseScenario(sigma=0.1, seed=1), horizon=5)
@@ -0,0 +1,125 @@
+# tests/test_cache.py
+# Tests for canonical request keys and the result cache.
+
+import asyncio
+import random
+
+from fre_simulator import (
+    initial_state,
+    DefaultOperator,
+    SingleStepShockScenario,
+    StochasticNoiseScenario,
+    load_scenario,
+    register_scenario,
+    ResultCache,
+    request_key,
+    run_simulation,
+    run_simulation_cached,
+    FREService,
+)
+
+
+def _make_default_state():
+    return initial_state(delta=0.3, fxi=1.3, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+
+
+def test_request_key_canonicalization():
+    """
+    Equal requests hash equally regardless of key order, int/float or
+    signed zero; stochastic objects need a seed.
+    """
+    a = request_key({"fxi": 1, "shift": -0.0, "config": {"b": 1, "a": 2}})
+    b = request_key({"config": {"a": 2.0, "b": 1.0}, "shift": 0.0, "fxi": 1.0})
+    assert a == b is not None
+    assert request_key({"fxi": 1.0 + 1e-15}) != request_key({"fxi": 1.0})
+
+    assert request_key({"op": DefaultOperator(alpha=0.5)}) != request_key({"op": DefaultOperator(alpha=0.6)})
+    assert request_key({"s": StochasticNoiseScenario(sigma=0.1)}) is None
+    assert request_key({"s": StochasticNoiseScenario(sigma=0.1, seed=3)}) is not None
+    register_scenario("cache_noise", {"noise": [{"attr": "qp", "sigma": 0.01, "end": 10}]})
+    assert request_key({"s": load_scenario("cache_noise")}) is None
+    assert (request_key({"s": load_scenario("cache_noise", seed=1)})
+            == request_key({"s": load_scenario("cache_noise", seed=1)}))
+    assert request_key({"f": len}) is None
+
+
+def test_stochastic_key_follows_stream_state():
+    """
+    A seeded scenario whose stream has advanced (or that was given an
+    explicit rng) is not served the result of a fresh seed.
+    """
+    cache = ResultCache()
+    S0 = _make_default_state()
+    used = StochasticNoiseScenario(sigma=0.05, seed=3)
+    run_simulation_cached(S0, DefaultOperator(), used, 10, cache=cache)     # advances the stream
+    advanced = run_simulation_cached(S0, DefaultOperator(), used, 10, cache=cache)
+    fresh = run_simulation_cached(S0, DefaultOperator(), StochasticNoiseScenario(sigma=0.05, seed=3),
+                                  10, cache=cache)
+    expected = run_simulation(S0, DefaultOperator(), StochasticNoiseScenario(sigma=0.05, seed=3), 10)
+    assert [s.qp for s in fresh.state_series] == [s.qp for s in expected.state_series]
+    assert fresh.final_state.qp != advanced.final_state.qp
+
+    other = StochasticNoiseScenario(sigma=0.05, seed=3, rng=random.Random(4))
+    assert request_key({"s": other}) != request_key({"s": StochasticNoiseScenario(sigma=0.05, seed=3)})
+
+
+def test_lru_ttl_and_byte_accounting(tmp_path):
+    """
+    Entries are evicted by count, bytes and age; the disk tier survives
+    a new cache instance.
+    """
+    now = [0.0]
+    cache = ResultCache(max_entries=2, ttl=10.0, clock=lambda: now[0])
+    cache.put("a", [1.0])
+    cache.put("b", [2.0])
+    assert cache.get("a") == [1.0]          # refresh a
+    cache.put("c", [3.0])                   # evicts b
+    assert "b" not in cache and "a" in cache
+    assert cache.stats()["evictions"] == 1
+    assert cache.bytes > 0
+
+    now[0] = 11.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] >= 1
+
+    small = ResultCache(max_bytes=200)
+    small.put("big", list(range(1000)))
+    assert len(small) == 0 and small.bytes == 0
+
+    disk = ResultCache(directory=str(tmp_path), ttl=10.0, clock=lambda: now[0])
+    disk.put("k" * 64, {"fxi_series": [1.0]})
+    reopened = ResultCache(directory=str(tmp_path), clock=lambda: now[0])
+    assert reopened.get("k" * 64) == {"fxi_series": [1.0]}
+    assert reopened.stats()["disk_hits"] == 1
+    now[0] = 30.0
+    assert ResultCache(directory=str(tmp_path), clock=lambda: now[0]).get("k" * 64) is None
+
+
+def test_cached_simulation_and_service():
+    """
+    run_simulation_cached and the service answer repeated requests from
+    the cache; unseeded stochastic runs are never cached.
+    """
+    cache = ResultCache()
+    S0 = _make_default_state()
+    scenario = SingleStepShockScenario(t0=5, qp_shift=0.2)
+    first = run_simulation_cached(S0, DefaultOperator(alpha=0.7), scenario, 30, cache=cache)
+    second = run_simulation_cached(_make_default_state(), DefaultOperator(alpha=0.7),
+                                   SingleStepShockScenario(t0=5, qp_shift=0.2), 30, cache=cache)
+    assert second is first
+    assert run_simulation_cached(S0, DefaultOperator(alpha=0.7), scenario, 30,
+                                 cache=cache, record="none") is not first
+
+    run_simulation_cached(S0, DefaultOperator(), StochasticNoiseScenario(sigma=0.01), 30, cache=cache)
+    assert len(cache) == 2
+
+    async def scenario_run():
+        service = FREService(workers=0, cache=ResultCache())
+        request = {"fxi": 1.2, "delta": 0.2, "horizon": 20, "params": {"kappa": 0.5}}
+        a = await service.submit(request)
+        b = await service.submit(dict(request))
+        return a, b, service.metrics()
+
+    a, b, metrics = asyncio.run(scenario_run())
+    assert a is b
+    assert metrics["batches_total"] == 1 and metrics["cache"]["hits"] == 1
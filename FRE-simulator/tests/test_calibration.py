@@ -0,0 +1,77 @@
+# tests/test_calibration.py
+# Calibration tests: closed-form metrics, target recovery, breach constraints.
+
+import numpy as np
+
+from fre_simulator import (
+    initial_state,
+    SingleStepShockScenario,
+    run_sweep,
+    calibrate_alpha,
+)
+from fre_simulator.calibration import linear_metrics
+
+
+def _make_default_state():
+    return initial_state(delta=0.0, fxi=1.0, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+
+
+def test_closed_form_metrics_match_simulation():
+    """
+    The closed form reproduces the simulated max |FXI−1|, and its relaxed
+    time-to-stable rounds up to the simulated one.
+    """
+    alphas = np.array([0.2, 0.5, 0.8, 0.95])
+    sizes = np.array([-0.6, 0.05, 0.4, 1.5])
+    sweep = run_sweep(_make_default_state(),
+                      {"alpha": alphas, "shock_size": sizes, "shock_time": [1, 7]}, horizon=300)
+
+    m, _ = linear_metrics(alphas[:, None, None], 1.0, sizes[None, :, None],
+                          np.array([1, 7])[None, None, :], eps1=0.02)
+    np.testing.assert_allclose(m["max_deviation"], sweep.max_deviation)
+    np.testing.assert_array_equal(np.ceil(m["time_to_stable"]), sweep.time_to_stable)
+
+    capped, d = linear_metrics(alphas[:, None, None], 1.0, sizes[None, :, None],
+                               np.array([1, 7])[None, None, :], eps1=0.02, tts_cap=5.0)
+    np.testing.assert_array_equal(capped["time_to_stable"], np.minimum(m["time_to_stable"], 5.0))
+    assert (d["time_to_stable"][capped["time_to_stable"] == 5.0] == 0.0).all()
+
+
+def test_calibration_recovers_alpha():
+    """
+    A target generated at α = 0.6 is recovered by the analytic refinement;
+    a mean_kappa target is not refined.
+    """
+    shocks = {"shock_size": [0.5, 0.5], "shock_time": [3, 10]}
+    result = calibrate_alpha(_make_default_state(), shocks, horizon=100,
+                             targets={"max_deviation": 0.6 * 0.5})
+
+    assert result.gradient_refined
+    assert abs(result.alpha - 0.6) < 1e-6
+    assert result.breach_free
+    assert len(result.history) == 4
+
+    # mean κ has no closed form (κ = 0 before the shock): bracketing only
+    kappa = calibrate_alpha(_make_default_state(), shocks, horizon=100,
+                            targets={"mean_kappa": 0.5})
+    assert not kappa.gradient_refined and kappa.breach_free
+
+
+def test_calibration_respects_breach_constraints():
+    """
+    A target pushing α up stops at the largest breach-free α, for the
+    scenarios themselves and for an extra suite case.
+    """
+    config = {"capacity_limits": {"fxi_min": 0.5, "fxi_max": 1.4}}
+    shocks = {"shock_size": [0.5], "shock_time": [2]}
+    targets = {"time_to_stable": 200.0}
+
+    result = calibrate_alpha(_make_default_state(), shocks, horizon=300,
+                             targets=targets, config=config)
+    assert result.breach_free
+    assert 0.75 < result.alpha <= 0.8            # 1 + 0.5 α ≤ 1.4
+
+    suite = [lambda: (_make_default_state(), SingleStepShockScenario(t0=2, fxi_shift=0.7), 50)]
+    constrained = calibrate_alpha(_make_default_state(), shocks, horizon=300,
+                                  targets=targets, config=config, suite=suite)
+    assert 0.5 < constrained.alpha <= 0.4 / 0.7  # 1 + 0.7 α ≤ 1.4
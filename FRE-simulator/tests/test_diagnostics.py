@@ -0,0 +1,93 @@
+# tests/test_diagnostics.py
+# Tests for the lazily computed FRERecord diagnostics of vector batch runs.
+
+import math
+
+import numpy as np
+import pytest
+
+from fre_simulator import (
+    VectorBlock,
+    MatrixOperator,
+    VectorShockScenario,
+    run_vector_batch,
+    weighted_norm,
+)
+from fre_simulator.diagnostics import FRERECORD_FIELDS
+
+
+W = np.array([[2.0, 0.5], [0.5, 1.0]])
+
+
+def _block():
+    x = np.array([[1.02, 0.99], [1.05, 1.01], [0.97, 1.0]])
+    return VectorBlock(x, x_ref=np.ones(2), weights=W, fxi_scale=0.5)
+
+
+def test_records_match_step_by_step_definitions():
+    """
+    Every FRERecord field of a shocked, contracting run equals its
+    Section 57.1 definition computed step by step; fields are computed
+    only when read.
+    """
+    operator = MatrixOperator(0.6, b=[0.001, -0.002], dim=2)
+    shock = VectorShockScenario(3, [0.04, -0.01])
+    batch = run_vector_batch(_block(), operator, shock, 8, record_vectors=True)
+    records = batch.records()
+    assert records.computed() == []
+
+    i, t = 1, 2                           # the step out of t=2 is shocked
+    rec = records.record(i, t)
+    assert list(rec) == list(FRERECORD_FIELDS)
+    assert records.computed() == []       # one record leaves the batch caches alone
+
+    delta = batch.delta_vec[i, t]
+    prime = delta + [0.04, -0.01]
+    nxt = operator.apply_vector(prime)
+    corr = nxt - prime
+    r = weighted_norm(delta, W)
+    np.testing.assert_allclose(rec["X"], 1.0 + delta)
+    np.testing.assert_allclose(rec["X_prime"], 1.0 + prime)
+    np.testing.assert_allclose(rec["X_next"], 1.0 + nxt)
+    np.testing.assert_allclose(rec["correction"], corr, atol=1e-15)
+    np.testing.assert_allclose(rec["sensitivity"], W @ delta / r)
+    np.testing.assert_allclose(rec["FXI_local"], 1.0 + 0.5 * np.sqrt(np.diag(W)) * np.abs(delta))
+    assert rec["r"] == pytest.approx(r) and rec["r_next"] == pytest.approx(weighted_norm(nxt, W))
+    assert rec["energy"] == pytest.approx(0.5 * r ** 2)
+    assert rec["k_eff"] == batch.kappa[i, t]
+    assert rec["zone"] == batch.zone_names[batch.zone_codes[i, t]]
+    cos = prime @ W @ corr / (weighted_norm(prime, W) * weighted_norm(corr, W))
+    assert rec["angle"] == pytest.approx(math.acos(cos))
+    assert rec["funnel"] is False and rec["repeller"] is False
+
+    for name in ("X_next", "correction", "angle", "sensitivity", "funnel"):
+        np.testing.assert_allclose(rec[name], records[name][i, t], atol=1e-15)
+
+    series = records.series(0)
+    assert [r["t"] for r in series] == list(range(9))
+    assert series[0]["k_eff"] is None and np.isnan(series[-1]["r_next"])
+
+
+def test_funnel_and_repeller_flags():
+    """
+    An expanding operator gives outward steps (θ = 0): funnel everywhere,
+    repeller once FXI is critical; flags stay False past a row's end.
+    """
+    batch = run_vector_batch(_block(), MatrixOperator(1.3, dim=2), VectorShockScenario(1, [0.0, 0.0]),
+                             12, {"capacity_limits": {"fxi_max": 1.2}}, record_vectors=True)
+    records = batch.records()
+    valid = np.arange(batch.fxi.shape[1]) < batch.lengths[:, None] - 1
+
+    np.testing.assert_allclose(records.angle[valid], 0.0, atol=1e-7)
+    assert records.funnel[valid].all() and not records.funnel[~valid].any()
+    critical = batch.zone_codes == batch.zone_names.index("critical")
+    np.testing.assert_array_equal(records.repeller, valid & critical)
+    assert records.repeller.any()
+    for i in range(len(records)):
+        series = records.series(i)
+        assert [r["funnel"] for r in series] == records.funnel[i, :len(series)].tolist()
+        assert [r["repeller"] for r in series] == records.repeller[i, :len(series)].tolist()
+
+    with pytest.raises(ValueError):
+        run_vector_batch(_block(), MatrixOperator(1.3, dim=2), VectorShockScenario(1, [0.0, 0.0]),
+                         3).records()
@@ -0,0 +1,78 @@
+# tests/test_early_warning.py
+# Tests for the streaming early-warning indicators.
+
+import numpy as np
+import pytest
+
+from fre_simulator import (
+    initial_state,
+    BaseOperator,
+    EmptyScenario,
+    FRESession,
+    iter_simulation,
+    EarlyWarningMonitor,
+)
+from fre_simulator.early_warning import RollingStats
+
+
+class DegradingOperator(BaseOperator):
+    """Contraction weakening each step (κ drifting to 1, demo #3)."""
+
+    def __init__(self, k0=0.5, rate=0.02):
+        self.k0, self.rate, self.calls = k0, rate, 0
+
+    def apply(self, fxi):
+        k = self.k0 + self.rate * self.calls
+        self.calls += 1
+        return 1.0 + k * (fxi - 1.0)
+
+
+def test_rolling_stats_match_full_window_statistics():
+    """
+    Incremental window statistics equal numpy over the same window,
+    through many wrap-arounds of the ring buffer.
+    """
+    x = np.random.default_rng(7).normal(size=537).cumsum()
+    stats = RollingStats(window=20, span=5)
+    ewma = x[0]
+    for i, v in enumerate(x):
+        stats.update(v)
+        ewma = ewma + (2 / 6) * (v - ewma)
+        if i in (1, 2, 19, 20, 333, 536):
+            w = x[max(0, i - 19):i + 1]
+            assert stats.mean == pytest.approx(w.mean())
+            assert stats.variance == pytest.approx(w.var())
+            assert stats.slope == pytest.approx(np.polyfit(np.arange(len(w)), w, 1)[0])
+            if len(w) > 2:
+                assert stats.lag1 == pytest.approx(np.corrcoef(w[:-1], w[1:])[0, 1])
+    assert stats.ewma == pytest.approx(ewma)
+    assert stats.n == 20 and stats.count == 537
+
+
+def test_warnings_precede_breach_in_stream_and_session():
+    """
+    Under weakening contraction the monitor warns (contraction weakening,
+    boundary approach, multi-signal) before the zone reaches critical;
+    a session with the same monitor settings raises the same events.
+    """
+    S0 = initial_state(delta=0.05, fxi=1.05, qp=1.05, qf=1.0, q=1.0, w=1.0, u=1.0)
+    monitor = EarlyWarningMonitor(window=10, span=4, max_events=8)
+    first_critical = None
+    for rec, events in monitor.watch(iter_simulation(S0, DegradingOperator(), EmptyScenario(), 80)):
+        if rec.zone == "critical":
+            first_critical = rec.t
+            break
+    warned = {e.indicator: e.t for e in reversed(monitor.events)}
+    assert first_critical is not None
+    assert warned["contraction-weakening"] < first_critical
+    assert warned["boundary-approach:deviation"] < first_critical
+    assert monitor.active["multi-signal"] == "critical"
+    assert len(monitor.events) <= 8
+
+    seen = []
+    session = FRESession(S0, DegradingOperator(),
+                         monitor=EarlyWarningMonitor(window=10, span=4, callback=seen.append))
+    while session.zone != "critical":
+        session.step()
+    assert seen[-len(monitor.events):] == list(monitor.events)
+    assert session.diagnostics()["warnings"] == monitor.active
@@ -3,6 +3,8 @@
 
 import math
 
+import numpy as np
+
 from fre_simulator import (
     initial_state,
     DefaultOperator,
@@ -10,6 +12,7 @@ from fre_simulator import (
     SingleStepShockScenario,
     StochasticNoiseScenario,
     run_simulation,
+    iter_simulation,
 )
 
 
@@ -189,3 +192,215 @@ def test_stochastic_scenario_runs_without_breach():
 
     assert result.breach_occurred is False
     assert len(result.fxi_series) == horizon + 1
+
+
+def test_columnar_result_matches_list_result():
+    """
+    Columnar mode:
+    - same trajectories as the list-based result
+    - arrays trimmed to the breach step
+    """
+    S0 = _make_default_state(fxi=2.0, delta=1.0)
+    op = DefaultOperator(alpha=0.7)
+    config = {"capacity_limits": {"fxi_min": 0.5, "fxi_max": 1.5}}
+
+    for cfg, horizon in ((None, 30), (config, 30)):
+        lists = run_simulation(S0, op, EmptyScenario(), horizon, cfg)
+        cols = run_simulation(S0, op, EmptyScenario(), horizon, cfg, columnar=True)
+
+        assert cols.fxi.dtype == np.float64
+        assert cols.zone_codes.dtype == np.int8
+        assert len(cols.fxi) == len(lists.fxi_series)
+        assert cols.fxi_series == lists.fxi_series
+        assert cols.delta_series == lists.delta_series
+        assert cols.kappa_series == lists.kappa_series
+        assert cols.stability_zones == lists.stability_zones
+        assert cols.breach_step == lists.breach_step
+        assert cols.breach_type == lists.breach_type
+
+
+def test_record_policies():
+    """
+    Recording policies:
+    - identical scalar series for every policy that records scalars
+    - snapshots / events only where the policy asks for them
+    - final_state is available under every policy
+    """
+    S0 = _make_default_state(fxi=1.3, delta=0.3)
+    op = DefaultOperator(alpha=0.7)
+    horizon = 12
+
+    def make_scenario():
+        return SingleStepShockScenario(t0=4, qp_shift=0.5)
+
+    full = run_simulation(S0, op, make_scenario(), horizon, record="full")
+    scalars = run_simulation(S0, op, make_scenario(), horizon, record="scalars-only")
+    events = run_simulation(S0, op, make_scenario(), horizon, record="events-only")
+    nothing = run_simulation(S0, op, make_scenario(), horizon, record="none")
+
+    for result in (scalars, events):
+        assert result.fxi_series == full.fxi_series
+        assert result.kappa_series == full.kappa_series
+        assert result.stability_zones == full.stability_zones
+        assert result.state_series == []
+
+    assert len(full.state_series) == horizon + 1
+    assert len(full.scenario_events) == horizon + 1
+    assert scalars.scenario_events == []
+    assert [e["type"] for e in events.scenario_events] == ["init", "scenario"]
+    assert events.scenario_events[1]["t"] == 4
+
+    assert nothing.fxi_series == []
+    assert nothing.state_series == []
+    assert nothing.scenario_events == []
+    assert nothing.final_state == full.state_series[-1]
+    assert nothing.final_state.fxi == full.fxi_series[-1]
+
+
+def test_closed_form_fast_path_matches_stepping():
+    """
+    Closed-form evaluation of quiet stretches:
+    - same series (up to float rounding), zones and length as stepping
+    - scenario events between the stretches are still applied
+    """
+    S0 = _make_default_state(fxi=1.8, delta=0.8)
+    op = DefaultOperator(alpha=0.8)
+    horizon = 200
+
+    def make_scenario():
+        return SingleStepShockScenario(t0=37, qp_shift=0.25)
+
+    for columnar in (False, True):
+        stepped = run_simulation(S0, op, make_scenario(), horizon,
+                                 columnar=columnar, record="scalars-only")
+        fast = run_simulation(S0, op, make_scenario(), horizon,
+                              columnar=columnar, record="scalars-only",
+                              closed_form=True)
+
+        assert len(fast.fxi_series) == horizon + 1
+        assert np.allclose(fast.fxi_series, stepped.fxi_series, rtol=0, atol=1e-12)
+        assert np.allclose(fast.delta_series, stepped.delta_series, rtol=0, atol=1e-12)
+        # κ is only meaningful away from the float-rounding floor around FXI = 1
+        resolved = np.abs(np.array(stepped.fxi_series[:-1]) - 1.0) > 1e-9
+        assert np.allclose(np.array(fast.kappa_series[1:])[resolved],
+                           np.array(stepped.kappa_series[1:])[resolved], atol=1e-6)
+        assert fast.stability_zones == stepped.stability_zones
+        assert fast.final_state.qp == stepped.final_state.qp == 1.25
+
+    none = run_simulation(S0, op, make_scenario(), horizon, record="none",
+                          closed_form=True)
+    assert math.isclose(none.final_state.fxi, stepped.final_state.fxi, abs_tol=1e-12)
+    assert none.breach_occurred is False
+
+
+def test_closed_form_keeps_breach_detection():
+    """
+    The first step of every stretch is stepped explicitly,
+    so capacity breaches are reported exactly as without the fast path.
+    """
+    S0 = _make_default_state(fxi=2.0, delta=1.0)
+    op = DefaultOperator(alpha=0.7)
+    config = {"capacity_limits": {"delta": 10.0, "fxi_min": 0.95, "fxi_max": 1.05}}
+
+    stepped = run_simulation(S0, op, EmptyScenario(), 50, config, record="scalars-only")
+    fast = run_simulation(S0, op, EmptyScenario(), 50, config, record="scalars-only",
+                          closed_form=True)
+
+    assert fast.breach_type == stepped.breach_type == "fxi-capacity-breach"
+    assert fast.breach_step == stepped.breach_step
+
+
+def test_iter_simulation_matches_run_simulation():
+    """
+    Streaming records reproduce the collected result step by step.
+    """
+    S0 = _make_default_state(fxi=1.3, delta=0.3)
+    op = DefaultOperator(alpha=0.6)
+    scenario = SingleStepShockScenario(t0=4, qp_shift=0.2)
+
+    result = run_simulation(S0, op, scenario, 15)
+    stream = iter_simulation(S0, op, scenario, 15, events="all")
+    records = list(stream)
+
+    assert [r.t for r in records] == list(range(16))
+    assert [r.fxi for r in records] == result.fxi_series
+    assert [r.delta for r in records] == result.delta_series
+    assert [r.kappa for r in records] == result.kappa_series
+    assert [r.zone for r in records] == result.stability_zones
+    assert [r.event for r in records] == result.scenario_events
+    assert stream.state == result.final_state
+
+
+def test_iter_simulation_early_stop():
+    """
+    send(True) stops the evolution after the current step and returns
+    its record; the stream exposes the step reached and the live state.
+    """
+    S0 = _make_default_state(fxi=1.5, delta=0.5)
+    stream = iter_simulation(S0, DefaultOperator(alpha=0.5), EmptyScenario(), 10_000)
+
+    seen = []
+    for rec in stream:
+        seen.append(rec)
+        if rec.zone == "stable":
+            assert stream.send(True) is rec
+            break
+
+    assert seen[-1].zone == "stable"
+    assert stream.stopped
+    assert stream.t == seen[-1].t < 10_000
+    assert stream.state.fxi == seen[-1].fxi
+    assert list(stream) == []
+
+
+def test_convergence_stops_after_last_event():
+    """
+    With "convergence" configured, the run ends once FXI and Δ stayed within
+    tol for `steps` steps after the scenario's last event; "fill" keeps
+    the full-horizon series length.
+    """
+    S0 = _make_default_state(fxi=1.5, delta=0.5)
+    op = DefaultOperator(alpha=0.7)
+    scenario = SingleStepShockScenario(t0=60, fxi_shift=0.3)
+    config = {"convergence": {"tol": 1e-8, "steps": 5}}
+
+    full = run_simulation(S0, op, scenario, 5000)
+    stopped = run_simulation(S0, op, scenario, 5000, config)
+
+    # calm before the shock at t=60 does not count
+    assert stopped.converged
+    assert 60 < stopped.converged_step < 200
+    assert len(stopped.fxi_series) == stopped.converged_step + 1
+    assert stopped.fxi_series == full.fxi_series[:stopped.converged_step + 1]
+    assert abs(stopped.final_state.fxi - 1.0) <= 1e-8
+    assert not full.converged and full.converged_step is None
+
+    config["convergence"]["mode"] = "fill"
+    for columnar in (False, True):
+        filled = run_simulation(S0, op, scenario, 5000, config, columnar=columnar)
+        assert filled.converged_step == stopped.converged_step
+        assert len(filled.fxi_series) == 5001
+        assert filled.fxi_series[-1] == stopped.fxi_series[-1]
+        assert filled.stability_zones[-1] == "stable"
+        assert len(filled.state_series) == stopped.converged_step + 1
+
+
+def test_convergence_with_closed_form():
+    """
+    The closed-form fast path ends its stretch at the same converged step.
+    """
+    S0 = _make_default_state(fxi=1.8, delta=0.8)
+    op = DefaultOperator(alpha=0.8)
+    config = {"convergence": {"tol": 1e-6, "steps": 3, "mode": "fill"}}
+
+    stepped = run_simulation(S0, op, SingleStepShockScenario(t0=20, qp_shift=0.1), 1000,
+                             config, columnar=True, record="scalars-only")
+    fast = run_simulation(S0, op, SingleStepShockScenario(t0=20, qp_shift=0.1), 1000,
+                          config, columnar=True, record="scalars-only", closed_form=True)
+    none = run_simulation(S0, op, SingleStepShockScenario(t0=20, qp_shift=0.1), 1000,
+                          config, record="none", closed_form=True)
+
+    assert stepped.converged and fast.converged and none.converged
+    assert fast.converged_step == stepped.converged_step == none.converged_step
+    assert fast.fxi.shape == (1001,)
+    assert np.allclose(fast.fxi, stepped.fxi, rtol=0, atol=1e-12)
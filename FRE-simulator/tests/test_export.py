@@ -0,0 +1,77 @@
+# tests/test_export.py
+# Tests for FRETimeSeries storage (JSON, CSV, Parquet, NPZ).
+
+import numpy as np
+import pytest
+
+from fre_simulator import (
+    initial_state,
+    StateBlock,
+    DefaultOperator,
+    SingleStepShockScenario,
+    run_simulation,
+    run_simulation_batch,
+    write_records,
+    read_records,
+)
+
+
+def _batch(horizon=40):
+    block = StateBlock(delta=[0.0, 0.2, 0.4], fxi=[1.0, 1.2, 1.4], qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+    config = {"capacity_limits": {"fxi_min": 0.5, "fxi_max": 1.3}}
+    return run_simulation_batch(block, DefaultOperator(alpha=0.8),
+                                SingleStepShockScenario(t0=3, fxi_shift=0.3), horizon, config)
+
+
+@pytest.mark.parametrize("fmt", ["json", "csv", "npz", "parquet"])
+def test_round_trip_all_formats(tmp_path, fmt):
+    """
+    A batch (rows of unequal length) plus a scalar run round-trip through
+    every format, in chunks smaller than one run.
+    """
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    batch = _batch()
+    S0 = initial_state(delta=0.3, fxi=1.3, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+    single = run_simulation(S0, DefaultOperator(alpha=0.5), SingleStepShockScenario(t0=2), 10)
+    assert batch.breach_occurred.any()
+
+    path = str(tmp_path / f"runs.{fmt}")
+    count = write_records([batch, single], path, config={"alpha": 0.8}, chunk_rows=16,
+                          run_ids=[10, 11, 12, 20])
+    table = read_records(path)
+    assert len(table) == count == int(batch.lengths.sum()) + 11
+
+    assert np.unique(table.run_id).tolist() == [10, 11, 12, 20]
+    for row, run_id in enumerate([10, 11, 12]):
+        run = table.run(run_id)
+        n = int(batch.lengths[row])
+        assert run.t.tolist() == list(range(n))
+        np.testing.assert_array_equal(run.FXI_global, batch.fxi[row, :n])
+        np.testing.assert_array_equal(run.r, batch.delta[row, :n])
+        np.testing.assert_array_equal(run.k_eff, batch.kappa[row, :n])
+        assert run.zones == batch.row(row).stability_zones
+    assert table.run(20).FXI_global.tolist() == single.fxi_series
+    if fmt != "csv":
+        assert table.meta["fre_version"] == "2.0"
+        assert table.meta["config"] == {"alpha": 0.8}
+
+
+def test_npz_is_memory_mapped_and_streams_generators(tmp_path):
+    """
+    NPZ columns are memory-mapped and the file is a regular np.load-able
+    archive; a generator of batches is written run after run.
+    """
+    path = str(tmp_path / "runs.npz")
+    count = write_records((_batch(horizon=20) for _ in range(3)), path, chunk_rows=7)
+    table = read_records(path)
+    assert isinstance(table.FXI_global, np.memmap)
+    assert len(table) == count
+    assert np.unique(table.run_id).tolist() == list(range(9))
+
+    archive = np.load(path)
+    np.testing.assert_array_equal(archive["t"], table.t)
+    assert tuple(archive["zone_names"].tolist()) == table.zone_names
+
+    with pytest.raises(ValueError):
+        write_records(_batch(), str(tmp_path / "runs.xlsx"))
@@ -0,0 +1,120 @@
+# tests/test_montecarlo.py
+# Reproducibility and aggregation tests for the Monte Carlo runner.
+
+import numpy as np
+import pytest
+
+from fre_simulator import initial_state, DefaultOperator, BaseScenario
+from fre_simulator.montecarlo import run_monte_carlo, NoiseScenarioFactory, _run_chunk
+
+
+class FxiNoiseScenario(BaseScenario):
+    """
+    Test scenario: Gaussian shock on FXI at every step
+    (so that paths actually differ in FXI).
+    """
+
+    def __init__(self, rng, sigma=0.08):
+        self.rng = rng
+        self.sigma = sigma
+
+    def apply(self, state, t):
+        state.fxi += self.rng.normal(0.0, self.sigma)
+        return state
+
+
+class BrokenScenario(BaseScenario):
+    """Test scenario with a bug: raises a plain ValueError at t=3."""
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def apply(self, state, t):
+        if t == 3:
+            raise ValueError("scenario bug")
+        return state
+
+
+def _make_default_state():
+    return initial_state(delta=0.2, fxi=1.2, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+
+
+CONFIG = {"capacity_limits": {"delta": 10.0, "fxi_min": 0.8, "fxi_max": 1.2}}
+
+
+def test_monte_carlo_reproducible_across_worker_counts():
+    """
+    Same master seed → identical aggregates for 1 and 2 worker processes.
+    """
+    kwargs = dict(horizon=30, n_paths=300, seed=1234, config=CONFIG, chunk_size=64)
+    serial = run_monte_carlo(_make_default_state(), DefaultOperator(alpha=0.7),
+                             FxiNoiseScenario, workers=1, **kwargs)
+    parallel = run_monte_carlo(_make_default_state(), DefaultOperator(alpha=0.7),
+                               FxiNoiseScenario, workers=2, **kwargs)
+
+    assert serial.breach_count == parallel.breach_count
+    assert serial.breach_types == parallel.breach_types
+    assert np.array_equal(serial.breach_step_hist, parallel.breach_step_hist)
+    assert np.array_equal(serial.fxi_hist, parallel.fxi_hist)
+    assert np.array_equal(serial.fxi_mean, parallel.fxi_mean)
+
+    other = run_monte_carlo(_make_default_state(), DefaultOperator(alpha=0.7),
+                            FxiNoiseScenario, workers=1, **dict(kwargs, seed=4321))
+    assert not np.array_equal(serial.fxi_hist, other.fxi_hist)
+
+
+def test_monte_carlo_aggregates_are_consistent():
+    """
+    Aggregates:
+    - breach probability in (0, 1) for a noisy narrow band
+    - alive counts shrink only by breaches
+    - percentile bands are ordered and inside the histogram range
+    """
+    result = run_monte_carlo(_make_default_state(), DefaultOperator(alpha=0.7),
+                             FxiNoiseScenario, horizon=30, n_paths=400, seed=7,
+                             config=CONFIG)
+
+    assert 0.0 < result.breach_probability < 1.0
+    assert result.alive[0] == 400
+    assert result.alive[-1] == 400 - result.breach_count
+    assert result.fxi_hist.sum(axis=1).tolist() == result.alive.tolist()
+
+    p5, p50, p95 = result.fxi_percentiles([5, 50, 95])
+    assert np.all(p5 <= p50) and np.all(p50 <= p95)
+    assert np.all(p5 >= 0.8) and np.all(p95 <= 1.2)
+    assert abs(p50[-1] - 1.0) < 0.05
+
+
+def test_monte_carlo_chunk_payload_smaller_than_trajectories():
+    """
+    A chunk ships its FXI histogram sparsely: smaller than the raw FXI
+    series of its paths even with more bins than paths.
+    """
+    horizon, paths = 200, 64
+    edges = np.linspace(0.8, 1.2, 513)
+    entropy = np.random.SeedSequence(5).entropy
+    chunk = _run_chunk((_make_default_state(), DefaultOperator(alpha=0.7), FxiNoiseScenario,
+                        horizon, CONFIG, entropy, 0, paths, edges))
+    indptr, cols, counts = chunk["fxi_hist"]
+    assert indptr.nbytes + cols.nbytes + counts.nbytes < paths * (horizon + 1) * 8
+    assert counts.sum() == chunk["alive"].sum()
+
+
+def test_monte_carlo_noise_factory_counts_admissibility_errors():
+    """
+    Large qp noise drives qp <= 0: such paths count as admissibility breaches.
+    """
+    result = run_monte_carlo(_make_default_state(), DefaultOperator(),
+                             NoiseScenarioFactory(sigma=0.5), horizon=20,
+                             n_paths=50, seed=3)
+    assert result.breach_types.get("admissibility-error", 0) == result.breach_count > 0
+
+
+def test_monte_carlo_reraises_other_value_errors():
+    """
+    Only AdmissibilityError is counted as a breach; any other ValueError
+    raised in a path propagates.
+    """
+    with pytest.raises(ValueError, match="scenario bug"):
+        run_monte_carlo(_make_default_state(), DefaultOperator(), BrokenScenario,
+                        horizon=10, n_paths=4, seed=1)
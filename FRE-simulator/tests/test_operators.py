@@ -0,0 +1,124 @@
+# tests/test_operators.py
+# Tests for the nonlinear corrective operators and their batch kernels.
+
+import copy
+
+import numpy as np
+import pytest
+
+from fre_simulator import (
+    initial_state,
+    StateBlock,
+    SaturatingOperator,
+    PiecewiseLinearOperator,
+    DegradingOperator,
+    MemoryOperator,
+    EmptyScenario,
+    FRESession,
+    run_simulation,
+    run_simulation_batch,
+    run_monte_carlo,
+)
+
+
+OPERATORS = [
+    SaturatingOperator(alpha=0.6, limit=0.1),
+    SaturatingOperator(alpha=0.3, limit=0.5, kind="rational"),
+    PiecewiseLinearOperator(breakpoints=(0.02, 0.5), slopes=(1.0, 0.6, 0.8)),
+    DegradingOperator(k_base=0.9, kappa0=1.0, degrade=0.05),
+    MemoryOperator(alpha=0.4, beta=3.0, decay=0.9),
+]
+
+
+@pytest.mark.parametrize("operator", OPERATORS, ids=lambda op: type(op).__name__)
+def test_batch_kernel_matches_scalar_apply(operator):
+    """
+    Over several steps, apply_batch / kappa_batch equal apply / kappa
+    of independent per-row instances (stateful operators included), and
+    a batch run equals the scalar engine row by row.
+    """
+    fxi = np.concatenate([np.linspace(0.2, 4.0, 97), [1.0, 1.02, 0.98, 1.5 + 1e-12]])
+    batch_op = copy.deepcopy(operator)
+    rows = [copy.deepcopy(operator) for _ in fxi]
+    for _ in range(15):
+        nxt = batch_op.apply_batch(fxi)
+        expected = np.array([op.apply(x) for op, x in zip(rows, fxi.tolist())])
+        np.testing.assert_allclose(nxt, expected, rtol=1e-14, atol=1e-15)
+        np.testing.assert_allclose(batch_op.kappa_batch(fxi, nxt),
+                                   [batch_op.kappa(p, n) for p, n in zip(fxi, expected)], rtol=1e-12)
+        assert (np.abs(nxt - 1.0) <= np.abs(fxi - 1.0) + 1e-15).all()   # no expansion
+        fxi = nxt
+
+    start = np.array([1.6, 0.7, 1.05, 3.0])
+    block = StateBlock(delta=start - 1.0, fxi=start, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+    batch = run_simulation_batch(block, copy.deepcopy(operator), EmptyScenario(), 25)
+    for i, x in enumerate(start):
+        S0 = initial_state(delta=x - 1.0, fxi=x, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+        scalar = run_simulation(S0, copy.deepcopy(operator), EmptyScenario(), 25)
+        row = batch.row(i)
+        np.testing.assert_allclose(row.fxi_series, scalar.fxi_series, rtol=1e-14)
+        assert row.stability_zones == scalar.stability_zones
+
+
+def test_nonlinear_shapes():
+    """
+    Saturation weakens contraction at large deviations, the dead band
+    leaves small deviations untouched, the degrading operator follows
+    demo #3 and memory pushes the contraction toward (not past) 1.
+    """
+    sat = SaturatingOperator(alpha=0.5, limit=0.05)
+    assert sat.kappa(1.001, sat.apply(1.001)) == pytest.approx(0.5, abs=1e-3)
+    assert sat.kappa(3.0, sat.apply(3.0)) == pytest.approx(1 - 0.05 / 2.0)
+    assert 3.0 - sat.apply(3.0) == pytest.approx(0.05)          # E_max
+
+    band = PiecewiseLinearOperator(breakpoints=(0.02,), slopes=(1.0, 0.5))
+    assert band.apply(1.015) == 1.015 and band.apply(0.99) == 0.99
+    assert band.apply(1.1) == pytest.approx(1.02 + 0.5 * 0.08)
+    assert band.apply(0.9) == pytest.approx(2.0 - band.apply(1.1))
+
+    demo = DegradingOperator()                                   # demo #3 parameters
+    delta, kappa = 0.30, 0.80
+    fxi = 1.0 + delta
+    for _ in range(27):
+        delta, kappa = 0.4 * kappa * delta, max(kappa - 0.03, 0.0)
+        fxi = demo.apply(fxi)
+        assert fxi - 1.0 == pytest.approx(delta, abs=1e-15)
+        assert demo.viability == pytest.approx(kappa)
+    assert demo.collapsed
+    demo.reset()
+    assert demo.viability == 0.8 and not demo.collapsed
+
+    mem = MemoryOperator(alpha=0.3, beta=10.0)
+    fxi, ks = 1.4, []
+    for _ in range(30):
+        nxt = mem.apply(fxi)
+        ks.append(mem.kappa(fxi, nxt))
+        fxi = nxt
+    assert ks[0] > 0.3 and all(a <= b for a, b in zip(ks, ks[1:])) and ks[-1] < 1.0
+    with pytest.raises(ValueError):
+        PiecewiseLinearOperator(breakpoints=(0.1,), slopes=(1.2, 0.5))
+
+
+@pytest.mark.parametrize("operator", OPERATORS[3:], ids=lambda op: type(op).__name__)
+def test_stateful_operator_reused_across_runs(operator):
+    """
+    Engines reset a stateful operator at the start of each run: reusing
+    one instance reproduces the same trajectory in the scalar, batch,
+    session and Monte Carlo paths.
+    """
+    S0 = initial_state(delta=0.5, fxi=1.5, qp=1.5, qf=1.0, q=1.0, w=1.0, u=1.0)
+    first = run_simulation(S0, operator, EmptyScenario(), 20).fxi_series
+    assert run_simulation(S0, operator, EmptyScenario(), 20).fxi_series == first
+
+    block = StateBlock(delta=[0.5, 0.2], fxi=[1.5, 1.2], qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+    runs = [run_simulation_batch(block, operator, EmptyScenario(), 20) for _ in range(2)]
+    np.testing.assert_array_equal(runs[0].fxi, runs[1].fxi)
+    np.testing.assert_allclose(runs[0].fxi[0], first, rtol=1e-14)
+
+    session = FRESession(S0, operator)
+    ticks = [session.step().fxi for _ in range(20)]
+    session.reset(S0)
+    assert [session.step().fxi for _ in range(20)] == ticks == first[1:]
+
+    mc = run_monte_carlo(S0, operator, lambda rng: EmptyScenario(), 20, n_paths=5, seed=0)
+    np.testing.assert_allclose(mc.fxi_mean, first, rtol=1e-14)
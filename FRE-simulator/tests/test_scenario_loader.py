@@ -0,0 +1,95 @@
+# tests/test_scenario_loader.py
+# Tests for declarative scenario definitions and the compiled-scenario cache.
+
+import json
+
+import numpy as np
+import pytest
+
+from fre_simulator import (
+    initial_state,
+    StateBlock,
+    DefaultOperator,
+    SingleStepShockScenario,
+    ProgressiveShockScenario,
+    load_scenario,
+    load_program,
+    register_scenario,
+    compile_definition,
+    run_simulation,
+    run_simulation_batch,
+)
+
+
+def _make_default_state():
+    return initial_state(delta=0.3, fxi=1.3, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+
+
+def test_definition_matches_builtin_scenarios():
+    """
+    Events and ramps reproduce SingleStepShockScenario / ProgressiveShockScenario.
+    """
+    S0 = _make_default_state()
+    op = DefaultOperator(alpha=0.7)
+    definition = {
+        "events": [{"t": 12, "shift": {"qp": 0.2, "fxi": 0.1}}],
+        "ramps": [{"start": 3, "end": 9, "scale": {"qf": 0.9}}],
+    }
+    loaded = run_simulation(S0, op, load_scenario(definition), 40)
+
+    reference = _make_default_state()
+    shock = SingleStepShockScenario(t0=12, qp_shift=0.2, fxi_shift=0.1)
+    ramp = ProgressiveShockScenario(t_start=3, t_end=9, alpha=0.1)
+    for t in range(1, 41):
+        ramp.apply(reference, t)
+        shock.apply(reference, t)
+    assert loaded.final_state.qf == reference.qf
+    assert loaded.final_state.qp == reference.qp
+    assert loaded.scenario_events[12]["type"] == "scenario"
+
+
+def test_bands_drift_and_merging():
+    """
+    Band patterns cycle, overlapping shifts add up, drift sets values,
+    open-ended sections need the horizon.
+    """
+    definition = {
+        "bands": [{"start": 2, "end": 10, "every": 4, "pattern": [{"qp": 0.5}, {"qp": -0.25}]}],
+        "events": [{"t": 6, "shift": {"qp": 1.0}}],
+        "drift": [{"attr": "u", "base": 1.0, "amplitude": 0.5, "period": 4, "start": 5}],
+    }
+    with pytest.raises(ValueError):
+        load_program(definition)
+
+    program = load_program(definition, horizon=8)
+    table = program.table
+    assert table.times.tolist() == [2, 5, 6, 7, 8, 10]
+    assert table.shifts["qp"].tolist() == [0.5, 0.0, 0.75, 0.0, 0.0, 0.5]
+    np.testing.assert_allclose(table.sets["u"][1:5], 1.0 + 0.5 * np.sin(np.pi / 2 * np.arange(5, 9)))
+
+    with pytest.raises(ValueError):
+        compile_definition({"events": [{"t": 3, "shove": {"qp": 1.0}}]})
+
+
+def test_cache_by_content_and_registry():
+    """
+    The same content (any key order, dict or JSON text) compiles once;
+    noisy definitions give independent, seed-reproducible streams.
+    """
+    definition = {"events": [{"t": 4, "shift": {"qp": 0.1}}], "name": "cached"}
+    text = json.dumps({"name": "cached", "events": [{"shift": {"qp": 0.1}, "t": 4}]})
+    assert load_program(definition) is load_program(text)
+    assert load_scenario(definition) is load_scenario(text)
+
+    register_scenario("level_test_noise", {"noise": [{"attr": "qp", "sigma": 0.01, "end": 30}]})
+    S0 = _make_default_state()
+    op = DefaultOperator(alpha=0.7)
+    a = run_simulation(S0, op, load_scenario("level_test_noise", seed=7), 40)
+    b = run_simulation(S0, op, load_scenario("level_test_noise", seed=7), 40)
+    assert a.final_state.qp == b.final_state.qp != S0.qp
+    with pytest.raises(ValueError):
+        load_scenario("level_unknown")
+
+    block = StateBlock(delta=[0.0, 0.3], fxi=[1.0, 1.3], qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+    batch = run_simulation_batch(block, op, load_scenario("level_test_noise", seed=1), 40)
+    assert not batch.breach_occurred.any()
@@ -0,0 +1,81 @@
+# tests/test_scenarios.py
+# Tests for compiled (sparse event table) scenarios.
+
+import numpy as np
+import pytest
+
+from fre_simulator import (
+    initial_state,
+    StateBlock,
+    DefaultOperator,
+    EmptyScenario,
+    SingleStepShockScenario,
+    ProgressiveShockScenario,
+    StochasticNoiseScenario,
+    CompiledScenario,
+    run_simulation,
+    run_simulation_batch,
+)
+
+
+def _make_default_state(fxi: float = 1.3, delta: float = 0.3):
+    return initial_state(delta=delta, fxi=fxi, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+
+
+def test_compiled_scenario_matches_source():
+    """
+    Compiled built-in scenarios reproduce the original runs exactly,
+    including the scenario events recorded under record="full".
+    """
+    S0 = _make_default_state()
+    op = DefaultOperator(alpha=0.7)
+    for make in (lambda: SingleStepShockScenario(t0=12, qp_shift=0.2, fxi_shift=0.1),
+                 lambda: ProgressiveShockScenario(t_start=3, t_end=9, alpha=0.1),
+                 EmptyScenario):
+        source = run_simulation(S0, op, make(), 40)
+        compiled = run_simulation(S0, op, make().compile(), 40)
+        assert compiled.fxi_series == source.fxi_series
+        assert compiled.scenario_events == source.scenario_events
+        assert compiled.final_state == source.final_state
+
+    with pytest.raises(NotImplementedError):
+        StochasticNoiseScenario(sigma=0.1, seed=1).compile()
+
+
+def test_from_events_table_and_next_event():
+    """
+    Steps from sets / scales / shifts are merged into one sorted table;
+    neutral entries leave attributes untouched.
+    """
+    scenario = CompiledScenario.from_events(
+        shifts={10: {"qp": 0.5}, 3: {"qp": -0.25, "qf": 0.1}},
+        scales={3: {"w": 2.0}},
+        sets={20: {"u": 0.75}},
+    )
+    assert scenario.times.tolist() == [3, 10, 20]
+    assert scenario.shifts["qf"].tolist() == [0.1, 0.0, 0.0]
+    assert [scenario.next_event(t) for t in (0, 3, 4, 11, 20, 21)] == [3, 3, 10, 20, 20, None]
+
+    state = _make_default_state()
+    for t in range(1, 25):
+        scenario.apply(state, t)
+    assert (state.qp, state.qf, state.w, state.u) == (1.25, 1.1, 2.0, 0.75)
+
+    with pytest.raises(ValueError):
+        CompiledScenario([5, 3])
+
+
+def test_compiled_scenario_shared_by_batches():
+    """
+    One table drives scalar runs and batch runs alike.
+    """
+    scenario = SingleStepShockScenario(t0=5, fxi_shift=0.2).compile()
+    block = StateBlock(delta=[0.0, 0.3], fxi=[1.0, 1.3], qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+    op = DefaultOperator(alpha=0.6)
+
+    first = run_simulation_batch(block, op, scenario, 20)
+    second = run_simulation_batch(block, op, scenario, 20)
+    np.testing.assert_array_equal(first.fxi, second.fxi)
+    for i, fxi0 in enumerate((1.0, 1.3)):
+        row = run_simulation(_make_default_state(fxi0, fxi0 - 1.0), op, scenario, 20)
+        np.testing.assert_allclose(first.row(i).fxi_series, row.fxi_series, rtol=1e-12)
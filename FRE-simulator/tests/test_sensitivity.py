@@ -0,0 +1,107 @@
+# tests/test_sensitivity.py
+# Tests for the structural sensitivity diagnostics of FRE Simulator V2.0.
+
+import numpy as np
+import pytest
+
+from fre_simulator import (
+    VectorBlock,
+    MatrixOperator,
+    EmptyScenario,
+    run_vector_batch,
+    sensitivity_vector,
+    unit_direction,
+    operator_jacobian,
+    finite_difference_jacobian,
+    weighted_norm,
+)
+
+
+W = np.array([[2.0, 0.3, 0.0], [0.3, 1.0, 0.1], [0.0, 0.1, 0.5]])
+
+
+class TanhOperator:
+    """
+    Non-linear test operator without an analytic Jacobian:
+        E(Δ) = k ⋅ tanh(Δ)
+    """
+    dim = 3
+
+    def __init__(self, k: float):
+        self.k = k
+
+    def apply_vector(self, delta):
+        return self.k * np.tanh(delta)
+
+
+def test_sensitivity_is_gradient_of_weighted_norm():
+    """
+    S = WΔ/‖Δ‖_W matches the finite-difference gradient; ‖u‖_W = 1.
+    """
+    delta = np.array([[0.3, -0.2, 0.1], [0.05, 0.4, -0.3]])
+    S = sensitivity_vector(delta, W)
+
+    grad = finite_difference_jacobian(lambda d: np.repeat(weighted_norm(d, W)[:, None], 3, axis=1),
+                                      delta)[:, 0, :]
+    np.testing.assert_allclose(S, grad, rtol=1e-6)
+    np.testing.assert_allclose(weighted_norm(unit_direction(delta, W), W), 1.0)
+    assert not sensitivity_vector(np.zeros(3), W).any()
+
+
+def test_jacobian_analytic_and_finite_difference():
+    """
+    MatrixOperator: analytic J = K Q. Non-linear operator: batched central
+    differences match the exact Jacobian diag(k (1 − tanh²Δ)).
+    """
+    Q = np.roll(np.eye(3), 1, axis=0)
+    op = MatrixOperator([0.5, 0.4, 0.3], Q)
+    delta = np.array([[0.3, -0.2, 0.1], [0.05, 0.4, -0.3]])
+    np.testing.assert_allclose(operator_jacobian(op, delta), np.diag([0.5, 0.4, 0.3]) @ Q)
+    np.testing.assert_allclose(finite_difference_jacobian(op.apply_vector, delta),
+                               np.broadcast_to(op.matrix, (2, 3, 3)), atol=1e-8)
+
+    jac = operator_jacobian(TanhOperator(0.6), delta)
+    assert jac.shape == (2, 3, 3)
+    for b in range(2):
+        np.testing.assert_allclose(jac[b], np.diag(0.6 * (1.0 - np.tanh(delta[b]) ** 2)), atol=1e-8)
+
+
+@pytest.mark.parametrize("operator", [MatrixOperator(0.6, dim=3), TanhOperator(0.6)])
+def test_sensitivity_stage_in_vector_batch(operator):
+    """
+    The diagnostics stage leaves the trajectories unchanged and reports
+    per-step S(t), u(t) and the directional gain for every row.
+    """
+    x = np.array([[0.3, -0.2, 0.1], [0.05, 0.4, -0.3], [0.0, 0.0, 0.0]])
+    block = VectorBlock(x=x, weights=W)
+
+    plain = run_vector_batch(block, operator, EmptyScenario(), 8, record_vectors=True)
+    diag = run_vector_batch(block, operator, EmptyScenario(), 8, record_vectors=True,
+                            sensitivity=True)
+    np.testing.assert_array_equal(plain.fxi, diag.fxi)
+
+    sens = diag.sensitivity
+    assert sens.analytic == isinstance(operator, MatrixOperator)
+    assert sens.sensitivity.shape == (3, 9, 3)
+    np.testing.assert_allclose(sens.sensitivity[:2], sensitivity_vector(diag.delta_vec[:2], W))
+    np.testing.assert_allclose(sens.direction[:2], unit_direction(diag.delta_vec[:2], W))
+    assert np.isnan(sens.gain[:, 0]).all()
+    # contracting operators: gain below 1 where Δ ≠ 0, zero at equilibrium
+    assert (sens.gain[:2, 1:] < 1.0).all()
+    assert (sens.gain[2, 1:] == 0.0).all()
+    if isinstance(operator, MatrixOperator):
+        np.testing.assert_allclose(sens.gain[:2, 1:], 0.6)
+        assert sens.jacobian.shape == (3, 3)
+    else:
+        assert sens.jacobian.shape == (3, 3, 3)
+    assert sens.jacobians is None
+
+    # per-step history: J(t) at the pre-operator Δ⃗ of the step into t
+    full = run_vector_batch(block, operator, EmptyScenario(), 8, record_vectors=True,
+                            record_jacobians=True).sensitivity
+    assert full.jacobians.shape == (3, 9, 3, 3) and np.isnan(full.jacobians[:, 0]).all()
+    for t in range(1, 9):
+        np.testing.assert_allclose(full.jacobians[:, t],
+                                   np.broadcast_to(operator_jacobian(operator, diag.delta_vec[:, t - 1]),
+                                                   (3, 3, 3)), atol=1e-8)
+    np.testing.assert_allclose(full.gain, sens.gain)
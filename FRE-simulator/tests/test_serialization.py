@@ -0,0 +1,79 @@
+# tests/test_serialization.py
+# Tests for the FRE JSON output format.
+
+import asyncio
+import io
+import json
+
+import numpy as np
+
+from fre_simulator import (
+    initial_state,
+    DefaultOperator,
+    EmptyScenario,
+    SingleStepShockScenario,
+    run_simulation,
+    to_json,
+    from_json,
+    FREService,
+)
+from fre_simulator.service import DEFAULT_CONVERGENCE
+
+
+def _make_default_state():
+    return initial_state(delta=0.3, fxi=1.3, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+
+
+def test_document_matches_spec_and_service():
+    """
+    List and columnar results give the same document, which is what the
+    service answers for the same request.
+    """
+    S0 = initial_state(delta=0.255, fxi=1.1275, qp=1.255, qf=1.0, q=1.0, w=1.0, u=1.0)
+    config = {"convergence": DEFAULT_CONVERGENCE}
+    result = run_simulation(S0, DefaultOperator(alpha=0.4), EmptyScenario(), 40, config)
+    columnar = run_simulation(S0, DefaultOperator(alpha=0.4), EmptyScenario(), 40, config,
+                              columnar=True)
+
+    text = to_json(result, horizon=40, scenario="empty")
+    assert to_json(columnar, horizon=40, scenario="empty") == text
+    document = json.loads(text)
+    assert list(document) == ["fxi_series", "delta_series", "zones", "kappa_series", "meta"]
+    assert document["fxi_series"] == result.fxi_series
+    assert document["kappa_series"] == result.kappa_series
+    assert document["meta"]["converged"] and document["meta"]["version"] == "FRE-2.0"
+
+    async def ask():
+        return await FREService(workers=0).submit(
+            {"fxi": 1.1275, "delta": 0.255, "horizon": 40, "params": {"kappa": 0.4}})
+
+    assert asyncio.run(ask()) == document
+
+
+def test_streaming_precision_and_round_trip():
+    """
+    Streaming into text and binary files, rounding, and reading back
+    list and columnar results including breach metadata.
+    """
+    S0 = _make_default_state()
+    config = {"capacity_limits": {"fxi_min": 0.95, "fxi_max": 1.2}}
+    result = run_simulation(S0, DefaultOperator(alpha=0.9),
+                            SingleStepShockScenario(t0=5, fxi_shift=0.5), 30, config,
+                            columnar=True)
+    assert result.breach_occurred
+
+    text, binary = io.StringIO(), io.BytesIO()
+    assert result.to_json(text) is None
+    result.to_json(binary)
+    assert binary.getvalue().decode("utf-8") == text.getvalue()
+
+    back, meta = from_json(io.StringIO(text.getvalue()), columnar=True, with_meta=True)
+    np.testing.assert_array_equal(back.fxi, result.fxi)
+    np.testing.assert_array_equal(back.kappa, result.kappa)
+    assert back.stability_zones == result.stability_zones
+    assert (back.breach_step, back.breach_type) == (result.breach_step, result.breach_type)
+    assert meta["breach"] == {"step": result.breach_step, "type": result.breach_type}
+
+    rounded = from_json(to_json(result, precision=3))
+    assert rounded.fxi_series == [round(v, 3) for v in result.fxi_series]
+    assert rounded.kappa_series[0] is None
@@ -0,0 +1,179 @@
+# tests/test_service.py
+# Tests for the JSON-over-HTTP simulation service.
+
+import asyncio
+import json
+
+import pytest
+
+from fre_simulator import (
+    initial_state,
+    DefaultOperator,
+    load_scenario,
+    register_scenario,
+    run_simulation,
+    FREService,
+    ServiceError,
+)
+from fre_simulator.service import DEFAULT_CONVERGENCE
+
+
+def _request(**overrides):
+    request = {"fxi": 1.1275, "delta": 0.255, "horizon": 60, "scenario": "empty",
+               "params": {"kappa": 0.4}}
+    request.update(overrides)
+    return request
+
+
+def test_coalesced_batch_matches_scalar_engine():
+    """
+    Concurrent requests of one group run as a single batch and answer
+    exactly what run_simulation gives for each request.
+    """
+    register_scenario("service_shock", {"events": [{"t": 5, "shift": {"fxi": 0.3}}]})
+    kappas = [0.1 * k for k in range(10)]
+
+    async def scenario():
+        service = FREService(workers=0, batch_window=0.05)
+        responses = await asyncio.gather(*[
+            service.submit(_request(scenario="service_shock", params={"kappa": k}))
+            for k in kappas
+        ])
+        return service.metrics(), responses
+
+    metrics, responses = asyncio.run(scenario())
+    assert metrics["batches_total"] == 1
+    assert metrics["max_batch_size"] == len(kappas)
+    assert metrics["queue_depth"] == 0
+
+    for kappa, response in zip(kappas, responses):
+        S0 = initial_state(delta=0.255, fxi=1.1275, qp=1.255, qf=1.0, q=1.0, w=1.0, u=1.0)
+        expected = run_simulation(S0, DefaultOperator(alpha=kappa), load_scenario("service_shock"),
+                                  60, {"convergence": DEFAULT_CONVERGENCE})
+        assert response["fxi_series"] == expected.fxi_series
+        assert response["delta_series"] == expected.delta_series
+        assert response["zones"] == expected.stability_zones
+        assert response["kappa_series"] == expected.kappa_series
+        assert response["meta"]["converged"] == expected.converged
+        assert response["meta"]["converged_step"] == expected.converged_step
+        assert response["meta"]["scenario"] == "service_shock"
+        assert response["meta"]["version"] == "FRE-2.0"
+    assert responses[0]["meta"]["converged"]
+
+
+def test_canonical_errors_and_backpressure():
+    """
+    Invalid requests map to the documented error types; requests beyond
+    max_queue are rejected with 503.
+    """
+    async def scenario():
+        service = FREService(workers=0, max_queue=1, batch_window=0.05)
+        errors = []
+        for request in (_request(fxi="high"), _request(scenario="missing"),
+                        _request(params={"kappa": 1.5}), _request(version="FRE-1.0")):
+            with pytest.raises(ServiceError) as info:
+                await service.submit(request)
+            errors.append(info.value)
+
+        first = asyncio.ensure_future(service.submit(_request()))
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceError) as info:
+            await service.submit(_request())
+        await first
+        return errors, info.value, service.metrics()
+
+    errors, overload, metrics = asyncio.run(scenario())
+    assert [e.error_type for e in errors] == ["InvalidInput", "UnknownScenario",
+                                              "OperatorError", "InvalidInput"]
+    assert [e.status for e in errors] == [400, 404, 422, 400]
+    assert errors[1].to_json() == {"error": {"type": "UnknownScenario",
+                                             "message": "unknown scenario 'missing'",
+                                             "details": {"scenario": "missing"}}}
+    assert overload.status == 503 and overload.details["reason"] == "overloaded"
+    assert metrics["rejected_total"] == 1 and metrics["responses_total"] == 1
+
+
+def test_inadmissible_row_fails_only_its_request():
+    """
+    A request whose own row leaves the admissible domain gets InvalidInput;
+    a valid request coalesced with it is answered as if run alone.
+    """
+    shock = {"events": [{"t": 2, "shift": {"qp": -1.2}}]}
+
+    async def scenario(*deltas):
+        service = FREService(workers=0, batch_window=0.05)
+        results = await asyncio.gather(*[
+            service.submit(_request(fxi=1.0 + d, delta=d, horizon=5, scenario=shock))
+            for d in deltas
+        ], return_exceptions=True)
+        return service.metrics(), results
+
+    _, (alone,) = asyncio.run(scenario(0.5))
+    metrics, (bad, good) = asyncio.run(scenario(0.0, 0.5))
+    assert metrics["batches_total"] == 1 and metrics["errors_total"] == 1
+    assert isinstance(bad, ServiceError)
+    assert bad.error_type == "InvalidInput" and bad.status == 400
+    assert bad.details == {"field": "scenario"} and "qp must be positive" in bad.message
+    assert good == alone
+
+
+def test_http_round_trip():
+    """
+    POST /fre/v2/simulate over a keep-alive connection, then the metrics route.
+    """
+    async def call(reader, writer, method, path, body=b""):
+        writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\n"
+                     f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+        await writer.drain()
+        status = int((await reader.readline()).split()[1])
+        headers = {}
+        while (line := await reader.readline()) != b"\r\n":
+            name, _, value = line.decode().partition(":")
+            headers[name.lower()] = value.strip()
+        return status, json.loads(await reader.readexactly(int(headers["content-length"])))
+
+    async def scenario():
+        service = FREService(workers=0)
+        server = await service.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        ok = await call(reader, writer, "POST", "/fre/v2/simulate",
+                        json.dumps(_request(horizon=3)).encode())
+        bad = await call(reader, writer, "POST", "/fre/v2/simulate", b"{not json")
+        metrics = await call(reader, writer, "GET", "/fre/v2/metrics")
+        writer.close()
+        await service.close()
+        return ok, bad, metrics
+
+    ok, bad, metrics = asyncio.run(scenario())
+    assert ok[0] == 200
+    assert len(ok[1]["fxi_series"]) == 4 and ok[1]["kappa_series"][0] is None
+    assert bad == (400, {"error": {"type": "InvalidInput", "message": "body is not valid JSON",
+                                   "details": {}}})
+    assert metrics[0] == 200 and metrics[1]["requests_total"] == 2
+
+
+@pytest.mark.parametrize("length", ["abc", "-5"])
+def test_http_invalid_content_length(length):
+    """
+    A non-integer or negative Content-Length gets a canonical 400 and the
+    connection is closed.
+    """
+    async def scenario():
+        service = FREService(workers=0)
+        server = await service.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"POST /fre/v2/simulate HTTP/1.1\r\nHost: test\r\n"
+                     f"Content-Length: {length}\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        await service.close()
+        return response
+
+    head, _, body = asyncio.run(scenario()).partition(b"\r\n\r\n")
+    assert head.split()[1] == b"400" and b"Connection: close" in head
+    assert json.loads(body) == {"error": {"type": "InvalidInput",
+                                          "message": "invalid Content-Length",
+                                          "details": {"field": "content-length"}}}
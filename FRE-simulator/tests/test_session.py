@@ -0,0 +1,112 @@
+# tests/test_session.py
+# Tests for the online FRESession engine of FRE Simulator V2.0.
+
+import copy
+
+import pytest
+
+from fre_simulator import (
+    initial_state,
+    DefaultOperator,
+    DegradingOperator,
+    EmptyScenario,
+    FRESession,
+    run_simulation,
+)
+
+
+def _make_default_state(fxi: float = 1.0, delta: float = 0.0):
+    """
+    Helper: create an admissible initial structural state S0.
+    """
+    return initial_state(delta=delta, fxi=fxi, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+
+
+def test_session_matches_run_simulation():
+    """
+    Ticking a session without updates reproduces run_simulation.
+    Expectation: identical FXI, Δ, κ and zones; dwell times sum to t+1.
+    """
+    S0 = _make_default_state(fxi=1.25, delta=0.25)
+    op = DefaultOperator(alpha=0.6)
+    result = run_simulation(S0, op, EmptyScenario(), 30)
+
+    session = FRESession(S0, op, history=5)
+    records = [session.step() for _ in range(30)]
+
+    assert [r.fxi for r in records] == result.fxi_series[1:]
+    assert [r.delta for r in records] == result.delta_series[1:]
+    assert [r.kappa for r in records] == result.kappa_series[1:]
+    assert [r.zone for r in records] == result.stability_zones[1:]
+    assert session.state == result.final_state
+    assert S0.fxi == 1.25  # caller's state untouched
+
+    assert sum(session.zone_dwell.values()) == 31
+    assert session.zone_dwell["stable"] == result.stability_zones.count("stable")
+    assert session.kappa_count == 30
+    assert session.kappa_mean == pytest.approx(sum(result.kappa_series[1:]) / 30)
+    assert list(session.history) == records[-5:]
+
+
+def test_session_external_update_and_breach():
+    """
+    External updates are applied before Δ is recomputed; a breach
+    stops the session until reset().
+    """
+    S0 = _make_default_state()
+    session = FRESession(S0, DefaultOperator(alpha=0.5))
+
+    record = session.step({"qp": 1.2, "qf": 1.0})
+    assert record.t == 1
+    assert session.state.qp == 1.2
+
+    with pytest.raises(ValueError):
+        session.step({"fxi_typo": 1.0})
+
+    assert session.step({"qf": 0.0}) is None
+    assert session.breach_occurred
+    assert session.breach_type.startswith("delta-computation-error")
+    assert session.diagnostics()["breach_step"] == 2
+
+    with pytest.raises(RuntimeError):
+        session.step()
+
+    session.reset(S0)
+    assert session.t == 0 and not session.breach_occurred
+    assert session.step().t == 1
+
+
+def test_session_rejected_tick_keeps_state():
+    """
+    A tick with an unknown key or an inadmissible value is rejected
+    without changing the state or a stateful operator; the session keeps
+    running.
+    """
+    S0 = _make_default_state(fxi=1.2, delta=0.2)
+    session = FRESession(S0, DefaultOperator(alpha=0.5))
+    session.step({"qp": 1.1})
+    live = session.state
+    before = copy.copy(live)
+
+    with pytest.raises(ValueError):
+        session.step({"qp": 1.3, "fxi_typo": 1.0})
+    with pytest.raises(ValueError):
+        session.step({"qp": -5.0})
+    assert session.state is live and live == before and session.t == 1
+
+    record = session.step({"qp": 1.05})
+    assert record.t == 2 and session.state.qp == 1.05
+    assert record.fxi == pytest.approx(1.0 + 0.5 * (before.fxi - 1.0))
+
+    # a stateful operator keeps its per-run state across a rejected tick
+    degrading = DegradingOperator(kappa0=0.8, degrade=0.03)
+    session = FRESession(S0, degrading)
+    session.step({"qp": 1.1})
+    viability = degrading.viability
+    with pytest.raises(ValueError):
+        session.step({"qp": -1.0})
+    assert degrading.viability == viability
+
+    reference = FRESession(S0, DegradingOperator(kappa0=0.8, degrade=0.03))
+    reference.step({"qp": 1.1})
+    assert session.step({"qp": 1.05}) == reference.step({"qp": 1.05})
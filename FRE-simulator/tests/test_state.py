@@ -0,0 +1,91 @@
+# tests/test_state.py
+# Tests for the compact and array-backed state layouts of FRE Simulator V2.0.
+
+import copy
+
+import numpy as np
+import pytest
+
+from fre_simulator import (
+    initial_state,
+    CompactState,
+    StateBlock,
+    StateRow,
+    DefaultOperator,
+    SingleStepShockScenario,
+    run_simulation,
+)
+
+
+def _make_default_state(fxi: float = 1.0, delta: float = 0.0):
+    """
+    Helper: create an admissible initial structural state S0.
+    """
+    return initial_state(delta=delta, fxi=fxi, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+
+
+def test_compact_state_is_slotted_and_equivalent():
+    """
+    CompactState has no __dict__ and evolves exactly like State.
+    """
+    S0 = _make_default_state(fxi=1.2, delta=0.2)
+    C0 = CompactState.from_state(S0)
+    assert not hasattr(C0, "__dict__")
+
+    op = DefaultOperator(alpha=0.5)
+    scenario = SingleStepShockScenario(t0=3, qp_shift=0.1)
+    ref = run_simulation(S0, op, scenario, 12)
+    res = run_simulation(C0, op, scenario, 12)
+
+    assert res.fxi_series == ref.fxi_series
+    assert res.stability_zones == ref.stability_zones
+    assert isinstance(res.final_state, CompactState)
+    assert C0.fxi == 1.2  # caller's state untouched
+
+    with pytest.raises(ValueError):
+        CompactState(0.0, 1.0, -1.0, 1.0, 1.0, 1.0, 1.0).validate()
+
+
+def test_state_row_views_write_through():
+    """
+    StateRow reads and writes the block columns in place;
+    copying a row detaches it as a CompactState.
+    """
+    block = StateBlock.from_states([_make_default_state(fxi=f, delta=f - 1.0)
+                                    for f in (1.1, 1.3, 0.9)])
+    row = block.row(1)
+    assert isinstance(row, StateRow)
+    assert row.fxi == 1.3
+
+    row.update_from_operator(1.05)
+    assert block.fxi[1] == 1.05
+    assert block.delta[1] == pytest.approx(0.05)
+
+    snapshot = copy.copy(row)
+    row.fxi = 1.0
+    assert isinstance(snapshot, CompactState) and snapshot.fxi == 1.05
+
+    block.qf[2] = 0.0
+    with pytest.raises(ZeroDivisionError):
+        block.row(-1).compute_delta()
+    with pytest.raises(IndexError):
+        block.row(3)
+
+
+def test_engine_accepts_state_rows():
+    """
+    run_simulation on a row view matches the equivalent State
+    and leaves the block unchanged.
+    """
+    fxi = np.array([1.1, 1.4])
+    block = StateBlock(delta=fxi - 1.0, fxi=fxi, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+    op = DefaultOperator(alpha=0.6)
+    scenario = SingleStepShockScenario(t0=2, qp_shift=0.2)
+
+    for i, row in enumerate(block.rows()):
+        res = run_simulation(row, op, scenario, 8, record="scalars-only", closed_form=True)
+        ref = run_simulation(_make_default_state(fxi=fxi[i], delta=fxi[i] - 1.0), op, scenario, 8,
+                             record="scalars-only", closed_form=True)
+        assert res.fxi_series == ref.fxi_series
+
+    assert block.fxi.tolist() == fxi.tolist()
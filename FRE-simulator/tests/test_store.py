@@ -0,0 +1,77 @@
+# tests/test_store.py
+# Tests for memory-mapped trajectory storage of batch runs.
+
+import numpy as np
+import pytest
+
+from fre_simulator import (
+    StateBlock,
+    DefaultOperator,
+    SingleStepShockScenario,
+    run_simulation_batch,
+    TrajectoryStore,
+    open_trajectories,
+    write_records,
+    read_records,
+)
+
+
+def _block(n=50):
+    fxi = np.linspace(0.8, 1.6, n)
+    return StateBlock(delta=fxi - 1.0, fxi=fxi, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+
+
+def test_storage_matches_in_memory_run(tmp_path):
+    """
+    A run into a memory-mapped store (chunks smaller than the horizon,
+    rows breaching at different steps) equals the in-memory run and can
+    be reopened read-only.
+    """
+    config = {"capacity_limits": {"fxi_min": 0.5, "fxi_max": 1.45}}
+    scenario = SingleStepShockScenario(t0=7, fxi_shift=0.3)
+    expected = run_simulation_batch(_block(), DefaultOperator(alpha=0.9), scenario, 30, config)
+
+    path = tmp_path / "run.fret"
+    stored = run_simulation_batch(_block(), DefaultOperator(alpha=0.9), scenario, 30, config,
+                                  storage=path, chunk_steps=4)
+    assert isinstance(stored.fxi, np.memmap)
+
+    reopened = open_trajectories(path)
+    for result in (stored, reopened):
+        assert result.fxi.shape == expected.fxi.shape
+        np.testing.assert_array_equal(result.fxi, expected.fxi)
+        np.testing.assert_array_equal(result.delta, expected.delta)
+        np.testing.assert_array_equal(result.kappa, expected.kappa)
+        np.testing.assert_array_equal(result.zone_codes, expected.zone_codes)
+        np.testing.assert_array_equal(result.lengths, expected.lengths)
+        np.testing.assert_array_equal(result.breach_code, expected.breach_code)
+    assert expected.breach_occurred.any() and not expected.breach_occurred.all()
+    assert not reopened.fxi.flags.writeable
+
+
+def test_store_consumers_and_layout(tmp_path):
+    """
+    Zone statistics and record export read the memory maps; incomplete
+    or foreign files are rejected.
+    """
+    path = tmp_path / "run.fret"
+    stored = run_simulation_batch(_block(), DefaultOperator(alpha=0.7),
+                                  SingleStepShockScenario(t0=3), 25, storage=path, chunk_steps=8)
+    counts = stored.zone_counts(chunk_steps=5)
+    assert counts.shape == (26, 3)
+    assert (counts.sum(axis=1) == (np.arange(26) < stored.lengths[:, None]).sum(axis=0)).all()
+    assert counts[0].tolist() == [np.count_nonzero(stored.zone_codes[:, 0] == z) for z in range(3)]
+
+    out = str(tmp_path / "records.npz")
+    assert write_records(stored, out, chunk_rows=100) == int(stored.lengths.sum())
+    np.testing.assert_array_equal(read_records(out).run(49).FXI_global, stored.fxi[49])
+
+    store = TrajectoryStore.open(path)
+    assert store.complete and store.width == 26 and store.fxi.shape == (26, 50)
+
+    TrajectoryStore.create(tmp_path / "partial.fret", rows=5, steps=10)
+    with pytest.raises(ValueError):
+        open_trajectories(tmp_path / "partial.fret")
+    (tmp_path / "foreign.fret").write_bytes(b"not a store")
+    with pytest.raises(ValueError):
+        TrajectoryStore.open(tmp_path / "foreign.fret")
@@ -0,0 +1,77 @@
+# tests/test_sweep.py
+# Parameter-sweep tests: grid metrics vs. individual run_simulation calls.
+
+import numpy as np
+import pytest
+
+from fre_simulator import (
+    initial_state,
+    DefaultOperator,
+    SingleStepShockScenario,
+    run_simulation,
+    run_sweep,
+)
+
+
+def _make_default_state():
+    return initial_state(delta=0.0, fxi=1.0, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+
+
+CONFIG = {"capacity_limits": {"fxi_min": 0.5, "fxi_max": 1.8}}
+AXES = {"alpha": [0.3, 0.7, 0.95], "shock_size": [-0.4, 0.1, 0.9], "shock_time": [2, 9]}
+
+
+def _reference_metrics(alpha, shock_size, shock_time, horizon):
+    """Metrics of one grid point from a plain run_simulation."""
+    result = run_simulation(_make_default_state(), DefaultOperator(alpha=alpha),
+                            SingleStepShockScenario(t0=shock_time, fxi_shift=shock_size),
+                            horizon, CONFIG)
+    fxi = np.array(result.fxi_series)
+    kappa = result.kappa_series[1:]
+    zones = result.stability_zones
+    settle = next(t for t in range(len(zones) + 1)
+                  if all(z == "stable" for z in zones[t:]))
+    settle = max(settle, shock_time)
+    stable = np.nan if result.breach_occurred or settle >= len(zones) else settle - shock_time
+    return {
+        "breach_step": result.breach_step if result.breach_occurred else -1,
+        "max_deviation": np.max(np.abs(fxi - 1.0)),
+        "time_to_stable": stable,
+        "mean_kappa": np.mean(kappa) if kappa else np.nan,
+    }
+
+
+def test_sweep_matches_individual_runs():
+    """
+    Every grid point equals the metrics of its own run_simulation call,
+    across chunk boundaries.
+    """
+    sweep = run_sweep(_make_default_state(), AXES, horizon=40, config=CONFIG, chunk_size=5)
+
+    assert sweep.dims == ("alpha", "shock_size", "shock_time")
+    assert sweep.shape == (3, 3, 2)
+    assert sweep.breach_occurred.any() and not sweep.breach_occurred.all()
+    for i, alpha in enumerate(AXES["alpha"]):
+        for j, size in enumerate(AXES["shock_size"]):
+            for k, t0 in enumerate(AXES["shock_time"]):
+                ref = _reference_metrics(alpha, size, t0, 40)
+                assert sweep.breach_step[i, j, k] == ref["breach_step"]
+                for metric in ("max_deviation", "time_to_stable", "mean_kappa"):
+                    np.testing.assert_allclose(getattr(sweep, metric)[i, j, k], ref[metric])
+
+
+def test_sweep_parallel_and_selection():
+    """
+    Worker processes give the same cube; sel() indexes by coordinate value.
+    """
+    serial = run_sweep(_make_default_state(), AXES, horizon=30, config=CONFIG, chunk_size=4)
+    parallel = run_sweep(_make_default_state(), AXES, horizon=30, config=CONFIG,
+                         chunk_size=4, workers=2)
+    for metric in serial.metrics:
+        np.testing.assert_array_equal(getattr(serial, metric), getattr(parallel, metric))
+
+    cut = serial.sel(alpha=0.7, shock_time=9)
+    np.testing.assert_array_equal(cut["max_deviation"], serial.max_deviation[1, :, 1])
+
+    with pytest.raises(ValueError):
+        run_sweep(_make_default_state(), {"beta": [1.0]}, horizon=10)
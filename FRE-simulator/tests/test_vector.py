@@ -0,0 +1,135 @@
+# tests/test_vector.py
+# Tests for the vector deviation state and matrix-operator batch engine.
+
+import copy
+
+import numpy as np
+import pytest
+
+from fre_simulator import (
+    VectorState,
+    VectorBlock,
+    MatrixOperator,
+    DefaultOperator,
+    EmptyScenario,
+    VectorShockScenario,
+    weighted_norm,
+    run_simulation,
+    run_vector_batch,
+)
+
+
+# cyclic permutation of 5 axes (orthogonal mixing matrix)
+Q5 = np.roll(np.eye(5), 1, axis=0)
+
+
+def test_weighted_norm_single_and_batch():
+    """
+    ‖Δ‖_W = sqrt(Δᵀ W Δ) for one vector and row-wise for a batch.
+    """
+    W = np.array([[2.0, 0.5], [0.5, 1.0]])
+    d = np.array([0.3, -0.4])
+    assert weighted_norm(d) == pytest.approx(0.5)
+    assert weighted_norm(d, W) == pytest.approx(np.sqrt(d @ W @ d))
+
+    batch = np.array([[0.3, -0.4], [0.0, 0.0], [1.0, 2.0]])
+    expected = np.sqrt(np.einsum("bi,ij,bj->b", batch, W, batch))
+    np.testing.assert_allclose(weighted_norm(batch, W), expected)
+
+
+def test_vector_state_rejects_invalid_weights():
+    with pytest.raises(ValueError):
+        VectorState([1.0, 1.0], weights=np.ones((3, 3)))
+    with pytest.raises(ValueError):
+        VectorState([1.0, 1.0], weights=[[1.0, 2.0], [0.0, 1.0]])   # not symmetric
+    with pytest.raises(ValueError):
+        VectorState([1.0, 1.0], weights=[[1.0, 2.0], [2.0, 1.0]])   # indefinite
+
+
+def test_vector_state_in_scalar_engine():
+    """
+    With a scalar operator, Δ⃗ is contracted by k = α and mixed by Q,
+    and FXI − 1 decays geometrically.
+    """
+    d0 = np.array([0.10, -0.10, 0.05, 0.20, -0.05])
+    S0 = VectorState(1.0 + d0, np.ones(5), fxi_scale=0.5, mixing=Q5)
+    result = run_simulation(S0, DefaultOperator(alpha=0.4), EmptyScenario(), 10)
+
+    dev = np.array(result.fxi_series) - 1.0
+    np.testing.assert_allclose(dev, dev[0] * 0.4 ** np.arange(11))
+    # snapshots own their arrays
+    final = result.state_series[-1]
+    np.testing.assert_allclose(final.delta_vec, 0.4 ** 10 * np.linalg.matrix_power(Q5, 10) @ d0)
+    assert not np.shares_memory(result.state_series[0].x, final.x)
+    assert copy.copy(final) == final
+
+
+def test_vector_state_non_norm_preserving_mixing():
+    """
+    A mixing Q that does not preserve ‖·‖_W only sets the direction: the
+    stored FXI is the operator's FXI(t+1), so FXI − 1 still decays by α.
+    """
+    W = np.diag([2.0, 1.0, 0.5])
+    Q = np.array([[1.5, 0.2, 0.0], [0.0, 0.3, 0.4], [0.1, 0.0, 2.0]])
+    S0 = VectorState([1.1, 0.95, 1.02], np.ones(3), weights=W, fxi_scale=0.5, mixing=Q)
+    result = run_simulation(S0, DefaultOperator(alpha=0.6), EmptyScenario(), 8)
+
+    dev = np.array(result.fxi_series) - 1.0
+    np.testing.assert_allclose(dev, dev[0] * 0.6 ** np.arange(9))
+    final = result.final_state
+    direction = np.linalg.matrix_power(Q, 8) @ S0.delta_vec
+    np.testing.assert_allclose(final.delta_vec, direction * final.delta / weighted_norm(direction, W))
+
+
+def test_vector_batch_matches_scalar_engine():
+    """
+    MatrixOperator(K=α, Q) on a batch equals VectorState(mixing=Q)
+    under DefaultOperator(α), row by row (W = I, Q orthogonal).
+    """
+    rng = np.random.default_rng(0)
+    x = 1.0 + rng.uniform(-0.1, 0.1, size=(6, 5))
+    states = [VectorState(row, np.ones(5), mixing=Q5) for row in x]
+    block = VectorBlock.from_states(states)
+    shock = VectorShockScenario(t0=3, shift=[0.05, 0.0, -0.02, 0.0, 0.01])
+
+    batch = run_vector_batch(block, MatrixOperator(0.7, Q5), shock, 12, record_vectors=True)
+
+    assert batch.delta_vec.shape == (6, 13, 5)
+    for i, S0 in enumerate(states):
+        scalar = run_simulation(S0, DefaultOperator(alpha=0.7), shock, 12)
+        row = batch.row(i)
+        np.testing.assert_allclose(row.fxi_series, scalar.fxi_series, rtol=1e-12)
+        np.testing.assert_allclose(row.delta_series, scalar.delta_series, rtol=1e-12, atol=1e-15)
+        assert row.stability_zones == scalar.stability_zones
+        np.testing.assert_allclose(batch.final_delta[i], scalar.final_state.delta_vec, atol=1e-15)
+
+
+def test_matrix_operator_forms_and_affine_offset():
+    """
+    K as scalar, diagonal or matrix; E(Δ) = K Q Δ + b on (d,) and (B, d).
+    """
+    K = np.array([0.5, 0.25, 0.1])
+    Q = np.roll(np.eye(3), 1, axis=0)
+    b = np.array([0.01, 0.0, -0.01])
+    op = MatrixOperator(K, Q, b)
+    delta = np.array([[1.0, 2.0, 3.0], [0.0, -1.0, 0.5]])
+
+    np.testing.assert_allclose(op.apply_vector(delta[0]), np.diag(K) @ Q @ delta[0] + b)
+    np.testing.assert_allclose(op.apply_vector(delta), delta @ (np.diag(K) @ Q).T + b)
+    np.testing.assert_allclose(MatrixOperator(0.5, dim=3).matrix, 0.5 * np.eye(3))
+    with pytest.raises(ValueError):
+        MatrixOperator(0.5)
+
+
+def test_vector_batch_capacity_breach():
+    """
+    An expanding operator breaches the FXI capacity; the step is not stored.
+    """
+    block = VectorBlock(x=[[0.5, 0.0], [0.01, 0.0]])
+    result = run_vector_batch(block, MatrixOperator(2.0, dim=2), EmptyScenario(), 10)
+
+    assert result.breach_types[result.breach_code[0]] == "fxi-capacity-breach"
+    assert result.breach_step[0] == 4          # FXI would reach 1 + 8 > 5
+    assert result.lengths[0] == 4
+    assert result.breach_occurred[1]           # second row breaches later
+    assert result.breach_step[1] > result.breach_step[0]
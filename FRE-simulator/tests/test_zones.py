@@ -0,0 +1,73 @@
+# tests/test_zones.py
+# Tests for the stability zone classifier of FRE Simulator V2.0.
+
+import numpy as np
+import pytest
+
+from fre_simulator import (
+    initial_state,
+    DefaultOperator,
+    EmptyScenario,
+    StateBlock,
+    ZoneClassifier,
+    run_simulation,
+    run_simulation_batch,
+)
+
+
+def test_default_zones_and_boundaries():
+    """
+    Default classifier reproduces the FRE 2.0 zones; bounds are inclusive.
+    """
+    zones = ZoneClassifier()
+    assert zones.zone_names == ("stable", "stressed", "critical")
+    assert zones.classify(1.0) == "stable"
+    assert zones.classify(1.015) == "stable"
+    assert zones.classify(0.95) == "stressed"
+    assert zones.classify(1.25) == "critical"
+    assert zones.classify(float("nan")) == "critical"
+
+
+def test_scalar_and_array_paths_agree():
+    """
+    classify_array matches code() element-wise, including the
+    compressed zone and a custom ordered list of zones.
+    Expectation: identical int8 codes.
+    """
+    fxi = np.concatenate([np.linspace(0.5, 1.5, 2001), [np.nan, 1.0 - 0.05, 1.0 + 0.05]])
+    for zones in (
+        ZoneClassifier(),
+        ZoneClassifier(compressed=0.05),
+        ZoneClassifier(("calm", "watch", "stressed", "critical"), (0.01, 0.03, 0.2), 0.1),
+    ):
+        codes = zones.classify_array(fxi)
+        assert codes.dtype == np.int8
+        assert codes.tolist() == [zones.code(x) for x in fxi.tolist()]
+
+
+def test_compressed_zone_and_config():
+    """
+    "compressed" (FXI < 1 − c) is emitted by the engines when configured.
+    """
+    zones = ZoneClassifier(compressed=0.05)
+    assert zones.zone_names[-1] == "compressed"
+    assert zones.classify(0.90) == "compressed"
+    assert zones.classify(1.08) == "stressed"
+
+    config = {"zone_thresholds": {"compressed": 0.05}}
+    S0 = initial_state(delta=-0.3, fxi=0.7, qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+    result = run_simulation(S0, DefaultOperator(alpha=0.5), EmptyScenario(), 6, config)
+    assert result.stability_zones[:3] == ["compressed", "compressed", "compressed"]
+    assert result.stability_zones[-1] == "stable"
+
+    block = StateBlock(delta=-0.3, fxi=np.array([0.7]), qp=1.0, qf=1.0, q=1.0, w=1.0, u=1.0)
+    batch = run_simulation_batch(block, DefaultOperator(alpha=0.5), EmptyScenario(), 6,
+                                 {"zones": zones})
+    assert batch.row(0).stability_zones == result.stability_zones
+
+
+def test_invalid_bounds_rejected():
+    with pytest.raises(ValueError):
+        ZoneClassifier(("a", "b"), (0.1, 0.2))
+    with pytest.raises(ValueError):
+        ZoneClassifier(("a", "b", "c"), (0.2, 0.1))